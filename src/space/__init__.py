@@ -10,17 +10,20 @@ import logging
 log = logging.getLogger(__name__)
 #
 from .assets import Asset
+from .caches import CachingAsset
 #
-from .constants import SUCCESSFUL, FAILED, MixedFlagValue, MixedArgumentValue, MixedParameterValue, NullableMixedParameterValue, isSupportedParameterType, getParameterFunction
+from .constants import SUCCESSFUL, FAILED, MixedFlagValue, MixedArgumentValue, MixedParameterValue, NullableMixedParameterValue, isSupportedParameterType, getParameterFunction, convertMany
 #
 from .errors import SpacePythonException
 from .errors import IllegalAssetError
+from .errors import IllegalRestrictionError
 from .errors import IllegalValueError
 from .errors import QueryCanceledError
 from .errors import QueryAbortedError
 from .errors import TimeoutError
 from .errors import TransmissionError
 from .errors import UndefinedTypeError
+from .errors import UnknownCommandError
 from .errors import UnknownParameterError
 from .errors import VerificationError
 from .errors import VerifyError
@@ -29,8 +32,17 @@ from .commands import Command
 #
 from .gems import GemsDevice
 from .links import Link
+from .correlations import ClockCorrelation, LeapSecondTable, convertTimeScale, convertTimeScaleMany, setClockCorrelation
+from .histories import ParameterHistory
+from .indexes import NameIndex
+from .journals import Journal, setJournal
 from .parameters import Parameter, Restriction
+from .registries import AssetRegistry, assetRegistry
+from .validators import FusedValidator, compileRestrictions
 from .space_pythons import SpacePython, spacePython
+from .subscriptions import Subscription, SubscriptionDispatcher
+from .tables import ParameterTable
+from .updates import UpdateCoalescer, updateCoalescer
 from .space_queries import SpaceQuery, spaceQuery, operatorQuery
 from .procedures import Procedure
 from .procedure_engines import ProcedureEngine
@@ -41,6 +53,10 @@ from .system import verify
 #
 from .times import SpecificTime
 from .times import TimeInterval
+from .times import Clock, MonotonicClock, setClock, nowNanos
+from .times import setWaitScheduler, notifyWaiters
+from .schedulers import WaitScheduler, TimeTag, TimeTagScheduler, timeTagScheduler
 from .times import wait
 from .times import waitFor
+from .times import waitForStatus, WaitStatus
 from .times import waitUntil
@@ -0,0 +1,231 @@
+'''
+Coroutine versions of the SpacePython wait, verify and operator query
+functions, so that many procedures can run on a single asyncio event loop
+instead of one thread each.  Blocking implementations, such as an Asset
+that only provides send(), are run in an executor through runSync().
+
+waitFor, waitForStatus and verify take the line of the procedure when they
+are called and return the coroutine to await, so the line they report is
+right even when the coroutine is run through gather() or create_task().
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import asyncio
+import concurrent.futures
+import datetime
+import functools
+import inspect
+import time
+from types import FrameType
+from typing import Any, Awaitable, Callable, Coroutine, TypeVar
+from .constants import MixedParameterValue
+from .errors import VerifyError
+from .space_queries import operatorQuery as _operatorQuery
+from .journals import journalStep
+from .times import SpecificTime, WaitStatus, _callerFrame, _nextPollPeriod, _waitOutcome
+
+T = TypeVar('T')
+
+_executor:concurrent.futures.Executor | None = None
+
+def setExecutor(executor:concurrent.futures.Executor | None) -> concurrent.futures.Executor | None:
+    '''Sets the executor used by runSync, returning the previous one.  With
+    None, the default executor of the event loop is used.
+
+    :param executor: Executor for blocking calls
+    :type executor: concurrent.futures.Executor | None
+    '''
+    global _executor
+    previous = _executor
+    _executor = executor
+    return previous
+
+async def runSync(function:Callable[..., T], *args:Any, **kwds:Any) -> T:
+    '''Runs a blocking function in the executor and waits for its result
+    without blocking the event loop.
+
+    :param function: Blocking function
+    :type function: Callable[..., T]
+    :param args: Positional arguments of the function
+    :type args: Any
+    :param kwds: Keyword arguments of the function
+    :type kwds: Any
+    '''
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(function, *args, **kwds))
+
+async def wait(seconds:float) -> None:
+    '''Wait for the specified number of seconds
+
+    :param seconds: Number of seconds to wait
+    :type seconds: float
+    '''
+    await asyncio.sleep(seconds)
+
+async def waitUntil(specificTime:datetime.datetime) -> None:
+    '''Wait for a SpecificTime - returns immediately if time is in the past
+
+    :param specificTime: Time reference to wait until
+    :type specificTime: SpecificTime
+    '''
+    # use same timezone for now as the provided datetime
+    now = SpecificTime.now(specificTime.tzinfo)
+    delta = (specificTime - now).total_seconds()
+    if delta > 0:
+        await asyncio.sleep(delta)
+
+async def _evaluate(boolean:Callable[[], bool | Awaitable[bool]]) -> bool:
+    '''Calls the condition, awaiting its result if it is awaitable
+
+    :param boolean: Verifier function or coroutine function
+    :type boolean: Callable[[], bool | Awaitable[bool]]
+    '''
+    result = boolean()
+    if inspect.isawaitable(result):
+        result = await result
+    return result is True
+
+async def _waitFor(boolean:Callable[[], bool | Awaitable[bool]], timeout:float, pollPeriod:float,
+                   backoff:float, maxPollPeriod:float | None) -> WaitStatus:
+    '''Waits for the condition until a time.monotonic() deadline, in the
+    same way as space.times.waitFor
+
+    :param boolean: Verifier function or coroutine function
+    :type boolean: Callable[[], bool | Awaitable[bool]]
+    :param timeout: Timeout for the verifier in seconds
+    :type timeout: float
+    :param pollPeriod: Initial polling interval in seconds
+    :type pollPeriod: float
+    :param backoff: Factor applied to the polling interval after each poll
+    :type backoff: float
+    :param maxPollPeriod: Largest polling interval in seconds (optional)
+    :type maxPollPeriod: float | None
+    '''
+    start = time.monotonic()
+    deadline = start + timeout
+    polls = 1
+    while not await _evaluate(boolean):
+        now = time.monotonic()
+        if now >= deadline:
+            return WaitStatus(False, now - start, polls)
+        await asyncio.sleep(min(pollPeriod, deadline - now))
+        polls += 1
+        pollPeriod = _nextPollPeriod(pollPeriod, backoff, maxPollPeriod)
+    return WaitStatus(True, time.monotonic() - start, polls)
+
+async def _waitOutcomeAsync(boolean:Callable[[], bool | Awaitable[bool]], timeout:float, pollPeriod:float,
+                            backoff:float, maxPollPeriod:float | None, frame:FrameType | None, line:int) -> WaitStatus:
+    '''Waits for the condition, then journals the outcome and raises
+    TimeoutError if the condition did not become true
+
+    :param boolean: Verifier function or coroutine function
+    :type boolean: Callable[[], bool | Awaitable[bool]]
+    :param timeout: Timeout for the verifier in seconds
+    :type timeout: float
+    :param pollPeriod: Initial polling interval in seconds
+    :type pollPeriod: float
+    :param backoff: Factor applied to the polling interval after each poll
+    :type backoff: float
+    :param maxPollPeriod: Largest polling interval in seconds (optional)
+    :type maxPollPeriod: float | None
+    :param frame: Frame of the procedure that waited
+    :type frame: FrameType | None
+    :param line: Line of the wait call
+    :type line: int
+    '''
+    return _waitOutcome(await _waitFor(boolean, timeout, pollPeriod, backoff, maxPollPeriod), timeout, frame, line)
+
+async def _waitForTrue(wait:Awaitable[WaitStatus]) -> bool:
+    '''Awaits a wait and returns True
+
+    :param wait: Wait that raises TimeoutError if its condition is not met
+    :type wait: Awaitable[WaitStatus]
+    '''
+    await wait
+    return True
+
+def waitFor(boolean:Callable[[], bool | Awaitable[bool]], timeout:float=5, pollPeriod:float=0.1,
+            backoff:float=1.0, maxPollPeriod:float | None=None) -> Coroutine[Any, Any, bool]:
+    '''Wait for the provided Boolean function to become true.  The function
+    may also be a coroutine function.  Default timeout of 5 seconds and
+    default polling interval of 100 milliseconds is used unless overridden
+    in the call.
+
+    :param boolean: Verifier function
+    :type boolean: Callable[[], bool | Awaitable[bool]]
+    :param timeout: Timeout for the verifier in seconds
+    :type timeout: float
+    :param pollPeriod: Frequency of polling in seconds
+    :type pollPeriod: float
+    :param backoff: Factor applied to the polling interval after each poll
+    :type backoff: float
+    :param maxPollPeriod: Largest polling interval in seconds (optional)
+    :type maxPollPeriod: float | None
+    '''
+    frame = _callerFrame()
+    return _waitForTrue(_waitOutcomeAsync(boolean, timeout, pollPeriod, backoff, maxPollPeriod,
+                                          frame, frame.f_lineno if frame is not None else 0))
+
+def waitForStatus(boolean:Callable[[], bool | Awaitable[bool]], timeout:float=5, pollPeriod:float=0.1,
+                  backoff:float=1.0, maxPollPeriod:float | None=None) -> Coroutine[Any, Any, WaitStatus]:
+    '''Same as waitFor, but returns a WaitStatus with the seconds waited
+    and the number of polls once the Boolean function is true.
+
+    :param boolean: Verifier function
+    :type boolean: Callable[[], bool | Awaitable[bool]]
+    :param timeout: Timeout for the verifier in seconds
+    :type timeout: float
+    :param pollPeriod: Frequency of polling in seconds
+    :type pollPeriod: float
+    :param backoff: Factor applied to the polling interval after each poll
+    :type backoff: float
+    :param maxPollPeriod: Largest polling interval in seconds (optional)
+    :type maxPollPeriod: float | None
+    '''
+    frame = _callerFrame()
+    return _waitOutcomeAsync(boolean, timeout, pollPeriod, backoff, maxPollPeriod,
+                             frame, frame.f_lineno if frame is not None else 0)
+
+async def _verify(boolean:bool | Awaitable[bool], values:dict[str, Any], frame:FrameType | None, line:int) -> bool:
+    '''Awaits the verification value, journals it and raises VerifyError if
+    it is False
+
+    :param boolean: Verification value
+    :type boolean: bool | Awaitable[bool]
+    :param values: Values involved in the verification
+    :type values: dict[str, Any]
+    :param frame: Frame of the procedure that verified
+    :type frame: FrameType | None
+    :param line: Line of the verify call
+    :type line: int
+    '''
+    if inspect.isawaitable(boolean):
+        boolean = await boolean
+    journalStep('verify', bool(boolean), frame, line, **({'values': values} if values else {}))
+    if not boolean:
+        raise VerifyError('Verify at line %d is False' % line)
+    return True
+
+def verify(boolean:bool | Awaitable[bool], **values:Any) -> Coroutine[Any, Any, bool]:
+    '''Returns True if boolean value is True.  A False raises VerifyError,
+    which must be caught by the procedure if it is to continue.  The value
+    may also be awaitable.  Keyword values are recorded in the journal.
+
+    :param boolean: Verification value
+    :type boolean: bool | Awaitable[bool]
+    :param values: Values involved in the verification
+    :type values: Any
+    '''
+    frame = _callerFrame()
+    return _verify(boolean, values, frame, frame.f_lineno if frame is not None else 0)
+
+async def operatorQuery(prompt:str='', **parameters:Any) -> dict[str, MixedParameterValue]:
+    '''Prompts the operator through the default SpaceQuery implementation
+    without blocking the event loop.  See space.operatorQuery.
+
+    :param prompt: Prompt for the interaction
+    :type prompt: str
+    :param parameters: Keywords representing each input as part of this prompt interaction
+    :type parameters: Any
+    '''
+    return await runSync(_operatorQuery, prompt, **parameters)
@@ -0,0 +1,23 @@
+'''
+Optional NumPy support for the bulk (array) interfaces of SpacePython.
+NumPy is not required by the normative interfaces; the bulk functions
+raise ImportError when it is not installed.
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+from typing import Any
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional dependency
+    np = None  # type: ignore[assignment]
+
+def requireNumpy(feature:str) -> Any:
+    '''Returns the numpy module or raises ImportError naming the feature
+    that needs it.
+
+    :param feature: Name of the bulk feature being used
+    :type feature: str
+    '''
+    if np is None:
+        raise ImportError('NumPy is required for {0}'.format(feature))
+    return np
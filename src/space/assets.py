@@ -4,10 +4,13 @@ Asset represents space and ground assets within the control system.
 __author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm), Brad Kizzort'
 __copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable, Sequence
 from .parameters import Parameter
 from .commands import Command
-from .constants import MixedFlagValue
+from .constants import MixedFlagValue, MixedParameterValue
+from .errors import UnknownCommandError, UnknownParameterError
+from .subscriptions import Subscription
+from .aio import runSync
 
 class Asset(ABC):  #Normative
     '''
@@ -15,18 +18,54 @@ class Asset(ABC):  #Normative
     '''
 
     @abstractmethod
-    def lookupParameter(self, parameterName:str) -> Parameter | None:
-        '''Lookup a parameter associated with this Asset
+    def lookupParameter(self, parameterName:str, historySize:int=0) -> Parameter | None:
+        '''Lookup a parameter associated with this Asset.  If historySize is 
+        provided, the Parameter retains at least that many recent samples, 
+        available from Parameter.history().
         
         :param self: Self reference
         :type self:  
         :param parameterName: Parameter name
         :type parameterName: str 
+        :param historySize: Number of samples to retain (optional)
+        :type historySize: int 
         '''
         pass
 
+    def lookupParameters(self, parameterNames:Sequence[str], historySize:int=0) -> dict[str, Parameter]:
+        '''Lookup several parameters of this Asset in one call, returning a 
+        dictionary of parameter name to Parameter.  If any names are not 
+        defined, UnknownParameterError lists all of them.  The default 
+        implementation calls lookupParameter for each name, passing 
+        historySize only when it is given so that implementations of the 
+        one argument lookupParameter work unchanged; implementations backed 
+        by a remote system override this to resolve the names in one 
+        request.
+        
+        :param self: Self reference
+        :type self:  
+        :param parameterNames: Parameter names
+        :type parameterNames: Sequence[str]
+        :param historySize: Number of samples to retain (optional)
+        :type historySize: int 
+        '''
+        parameters:dict[str, Parameter] = dict()
+        unknown:list[str] = list()
+        for name in parameterNames:
+            if historySize:
+                parameter = self.lookupParameter(name, historySize)
+            else:
+                parameter = self.lookupParameter(name)
+            if parameter is None:
+                unknown.append(name)
+            else:
+                parameters[name] = parameter
+        if unknown:
+            raise UnknownParameterError('Parameters not defined for {0}: {1}'.format(self.name(), ', '.join(unknown)))
+        return parameters
+
     @abstractmethod
-    def findParameters(self, regexp:str='') -> list[Parameter]:
+    def findParameters(self, regexp:str='', glob:bool=False) -> list[Parameter]:
         '''Return a list of parameters with names passing the regexp filter.
         The default value results in a list of all parameters, which is not 
         recommended due to the potential list size
@@ -35,6 +74,8 @@ class Asset(ABC):  #Normative
         :type self:  
         :param regexp: Parameter name regular expression
         :type regexp: str 
+        :param glob: True if regexp is a glob pattern, such as BAT*
+        :type glob: bool
         '''
         pass
 
@@ -55,6 +96,8 @@ class Asset(ABC):  #Normative
     def setParameters(self, **valueMap:Any) -> None: #dict[str, MixedParameterValue]
         '''Sets the provided parameters, provided via a dictionary, with key of 
         parameter name and value representing the new finished value.
+        The update should be applied as a whole: all values are validated 
+        before any is set and all share one sample time.
         
         :param self: Self reference
         :type self:  
@@ -63,6 +106,21 @@ class Asset(ABC):  #Normative
         '''
         pass
 
+    def setParameterValues(self, names:Sequence[str], values:Sequence[MixedParameterValue]) -> None:
+        '''Sets parameters from parallel sequences of names and values, as one 
+        update with the same semantics as setParameters.  Implementations 
+        with a bulk update path override this to avoid building keyword 
+        arguments for large configuration loads.
+        
+        :param self: Self reference
+        :type self:  
+        :param names: Parameter names
+        :type names: Sequence[str]
+        :param values: New values, in the same order as names
+        :type values: Sequence[MixedParameterValue]
+        '''
+        self.setParameters(**dict(zip(names, values)))
+
     @abstractmethod
     def lookupCommand(self, commandName:str) -> Command | None:
         '''Lookup a command associated with this Asset
@@ -74,8 +132,31 @@ class Asset(ABC):  #Normative
         '''
         pass
 
+    def lookupCommands(self, commandNames:Sequence[str]) -> dict[str, Command]:
+        '''Lookup several commands of this Asset in one call, returning a 
+        dictionary of command name to Command.  If any names are not 
+        defined, UnknownCommandError lists all of them.  The default 
+        implementation calls lookupCommand for each name.
+        
+        :param self: Self reference
+        :type self:  
+        :param commandNames: Command names
+        :type commandNames: Sequence[str]
+        '''
+        commands:dict[str, Command] = dict()
+        unknown:list[str] = list()
+        for name in commandNames:
+            command = self.lookupCommand(name)
+            if command is None:
+                unknown.append(name)
+            else:
+                commands[name] = command
+        if unknown:
+            raise UnknownCommandError('Commands not defined for {0}: {1}'.format(self.name(), ', '.join(unknown)))
+        return commands
+
     @abstractmethod
-    def findCommands(self, regexp:str='') -> list[Command]:
+    def findCommands(self, regexp:str='', glob:bool=False) -> list[Command]:
         '''Return a list of commands with names passing the regexp filter.
            The default value results in a list of all commands, which is not
            recommended due to the potential list size.
@@ -84,6 +165,8 @@ class Asset(ABC):  #Normative
         :type self:  
         :param regexp: Command name regular expression
         :type regexp: str
+        :param glob: True if regexp is a glob pattern, such as MW*
+        :type glob: bool
         '''
         pass
 
@@ -103,6 +186,33 @@ class Asset(ABC):  #Normative
         '''
         pass
 
+    async def sendAsync(self, command:Command | str, _flags:dict[str, MixedFlagValue]=dict(), **args:Any) -> None:
+        '''Coroutine version of send.  The default implementation runs send 
+        in the executor of space.aio; implementations with an asynchronous 
+        command path should override it.
+        
+        :param self: Self reference
+        :type self:  
+        :param command: Command name or object
+        :type command:  
+        :param _flags: Flags for the command
+        :type _flags:  
+        :param args: Keyword of command arguments
+        :type args: Any
+        '''
+        await runSync(self.send, command, _flags, **args)
+
+    async def updateParametersAsync(self, parameterList:list[str | Parameter]=[]) -> None:
+        '''Coroutine version of updateParameters.  The default implementation 
+        runs updateParameters in the executor of space.aio.
+        
+        :param self: Self reference
+        :type self:  
+        :param parameterList: List of parameters
+        :type parameterList: list[str | Parameter]
+        '''
+        await runSync(self.updateParameters, parameterList)
+
     @abstractmethod
     def name(self) -> str:
         '''Returns the name of the Asset.
@@ -120,3 +230,30 @@ class Asset(ABC):  #Normative
         :type self:  
         '''
         pass
+
+    def subscribe(self, names:list[str | Parameter], callback:Callable[[dict[str, MixedParameterValue]], None], 
+                  deadband:float=0.0, minInterval:float=0.0) -> Subscription:
+        '''Registers a callback for updates of the listed parameters of this 
+        Asset.  Updates are delivered in batches from the subscription 
+        dispatcher thread as callback(values), where values is a dictionary of 
+        parameter name to new value.  Returns the Subscription, which can be 
+        canceled.
+        
+        :param self: Self reference
+        :type self:  
+        :param names: List of parameters
+        :type names: list[str | Parameter]
+        :param callback: Function called with each batch of updates
+        :type callback: Callable[[dict[str, MixedParameterValue]], None]
+        :param deadband: Minimum change of a numeric value (optional)
+        :type deadband: float 
+        :param minInterval: Minimum seconds between updates of a parameter (optional)
+        :type minInterval: float 
+        '''
+        # resolve the names in one lookup
+        found = self.lookupParameters([name for name in names if isinstance(name, str)])
+        parameters = [found[name] if isinstance(name, str) else name for name in names]
+        subscription = Subscription(callback, deadband, minInterval, grouped=True)
+        for parameter in parameters:
+            subscription.attach(parameter)
+        return subscription
@@ -0,0 +1,420 @@
+'''
+CachingAsset wraps an Asset so that updateParameters only polls the
+parameters whose last sample is older than their maximum age.
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import datetime
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, Sequence
+from .assets import Asset
+from .commands import Command
+from .constants import MixedFlagValue, MixedParameterValue
+from .parameters import Parameter
+from .times import clockNanos, nowNanos
+
+class CachingAsset(Asset):
+    '''Asset that remembers the sample time of each parameter after it was
+    polled and skips the poll of the wrapped Asset while that sample is
+    recent enough.  A parameter without a sample time is taken as sampled
+    when its poll started.  The
+    maximum age of a parameter is taken from its name, then from its type,
+    then from the default.  At most maxEntries refresh times are kept, the
+    least recently used being evicted first.  Setting parameters
+    invalidates them, and sending a command invalidates every parameter
+    unless invalidateOnSend is False.  All other calls go to the wrapped
+    Asset.
+    '''
+    def __init__(self, asset:Asset, defaultMaxAge:float=0.0, maxAges:dict[str, float]=dict(),
+                 typeMaxAges:dict[str, float]=dict(), maxEntries:int=10000, invalidateOnSend:bool=True):
+        '''
+        CachingAsset constructor
+
+        :param self: Self reference
+        :type self:  
+        :param asset: Wrapped Asset
+        :type asset: Asset
+        :param defaultMaxAge: Maximum age in seconds of parameters without another setting
+        :type defaultMaxAge: float
+        :param maxAges: Maximum age in seconds by parameter name
+        :type maxAges: dict[str, float]
+        :param typeMaxAges: Maximum age in seconds by parameter type
+        :type typeMaxAges: dict[str, float]
+        :param maxEntries: Maximum number of refresh times kept
+        :type maxEntries: int
+        :param invalidateOnSend: True if sending a command invalidates every parameter
+        :type invalidateOnSend: bool
+        '''
+        self._asset = asset
+        self.maxEntries = maxEntries
+        self.invalidateOnSend = invalidateOnSend
+        self._defaultMaxAge = int(defaultMaxAge * 1e9)
+        self._maxAges = {name: int(age * 1e9) for name, age in maxAges.items()}
+        self._typeMaxAges = {type: int(age * 1e9) for type, age in typeMaxAges.items()}
+        # parameter name to [sample time in nanoseconds, parameter type]
+        self._entries:OrderedDict[str, list[Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        # while polls run, invalidate records the count of invalidations by
+        # name, or for every name, so that a poll started before does not
+        # record the names invalidated meanwhile
+        self._polling = 0
+        self._invalidations = 0
+        self._invalidated:dict[str, int] = dict()
+        self._invalidatedAll = 0
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+
+    def asset(self) -> Asset:
+        '''
+        Returns the wrapped Asset
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return self._asset
+
+    def setMaxAge(self, seconds:float, name:str | None=None, parameterType:str | None=None) -> None:
+        '''
+        Sets the maximum age of a parameter, of a parameter type or, if
+        neither is given, the default.  A new type setting applies to
+        parameters from their next poll.
+
+        :param self: Self reference
+        :type self:  
+        :param seconds: Maximum age in seconds
+        :type seconds: float
+        :param name: Parameter name (optional)
+        :type name: str | None
+        :param parameterType: Parameter type (optional)
+        :type parameterType: str | None
+        '''
+        nanos = int(seconds * 1e9)
+        if name is not None:
+            self._maxAges[name] = nanos
+        elif parameterType is not None:
+            self._typeMaxAges[parameterType] = nanos
+        else:
+            self._defaultMaxAge = nanos
+
+    def _maxAge(self, name:str, parameterType:str | None) -> int:
+        '''
+        Returns the maximum age in nanoseconds of a parameter
+
+        :param self: Self reference
+        :type self:  
+        :param name: Parameter name
+        :type name: str
+        :param parameterType: Parameter type, if known
+        :type parameterType: str | None
+        '''
+        age = self._maxAges.get(name, None)
+        if age is None and parameterType is not None:
+            age = self._typeMaxAges.get(parameterType, None)
+        return self._defaultMaxAge if age is None else age
+
+    def invalidate(self, names:Iterable[str] | None=None) -> None:
+        '''
+        Forgets the sample times of the named parameters, or of all
+        parameters, so that they are polled again.  A poll running meanwhile
+        does not record the sample times of these parameters.
+
+        :param self: Self reference
+        :type self:  
+        :param names: Parameter names (optional)
+        :type names: Iterable[str] | None
+        '''
+        with self._lock:
+            self._invalidations += 1
+            if names is None:
+                self._entries.clear()
+                if self._polling:
+                    self._invalidatedAll = self._invalidations
+            else:
+                for name in names:
+                    self._entries.pop(name, None)
+                    if self._polling:
+                        self._invalidated[name] = self._invalidations
+
+    def statistics(self) -> dict[str, int]:
+        '''
+        Returns the hit, miss, stale and eviction counters and the number of
+        sample times kept.  A miss is a parameter without a sample time
+        and a stale parameter had one older than its maximum age; both are
+        polled.
+
+        :param self: Self reference
+        :type self:  
+        '''
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'stale': self.stale,
+                    'evictions': self.evictions, 'entries': len(self._entries)}
+
+    def resetStatistics(self) -> None:
+        '''
+        Sets the counters to zero
+
+        :param self: Self reference
+        :type self:  
+        '''
+        with self._lock:
+            self.hits = self.misses = self.stale = self.evictions = 0
+
+    def _sampleNanos(self, parameter:str | Parameter, pollNanos:int, doneNanos:int) -> int:
+        '''
+        Returns the sample time in nanoseconds of a polled parameter, or
+        the start of the poll if the parameter has no sample time.  Sample
+        times after the end of the poll are taken as its end.
+
+        :param self: Self reference
+        :type self:  
+        :param parameter: Parameter or parameter name
+        :type parameter: str | Parameter
+        :param pollNanos: Start of the poll in nanoseconds
+        :type pollNanos: int
+        :param doneNanos: End of the poll in nanoseconds
+        :type doneNanos: int
+        '''
+        found = self._asset.lookupParameter(parameter) if isinstance(parameter, str) else parameter
+        if found is None:
+            return pollNanos
+        sampled = found.sample().get('time', None)
+        if not isinstance(sampled, (datetime.datetime, int)):
+            return pollNanos
+        return min(clockNanos(sampled), doneNanos)
+
+    def _type(self, parameter:str | Parameter) -> str | None:
+        '''
+        Returns the type of a parameter, looking it up only if a type
+        maximum age could apply
+
+        :param self: Self reference
+        :type self:  
+        :param parameter: Parameter or parameter name
+        :type parameter: str | Parameter
+        '''
+        if not isinstance(parameter, str):
+            return parameter.type()
+        if not self._typeMaxAges:
+            return None
+        found = self._asset.lookupParameter(parameter)
+        return None if found is None else found.type()
+
+    def updateParameters(self, parameterList:list[str | Parameter]=[]) -> None:
+        '''
+        Refreshes the parameter values, polling the wrapped Asset only for
+        the parameters whose sample is missing or older than their maximum
+        age.  After the poll, the sample time of each parameter is kept, or
+        the start of the poll if it has none, unless the parameter was
+        invalidated meanwhile.  An empty list is passed on unchanged.
+
+        :param self: Self reference
+        :type self:  
+        :param parameterList: List of parameters
+        :type parameterList: list[str | Parameter]
+        '''
+        if len(parameterList) == 0:
+            self._asset.updateParameters(parameterList)
+            return
+        now = nowNanos()
+        polled:list[str | Parameter] = list()
+        types:dict[str, str | None] = dict()
+        entries = self._entries
+        with self._lock:
+            self._polling += 1
+            invalidations = self._invalidations
+            for parameter in parameterList:
+                name = parameter if isinstance(parameter, str) else parameter.name()
+                if name in types:
+                    continue
+                entry = entries.get(name, None)
+                if entry is not None:
+                    entries.move_to_end(name)
+                    if now - entry[0] <= self._maxAge(name, entry[1]):
+                        self.hits += 1
+                        continue
+                    self.stale += 1
+                    types[name] = entry[1]
+                else:
+                    self.misses += 1
+                    types[name] = None
+                polled.append(parameter)
+        sampled:dict[str, int] = dict()
+        try:
+            if not polled:
+                return
+            for parameter in polled:
+                name = parameter if isinstance(parameter, str) else parameter.name()
+                if types[name] is None:
+                    types[name] = self._type(parameter)
+            self._asset.updateParameters(polled)
+            done = nowNanos()
+            for parameter in polled:
+                name = parameter if isinstance(parameter, str) else parameter.name()
+                sampled[name] = self._sampleNanos(parameter, now, done)
+        finally:
+            with self._lock:
+                self._polling -= 1
+                if self._invalidatedAll <= invalidations:
+                    invalidated = self._invalidated
+                    for name, nanos in sampled.items():
+                        if invalidated.get(name, 0) > invalidations:
+                            continue
+                        entries[name] = [nanos, types[name]]
+                        entries.move_to_end(name)
+                    while len(entries) > self.maxEntries:
+                        entries.popitem(last=False)
+                        self.evictions += 1
+                if not self._polling:
+                    self._invalidated.clear()
+
+    def lookupParameter(self, parameterName:str, historySize:int=0) -> Parameter | None:
+        '''
+        Looks up a parameter of the wrapped Asset
+
+        :param self: Self reference
+        :type self:  
+        :param parameterName: Name of parameter
+        :type parameterName: str
+        :param historySize: Number of recent samples to keep (optional)
+        :type historySize: int
+        '''
+        # the wrapped Asset may implement the one argument lookupParameter
+        if historySize:
+            return self._asset.lookupParameter(parameterName, historySize)
+        return self._asset.lookupParameter(parameterName)
+
+    def lookupParameters(self, parameterNames:Sequence[str], historySize:int=0) -> dict[str, Parameter]:
+        '''
+        Looks up several parameters of the wrapped Asset
+
+        :param self: Self reference
+        :type self:  
+        :param parameterNames: Names of parameters
+        :type parameterNames: Sequence[str]
+        :param historySize: Number of recent samples to keep (optional)
+        :type historySize: int
+        '''
+        if historySize:
+            return self._asset.lookupParameters(parameterNames, historySize)
+        return self._asset.lookupParameters(parameterNames)
+
+    def findParameters(self, regexp:str='', glob:bool=False) -> list[Parameter]:
+        '''
+        Returns the parameters of the wrapped Asset with names passing the
+        filter
+
+        :param self: Self reference
+        :type self:  
+        :param regexp: Regular expression or glob filter
+        :type regexp: str
+        :param glob: True if the filter is a glob
+        :type glob: bool
+        '''
+        return self._asset.findParameters(regexp, glob)
+
+    def setParameters(self, **valueMap:Any) -> None:
+        '''
+        Invalidates the parameters, so that they are polled again, then
+        sets them on the wrapped Asset
+
+        :param self: Self reference
+        :type self:  
+        :param valueMap: Parameter values by name
+        :type valueMap: Any
+        '''
+        self.invalidate(valueMap.keys())
+        self._asset.setParameters(**valueMap)
+
+    def setParameterValues(self, names:Sequence[str], values:Sequence[MixedParameterValue]) -> None:
+        '''
+        Invalidates the parameters, so that they are polled again, then
+        sets them on the wrapped Asset
+
+        :param self: Self reference
+        :type self:  
+        :param names: Parameter names
+        :type names: Sequence[str]
+        :param values: Parameter values in the order of the names
+        :type values: Sequence[MixedParameterValue]
+        '''
+        self.invalidate(names)
+        self._asset.setParameterValues(names, values)
+
+    def lookupCommand(self, commandName:str) -> Command | None:
+        '''
+        Looks up a command of the wrapped Asset
+
+        :param self: Self reference
+        :type self:  
+        :param commandName: Name of command
+        :type commandName: str
+        '''
+        return self._asset.lookupCommand(commandName)
+
+    def lookupCommands(self, commandNames:Sequence[str]) -> dict[str, Command]:
+        '''
+        Looks up several commands of the wrapped Asset
+
+        :param self: Self reference
+        :type self:  
+        :param commandNames: Names of commands
+        :type commandNames: Sequence[str]
+        '''
+        return self._asset.lookupCommands(commandNames)
+
+    def findCommands(self, regexp:str='', glob:bool=False) -> list[Command]:
+        '''
+        Returns the commands of the wrapped Asset with names passing the
+        filter
+
+        :param self: Self reference
+        :type self:  
+        :param regexp: Regular expression or glob filter
+        :type regexp: str
+        :param glob: True if the filter is a glob
+        :type glob: bool
+        '''
+        return self._asset.findCommands(regexp, glob)
+
+    def send(self, command:Command | str, _flags:dict[str, MixedFlagValue]=dict(), **args:Any) -> None:
+        '''
+        Sends a command to the wrapped Asset.  Unless invalidateOnSend is
+        False, every parameter is then invalidated, even if the command
+        failed, since a command may change any telemetry value.
+
+        :param self: Self reference
+        :type self:  
+        :param command: Command name or object
+        :type command: Command | str
+        :param _flags: Flags for the command
+        :type _flags: dict[str, MixedFlagValue]
+        :param args: Keyword of command arguments
+        :type args: Any
+        '''
+        try:
+            self._asset.send(command, _flags, **args)
+        finally:
+            # a command may change any telemetry value
+            if self.invalidateOnSend:
+                self.invalidate()
+
+    def name(self) -> str:
+        '''
+        Returns the name of the wrapped Asset
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return self._asset.name()
+
+    def state(self) -> str:
+        '''
+        Returns the current state of the wrapped Asset
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return self._asset.state()
@@ -4,7 +4,9 @@ This file contains constants and support functions for Space Python.
 __author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
 __copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
 from datetime import datetime
-from typing import Callable, Any#, Union
+from typing import Callable, Any, Iterable#, Union
+from .arrays import np, requireNumpy
+from .errors import IllegalValueError, UndefinedTypeError
 from .times import SpecificTime, TimeInterval
 
 FAILED = -1 # Failure
@@ -63,4 +65,63 @@ def getParameterFunction(type:str) -> Callable[[Any], Any]:
     :type type: str 
     '''
 
-    return VALID_PARAMETER_TYPES.get(type, None)
\ No newline at end of file
+    return VALID_PARAMETER_TYPES.get(type, None)
+
+# NumPy dtypes used by convertMany for each parameter type
+ARRAY_PARAMETER_TYPES:dict[str, str] = { 'boolean': 'bool', 'byte': 'int8', 'ubyte': 'uint8', \
+               'short': 'int16', 'ushort': 'uint16', 'int': 'int32', \
+               'uint': 'uint32', 'long': 'int64', 'ulong': 'uint64', \
+               'float': 'float64', 'double': 'float64', 'string': 'str', \
+               'posixTime': 'datetime64[ns]', 'hexBitField': 'int64', \
+               'uTime': 'datetime64[ns]', 'interval': 'timedelta64[ns]' }
+
+def convertMany(type:str, values:Iterable[Any]) -> 'np.ndarray':
+    '''Converts a column of values to a typed NumPy array, applying the 
+    same conversion as getParameterFunction(type) to every value.  Integer 
+    types are range checked against the width of the type, and all values 
+    out of range are reported together in an IllegalValueError.  Time types 
+    are returned as datetime64[ns] and intervals as timedelta64[ns].
+    
+    :param type: Data type
+    :type type: str 
+    :param values: Values to convert
+    :type values: Iterable[Any]
+    '''
+    requireNumpy('convertMany')
+    dtype = ARRAY_PARAMETER_TYPES.get(type, None)
+    if dtype is None:
+        raise UndefinedTypeError('Could not convert values of data type <{0}>'.format(type))
+    if type in ('posixTime', 'uTime'):
+        return SpecificTime.parseMany(values)
+    if type == 'interval':
+        return TimeInterval.parseMany(values)
+    if type == 'string':
+        return np.array([str(v) for v in values], dtype=str)
+    if type == 'boolean':
+        return np.array([bool(v) for v in values], dtype=bool)
+    if dtype == 'float64':
+        return np.asarray(values if isinstance(values, np.ndarray) else list(values)).astype(np.float64)
+    if isinstance(values, np.ndarray):
+        source = values
+    else:
+        values = list(values)
+        # without a dtype, Python integers beyond int64 would become float64
+        try:
+            source = np.asarray(values, dtype=np.uint64 if dtype.startswith('u') else np.int64)
+        except (OverflowError, TypeError, ValueError):
+            source = np.array(values, dtype=object)
+    # integer types: convert at full width, then check the range of the type
+    if source.dtype.kind == 'O':
+        wide = np.array([int(v) for v in source], dtype=object)
+    elif source.dtype.kind == 'u':
+        wide = source.astype(np.uint64)
+    else:
+        wide = source.astype(np.int64)
+    if dtype.startswith('u') and wide.dtype.kind != 'u':
+        wide = np.abs(wide)  # same as the unsigned function
+    info = np.iinfo(dtype)
+    outside = np.flatnonzero((wide < info.min) | (wide > info.max))
+    if len(outside) > 0:
+        raise IllegalValueError('{0} values out of range for {1} at indices {2}'
+                                .format(len(outside), type, outside[:10].tolist()))
+    return wide.astype(dtype)
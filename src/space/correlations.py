@@ -0,0 +1,396 @@
+'''
+Time correlation converts between time scales (UTC, TAI, GPS and TT) and
+from spacecraft clock counts to time.  Times are handled as integer
+nanoseconds since the epoch so that whole NumPy arrays of samples can be
+converted in one call; SpecificTime provides the scalar interface.
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import calendar
+import datetime
+from bisect import bisect_right
+from typing import Any
+from . import times
+from .arrays import np, requireNumpy
+from .errors import IllegalValueError, SpacePythonException
+
+_NANOS_PER_SECOND = 1000000000
+
+# UTC dates at which TAI-UTC changed, and its new value in seconds
+LEAP_SECONDS:list[tuple[tuple[int, int, int], int]] = [
+    ((1972, 1, 1), 10), ((1972, 7, 1), 11), ((1973, 1, 1), 12), ((1974, 1, 1), 13),
+    ((1975, 1, 1), 14), ((1976, 1, 1), 15), ((1977, 1, 1), 16), ((1978, 1, 1), 17),
+    ((1979, 1, 1), 18), ((1980, 1, 1), 19), ((1981, 7, 1), 20), ((1982, 7, 1), 21),
+    ((1983, 7, 1), 22), ((1985, 7, 1), 23), ((1988, 1, 1), 24), ((1990, 1, 1), 25),
+    ((1991, 1, 1), 26), ((1992, 7, 1), 27), ((1993, 7, 1), 28), ((1994, 7, 1), 29),
+    ((1996, 1, 1), 30), ((1997, 7, 1), 31), ((1999, 1, 1), 32), ((2006, 1, 1), 33),
+    ((2009, 1, 1), 34), ((2012, 7, 1), 35), ((2015, 7, 1), 36), ((2017, 1, 1), 37) ]
+
+# Supported time scales
+TIME_SCALES = ('UTC', 'TAI', 'GPS', 'TT')
+
+# Offsets from TAI, in nanoseconds, of the scales that differ from it by a constant
+_TAI_OFFSETS:dict[str, int] = { 'TAI': 0, 'GPS': -19*_NANOS_PER_SECOND, 'TT': 32184000000 }
+
+def _dateNanos(date:datetime.date | tuple[int, int, int]) -> int:
+    '''
+    Returns the start of a UTC date in nanoseconds since the epoch
+
+    :param date: Date, or (year, month, day)
+    :type date: datetime.date | tuple[int, int, int]
+    '''
+    if isinstance(date, tuple):
+        date = datetime.date(*date)
+    return calendar.timegm(date.timetuple()) * _NANOS_PER_SECOND
+
+class LeapSecondTable(object):
+    '''Table of TAI-UTC offsets.  Offsets are looked up by binary search;
+    times before the first entry use the first offset.
+    '''
+    def __init__(self, entries:list[tuple[Any, int]]=LEAP_SECONDS):
+        '''
+        LeapSecondTable constructor
+
+        :param self: Self reference
+        :type self:  
+        :param entries: List of (UTC date, TAI-UTC seconds)
+        :type entries: list[tuple[datetime.date | tuple[int, int, int], int]]
+        '''
+        self._utc:list[int] = list()
+        self._tai:list[int] = list()
+        self._offsets:list[int] = list()
+        self._arrays:tuple[Any, Any, Any] | None = None
+        for date, offset in entries:
+            self.add(date, offset)
+
+    def add(self, date:datetime.date | tuple[int, int, int], offset:int) -> None:
+        '''
+        Adds a change of TAI-UTC, such as a newly announced leap second
+
+        :param self: Self reference
+        :type self:  
+        :param date: UTC date from which the offset applies
+        :type date: datetime.date | tuple[int, int, int]
+        :param offset: TAI-UTC in seconds
+        :type offset: int
+        '''
+        utc = _dateNanos(date)
+        i = bisect_right(self._utc, utc)
+        self._utc.insert(i, utc)
+        self._offsets.insert(i, offset * _NANOS_PER_SECOND)
+        self._tai = [u + o for u, o in zip(self._utc, self._offsets)]
+        self._arrays = None
+
+    def __len__(self) -> int:
+        '''
+        Returns the number of entries
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return len(self._utc)
+
+    def offset(self, utcNanos:int) -> int:
+        '''
+        Returns TAI-UTC in nanoseconds at a UTC time
+
+        :param self: Self reference
+        :type self:  
+        :param utcNanos: UTC nanoseconds since the epoch
+        :type utcNanos: int
+        '''
+        return self._offsets[max(bisect_right(self._utc, utcNanos) - 1, 0)]
+
+    def utcToTai(self, utcNanos:int) -> int:
+        '''
+        Converts UTC nanoseconds since the epoch to TAI
+
+        :param self: Self reference
+        :type self:  
+        :param utcNanos: UTC nanoseconds since the epoch
+        :type utcNanos: int
+        '''
+        return utcNanos + self.offset(utcNanos)
+
+    def taiToUtc(self, taiNanos:int) -> int:
+        '''
+        Converts TAI nanoseconds since the epoch to UTC
+
+        :param self: Self reference
+        :type self:  
+        :param taiNanos: TAI nanoseconds since the epoch
+        :type taiNanos: int
+        '''
+        return taiNanos - self._offsets[max(bisect_right(self._tai, taiNanos) - 1, 0)]
+
+    def _tables(self) -> tuple[Any, Any, Any]:
+        '''
+        Returns the UTC, TAI and offset columns as NumPy arrays
+
+        :param self: Self reference
+        :type self:  
+        '''
+        if self._arrays is None:
+            np = requireNumpy('LeapSecondTable')
+            self._arrays = (np.array(self._utc, dtype=np.int64), np.array(self._tai, dtype=np.int64),
+                            np.array(self._offsets, dtype=np.int64))
+        return self._arrays
+
+    def utcToTaiMany(self, utcNanos:'np.ndarray') -> 'np.ndarray':
+        '''
+        Converts an array of UTC nanoseconds since the epoch to TAI
+
+        :param self: Self reference
+        :type self:  
+        :param utcNanos: UTC nanoseconds since the epoch
+        :type utcNanos: np.ndarray
+        '''
+        np = requireNumpy('LeapSecondTable.utcToTaiMany')
+        utc, _, offsets = self._tables()
+        index = np.maximum(np.searchsorted(utc, utcNanos, side='right') - 1, 0)
+        return utcNanos + offsets[index]
+
+    def taiToUtcMany(self, taiNanos:'np.ndarray') -> 'np.ndarray':
+        '''
+        Converts an array of TAI nanoseconds since the epoch to UTC
+
+        :param self: Self reference
+        :type self:  
+        :param taiNanos: TAI nanoseconds since the epoch
+        :type taiNanos: np.ndarray
+        '''
+        np = requireNumpy('LeapSecondTable.taiToUtcMany')
+        _, tai, offsets = self._tables()
+        index = np.maximum(np.searchsorted(tai, taiNanos, side='right') - 1, 0)
+        return taiNanos - offsets[index]
+
+_leapSeconds = LeapSecondTable()
+
+def leapSeconds() -> LeapSecondTable:
+    '''Returns the leap second table used by default
+    '''
+    return _leapSeconds
+
+def setLeapSeconds(table:LeapSecondTable) -> LeapSecondTable:
+    '''Replaces the leap second table used by default, returning the
+    previous one
+
+    :param table: Leap second table
+    :type table: LeapSecondTable
+    '''
+    global _leapSeconds
+    previous = _leapSeconds
+    _leapSeconds = table
+    return previous
+
+def _checkScale(scale:str) -> None:
+    '''
+    Raises IllegalValueError for an unknown time scale
+
+    :param scale: Time scale name
+    :type scale: str
+    '''
+    if scale not in TIME_SCALES:
+        raise IllegalValueError('Unknown time scale <{0}>'.format(scale))
+
+def convertTimeScale(nanos:int, fromScale:str, toScale:str, table:LeapSecondTable | None=None) -> int:
+    '''Converts nanoseconds since the epoch from one time scale to another
+
+    :param nanos: Nanoseconds since the epoch in fromScale
+    :type nanos: int
+    :param fromScale: Time scale of the input
+    :type fromScale: str
+    :param toScale: Time scale of the result
+    :type toScale: str
+    :param table: Leap second table (optional)
+    :type table: LeapSecondTable | None
+    '''
+    _checkScale(fromScale)
+    _checkScale(toScale)
+    if fromScale == toScale:
+        return nanos
+    table = table if table is not None else _leapSeconds
+    tai = table.utcToTai(nanos) if fromScale == 'UTC' else nanos - _TAI_OFFSETS[fromScale]
+    return table.taiToUtc(tai) if toScale == 'UTC' else tai + _TAI_OFFSETS[toScale]
+
+def convertTimeScaleMany(values:'np.ndarray', fromScale:str, toScale:str,
+                         table:LeapSecondTable | None=None) -> 'np.ndarray':
+    '''Converts an array of times from one time scale to another.  A
+    datetime64 array gives a datetime64[ns] result, with missing times (NaT)
+    left missing, and an integer array of nanoseconds since the epoch gives
+    an int64 result.
+
+    :param values: Times in fromScale
+    :type values: np.ndarray
+    :param fromScale: Time scale of the input
+    :type fromScale: str
+    :param toScale: Time scale of the result
+    :type toScale: str
+    :param table: Leap second table (optional)
+    :type table: LeapSecondTable | None
+    '''
+    np = requireNumpy('convertTimeScaleMany')
+    _checkScale(fromScale)
+    _checkScale(toScale)
+    values = np.asarray(values)
+    isTime = values.dtype.kind == 'M'
+    nanos = values.astype('datetime64[ns]').view(np.int64) if isTime else values.astype(np.int64)
+    if fromScale != toScale:
+        table = table if table is not None else _leapSeconds
+        tai = table.utcToTaiMany(nanos) if fromScale == 'UTC' else nanos - _TAI_OFFSETS[fromScale]
+        nanos = table.taiToUtcMany(tai) if toScale == 'UTC' else tai + _TAI_OFFSETS[toScale]
+        if isTime:
+            # NaT is the smallest int64, which the offsets would turn into a date
+            nanos[np.isnat(values)] = np.iinfo(np.int64).min
+    return nanos.view('datetime64[ns]') if isTime else nanos
+
+class ClockCorrelation(object):
+    '''Piecewise linear correlation of spacecraft clock counts to time.
+    Each segment starts at a clock count, with the time of that count and
+    the seconds per count (the clock rate) that apply until the next
+    segment.  Segments are found by binary search.  Segment times are in
+    the time scale of the correlation, and results are converted to UTC.
+    '''
+    def __init__(self, scale:str='UTC', table:LeapSecondTable | None=None):
+        '''
+        ClockCorrelation constructor
+
+        :param self: Self reference
+        :type self:  
+        :param scale: Time scale of the segment times
+        :type scale: str
+        :param table: Leap second table (optional)
+        :type table: LeapSecondTable | None
+        '''
+        _checkScale(scale)
+        self.scale = scale
+        self.table = table
+        self._counts:list[float] = list()
+        self._times:list[int] = list()
+        self._rates:list[float] = list()
+        self._arrays:tuple[Any, Any, Any] | None = None
+
+    def addSegment(self, count:float, time:datetime.datetime | int, rate:float=1.0) -> None:
+        '''
+        Adds a correlation segment
+
+        :param self: Self reference
+        :type self:  
+        :param count: Clock count at the start of the segment
+        :type count: float
+        :param time: Time of the count, as a SpecificTime or nanoseconds since the epoch
+        :type time: SpecificTime | int
+        :param rate: Seconds per clock count
+        :type rate: float
+        '''
+        if rate <= 0:
+            raise IllegalValueError('Clock rate must be positive, not {0}'.format(rate))
+        i = bisect_right(self._counts, count)
+        self._counts.insert(i, count)
+        self._times.insert(i, times.toNanos(time))
+        self._rates.insert(i, rate * _NANOS_PER_SECOND)
+        self._arrays = None
+
+    def __len__(self) -> int:
+        '''
+        Returns the number of segments
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return len(self._counts)
+
+    def _segment(self, count:float) -> int:
+        '''
+        Returns the index of the segment containing a clock count
+
+        :param self: Self reference
+        :type self:  
+        :param count: Clock count
+        :type count: float
+        '''
+        i = bisect_right(self._counts, count) - 1
+        if i < 0:
+            raise IllegalValueError('Clock count {0} precedes the correlation'.format(count))
+        return i
+
+    def toNanos(self, count:float) -> int:
+        '''
+        Returns the UTC nanoseconds since the epoch of a clock count
+
+        :param self: Self reference
+        :type self:  
+        :param count: Clock count
+        :type count: float
+        '''
+        i = self._segment(count)
+        nanos = self._times[i] + round((count - self._counts[i]) * self._rates[i])
+        return convertTimeScale(nanos, self.scale, 'UTC', self.table)
+
+    def fromNanos(self, utcNanos:int) -> float:
+        '''
+        Returns the clock count at a UTC time
+
+        :param self: Self reference
+        :type self:  
+        :param utcNanos: UTC nanoseconds since the epoch
+        :type utcNanos: int
+        '''
+        nanos = convertTimeScale(utcNanos, 'UTC', self.scale, self.table)
+        i = bisect_right(self._times, nanos) - 1
+        if i < 0:
+            raise IllegalValueError('Time {0} precedes the correlation'.format(utcNanos))
+        return self._counts[i] + (nanos - self._times[i]) / self._rates[i]
+
+    def toNanosMany(self, counts:'np.ndarray') -> 'np.ndarray':
+        '''
+        Converts an array of clock counts to UTC nanoseconds since the epoch
+
+        :param self: Self reference
+        :type self:  
+        :param counts: Clock counts
+        :type counts: np.ndarray
+        '''
+        np = requireNumpy('ClockCorrelation.toNanosMany')
+        if self._arrays is None:
+            self._arrays = (np.array(self._counts, dtype=np.float64), np.array(self._times, dtype=np.int64),
+                            np.array(self._rates, dtype=np.float64))
+        starts, offsets, rates = self._arrays
+        counts = np.asarray(counts, dtype=np.float64)
+        index = np.searchsorted(starts, counts, side='right') - 1
+        if (index < 0).any():
+            raise IllegalValueError('Clock count {0} precedes the correlation'.format(counts[index < 0][0]))
+        nanos = offsets[index] + np.rint((counts - starts[index]) * rates[index]).astype(np.int64)
+        return convertTimeScaleMany(nanos, self.scale, 'UTC', self.table)
+
+    def toTimesMany(self, counts:'np.ndarray') -> 'np.ndarray':
+        '''
+        Converts an array of clock counts to a datetime64[ns] array in UTC
+
+        :param self: Self reference
+        :type self:  
+        :param counts: Clock counts
+        :type counts: np.ndarray
+        '''
+        return self.toNanosMany(counts).view('datetime64[ns]')
+
+_clockCorrelation:ClockCorrelation | None = None
+
+def setClockCorrelation(correlation:ClockCorrelation | None) -> ClockCorrelation | None:
+    '''Sets the spacecraft clock correlation used by default, returning the
+    previous one
+
+    :param correlation: Clock correlation
+    :type correlation: ClockCorrelation | None
+    '''
+    global _clockCorrelation
+    previous = _clockCorrelation
+    _clockCorrelation = correlation
+    return previous
+
+def clockCorrelation() -> ClockCorrelation:
+    '''Returns the spacecraft clock correlation used by default
+    '''
+    if _clockCorrelation is None:
+        raise SpacePythonException('No spacecraft clock correlation has been set')
+    return _clockCorrelation
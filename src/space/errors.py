@@ -13,6 +13,10 @@ class UnknownParameterError(SpacePythonException):
     '''Named parameter is not defined in this context
     '''
     pass
+class UnknownCommandError(SpacePythonException):
+    '''Named command is not defined in this context
+    '''
+    pass
 class TransmissionError(SpacePythonException):  #Normative
     '''Command was not transmitted or receipt was not acknowledged 
     '''
@@ -35,6 +39,11 @@ class IllegalValueError(SpacePythonException):  #Normative
     allowed by the data type or value restrictions
     '''
     pass
+class IllegalRestrictionError(SpacePythonException):
+    '''The restrictions on a Parameter contradict each other so that 
+    no value could satisfy all of them
+    '''
+    pass
 class QueryCanceledError(SpacePythonException):  #Normative
     ''' The operator canceled the query input.  The script may
     proceed with default values unless a mandatory value is 
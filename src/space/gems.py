@@ -4,6 +4,7 @@ The GemsDevice class is a legacy support class that maps to Asset objects.
 __author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
 __copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
 from .assets import Asset
+from .registries import assetRegistry
 from .space_pythons import spacePython
 
 def GemsDevice(device_name:str) -> Asset:
@@ -12,4 +13,9 @@ def GemsDevice(device_name:str) -> Asset:
     :param device_name: Device name
     :type device_name: str 
     '''
+    # Assets registered in the asset registry are found without
+    # creating the SpacePython implementation
+    asset = assetRegistry().get(device_name)
+    if asset is not None:
+        return asset
     return spacePython().lookupAsset(device_name)
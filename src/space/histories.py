@@ -0,0 +1,296 @@
+'''
+ParameterHistory keeps a fixed number of recent samples of a Parameter in
+compact arrays so that procedures can look at trends without keeping their
+own lists of values.
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Any
+from .arrays import np
+from .errors import UndefinedTypeError
+from .times import clockNanos, toNanos
+
+# array typecodes used to store the values of each parameter type.  Time
+# types are stored as integer nanoseconds.  Both floating point types are
+# Python floats, so they are stored in double precision.
+HISTORY_TYPECODES:dict[str, str] = { 'boolean': 'B', 'byte': 'b', 'ubyte': 'B', \
+               'short': 'h', 'ushort': 'H', 'int': 'i', \
+               'uint': 'I', 'long': 'q', 'ulong': 'Q', \
+               'float': 'd', 'double': 'd', 'hexBitField': 'q', \
+               'posixTime': 'q', 'uTime': 'q', 'interval': 'q' }
+
+class HistoryWindow(object):
+    '''A contiguous run of samples from a ParameterHistory, oldest first.
+    The times and values are memoryviews onto the history storage, so a
+    window is only valid until the history wraps around onto it; copy the
+    views if the samples must be kept.
+    '''
+    def __init__(self, times:memoryview, values:memoryview, codec:Any=None):
+        '''
+        HistoryWindow constructor
+
+        :param self: Self reference
+        :type self:  
+        :param times: Sample times in nanoseconds since the epoch
+        :type times: memoryview
+        :param values: Sample values
+        :type values: memoryview
+        :param codec: Enumeration that encoded the values (optional)
+        :type codec: EnumerationR | None
+        '''
+        self.times  = times
+        self.values = values
+        self.codec  = codec
+
+    def __len__(self) -> int:
+        '''
+        Returns the number of samples in the window
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return len(self.values)
+
+    def labels(self) -> list[str]:
+        '''
+        Returns the values decoded to strings for an enumerated Parameter
+
+        :param self: Self reference
+        :type self:  
+        '''
+        decode = self.codec.decode
+        return [decode(code) for code in self.values]
+
+    def arrays(self) -> tuple['np.ndarray', 'np.ndarray']:
+        '''
+        Returns the times and values as NumPy arrays that share the history
+        storage
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return np.frombuffer(self.times, dtype=np.int64), np.frombuffer(self.values, dtype=self.values.format)
+
+    def minimum(self) -> int | float | None:
+        '''
+        Returns the smallest value in the window, or None if it is empty
+
+        :param self: Self reference
+        :type self:  
+        '''
+        if len(self.values) == 0:
+            return None
+        if np is not None:
+            return np.frombuffer(self.values, dtype=self.values.format).min().item()
+        return min(self.values)
+
+    def maximum(self) -> int | float | None:
+        '''
+        Returns the largest value in the window, or None if it is empty
+
+        :param self: Self reference
+        :type self:  
+        '''
+        if len(self.values) == 0:
+            return None
+        if np is not None:
+            return np.frombuffer(self.values, dtype=self.values.format).max().item()
+        return max(self.values)
+
+    def mean(self) -> float | None:
+        '''
+        Returns the mean of the values in the window, or None if it is empty
+
+        :param self: Self reference
+        :type self:  
+        '''
+        if len(self.values) == 0:
+            return None
+        if np is not None:
+            return np.frombuffer(self.values, dtype=self.values.format).mean(dtype=np.float64).item()
+        return sum(self.values) / len(self.values)
+
+class ParameterHistory(object):
+    '''Fixed capacity history of the samples of a Parameter.
+    Values and integer nanosecond times are held in two arrays, each written
+    twice (at i and i+capacity) so that any run of recent samples is
+    contiguous and can be returned without copying.  Samples are expected
+    to be appended in time order.  With a codec, such as an EnumerationR,
+    values are stored as their integer codes.
+    '''
+    def __init__(self, capacity:int, typecode:str='d', codec:Any=None):
+        '''
+        ParameterHistory constructor
+
+        :param self: Self reference
+        :type self:  
+        :param capacity: Maximum number of samples retained
+        :type capacity: int
+        :param typecode: array typecode of the stored values
+        :type typecode: str
+        :param codec: Enumeration used to encode the values (optional)
+        :type codec: EnumerationR | None
+        '''
+        if capacity <= 0:
+            raise ValueError('History capacity must be positive')
+        self._capacity = capacity
+        self._values = array(typecode, bytes(array(typecode).itemsize * 2 * capacity))
+        self._times  = array('q', bytes(8 * 2 * capacity))
+        self._codec  = codec
+        self._next   = 0
+        self._count  = 0
+
+    @classmethod
+    def forType(cls, type:str, capacity:int, codec:Any=None) -> 'ParameterHistory':
+        '''
+        Returns a history suited to the provided parameter data type.  If an 
+        enumeration is provided, values are stored as its integer codes.
+
+        :param cls: Class reference
+        :type cls:  
+        :param type: Parameter data type
+        :type type: str
+        :param capacity: Maximum number of samples retained
+        :type capacity: int
+        :param codec: Enumeration used to encode the values (optional)
+        :type codec: EnumerationR | None
+        '''
+        if codec is not None:
+            return cls(capacity, codec.typecode(), codec)
+        typecode = HISTORY_TYPECODES.get(type, None)
+        if typecode is None:
+            raise UndefinedTypeError('No history storage for data type <{0}>'.format(type))
+        return cls(capacity, typecode)
+
+    def resized(self, capacity:int) -> 'ParameterHistory':
+        '''
+        Returns a history with a new capacity holding the most recent
+        samples of this one that fit
+
+        :param self: Self reference
+        :type self:  
+        :param capacity: Maximum number of samples retained
+        :type capacity: int
+        '''
+        history = ParameterHistory(capacity, self._values.typecode, self._codec)
+        count = min(self._count, capacity)
+        end = self._next + self._capacity
+        # stored values are already encoded, so copy the arrays directly
+        for stored, copy in ((self._values, history._values), (self._times, history._times)):
+            recent = stored[end - count:end]
+            copy[0:count] = recent
+            copy[capacity:capacity + count] = recent
+        history._next = count % capacity
+        history._count = count
+        return history
+
+    def capacity(self) -> int:
+        '''
+        Returns the maximum number of samples retained
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return self._capacity
+
+    def __len__(self) -> int:
+        '''
+        Returns the number of samples retained
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return self._count
+
+    def append(self, value:Any, time:Any) -> None:
+        '''
+        Adds a sample, replacing the oldest one if the history is full
+
+        :param self: Self reference
+        :type self:  
+        :param value: Sample value; times, intervals and enumerated values are stored as integers
+        :type value: Any
+        :param time: Sample time, as a SpecificTime (local time unless it has a time zone) or nanoseconds since the epoch
+        :type time: SpecificTime | int
+        '''
+        if self._codec is not None:
+            value = self._codec.encode(value)
+        elif isinstance(value, (datetime, timedelta)):
+            value = toNanos(value)
+        nanos = clockNanos(time)
+        i = self._next
+        self._values[i] = self._values[i + self._capacity] = value
+        self._times[i]  = self._times[i + self._capacity]  = nanos
+        self._next = (i + 1) % self._capacity
+        if self._count < self._capacity:
+            self._count += 1
+
+    def _window(self, begin:int, end:int) -> HistoryWindow:
+        '''
+        Returns the window of samples begin through end-1, counted from the
+        oldest retained sample
+
+        :param self: Self reference
+        :type self:  
+        :param begin: Index of the first sample
+        :type begin: int
+        :param end: Index after the last sample
+        :type end: int
+        '''
+        start = self._next + self._capacity - self._count
+        return HistoryWindow(memoryview(self._times)[start + begin:start + end],
+                             memoryview(self._values)[start + begin:start + end], self._codec)
+
+    def all(self) -> HistoryWindow:
+        '''
+        Returns all retained samples
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return self._window(0, self._count)
+
+    def last(self, n:int) -> HistoryWindow:
+        '''
+        Returns the n most recent samples
+
+        :param self: Self reference
+        :type self:  
+        :param n: Number of samples
+        :type n: int
+        '''
+        n = max(0, min(n, self._count))
+        return self._window(self._count - n, self._count)
+
+    def between(self, start:Any, end:Any) -> HistoryWindow:
+        '''
+        Returns the samples with start <= time < end.  A SpecificTime
+        without a time zone is taken as local time, as from now().
+
+        :param self: Self reference
+        :type self:  
+        :param start: Start of the range, as a SpecificTime or nanoseconds
+        :type start: SpecificTime | int
+        :param end: End of the range, as a SpecificTime or nanoseconds
+        :type end: SpecificTime | int
+        '''
+        times = self.all().times
+        begin = bisect_left(times, clockNanos(start))
+        return self._window(begin, max(begin, bisect_left(times, clockNanos(end))))
+
+    def since(self, interval:Any) -> HistoryWindow:
+        '''
+        Returns the samples within the interval before the most recent sample
+
+        :param self: Self reference
+        :type self:  
+        :param interval: Length of the window, as a TimeInterval or nanoseconds
+        :type interval: TimeInterval | int
+        '''
+        if self._count == 0:
+            return self.all()
+        times = self.all().times
+        return self._window(bisect_left(times, times[-1] - toNanos(interval)), self._count)
@@ -0,0 +1,240 @@
+'''
+Name index used by Asset implementations to answer findParameters and
+findCommands queries without scanning every name.
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import re
+from bisect import bisect_left, insort
+from fnmatch import fnmatchcase
+from typing import Iterable
+
+# Characters with a special meaning in a regular expression
+_REGEX_SPECIAL = frozenset('.^$*+?{}[]\\|()')
+
+# Quantifiers that allow the preceding character to be absent
+_OPTIONAL = frozenset('*?{')
+
+def regexPrefix(regexp:str) -> str:
+    '''Returns the literal text that every name matched by the regular
+    expression (with re.match) must start with.  Alternations and groups
+    are not analysed, so the prefix may be shorter than possible.
+
+    :param regexp: Regular expression
+    :type regexp: str
+    '''
+    if '|' in regexp:
+        return ''
+    prefix:list[str] = list()
+    i = 1 if regexp.startswith('^') else 0
+    while i < len(regexp):
+        c = regexp[i]
+        if c == '\\':
+            # an escaped punctuation character is literal
+            if i + 1 < len(regexp) and not regexp[i + 1].isalnum():
+                i += 1
+                c = regexp[i]
+            else:
+                break
+        elif c in _REGEX_SPECIAL:
+            # the character before an optional quantifier may be absent
+            if c in _OPTIONAL and prefix:
+                prefix.pop()
+            break
+        prefix.append(c)
+        i += 1
+    return ''.join(prefix)
+
+def globPrefix(pattern:str) -> str:
+    '''Returns the literal text that every name matched by the glob pattern
+    must start with
+
+    :param pattern: Glob pattern
+    :type pattern: str
+    '''
+    for i, c in enumerate(pattern):
+        if c in '*?[':
+            return pattern[:i]
+    return pattern
+
+class NameIndex(object):
+    '''Index of names for prefix, regular expression and glob queries.
+    Names are kept sorted, so a query whose pattern starts with literal
+    text only examines the names with that prefix.  Query results are
+    memoized until the names change.  Results are returned in the order
+    the names were added.
+    '''
+    def __init__(self, names:Iterable[str]=(), cacheSize:int=256):
+        '''
+        NameIndex constructor
+
+        :param self: Self reference
+        :type self:  
+        :param names: Initial names
+        :type names: Iterable[str]
+        :param cacheSize: Maximum number of memoized query results
+        :type cacheSize: int
+        '''
+        self.cacheSize = cacheSize
+        self._order:dict[str, int] = dict()
+        self._sorted:list[str] = list()
+        self._cache:dict[tuple[str, str], tuple[str, ...]] = dict()
+        self._count = 0
+        for name in names:
+            self._order[name] = self._count
+            self._count += 1
+        self._sorted = sorted(self._order)
+
+    def add(self, name:str) -> None:
+        '''
+        Adds a name
+
+        :param self: Self reference
+        :type self:  
+        :param name: Name
+        :type name: str
+        '''
+        if name in self._order:
+            return
+        self._order[name] = self._count
+        self._count += 1
+        insort(self._sorted, name)
+        self._cache.clear()
+
+    def remove(self, name:str) -> None:
+        '''
+        Removes a name
+
+        :param self: Self reference
+        :type self:  
+        :param name: Name
+        :type name: str
+        '''
+        if self._order.pop(name, None) is not None:
+            del self._sorted[bisect_left(self._sorted, name)]
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        '''
+        Returns the number of names
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return len(self._order)
+
+    def __contains__(self, name:object) -> bool:
+        '''
+        Returns True if the name is in the index
+
+        :param self: Self reference
+        :type self:  
+        :param name: Name
+        :type name: str
+        '''
+        return name in self._order
+
+    def names(self) -> list[str]:
+        '''
+        Returns all names in the order they were added
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return list(self._order)
+
+    def _range(self, prefix:str) -> list[str]:
+        '''
+        Returns the names starting with the prefix, in sorted order
+
+        :param self: Self reference
+        :type self:  
+        :param prefix: Literal prefix
+        :type prefix: str
+        '''
+        names = self._sorted
+        if prefix == '':
+            return names
+        start = bisect_left(names, prefix)
+        end = start
+        while end < len(names) and names[end].startswith(prefix):
+            end += 1
+        return names[start:end]
+
+    def _ordered(self, names:Iterable[str]) -> tuple[str, ...]:
+        '''
+        Returns the names in the order they were added
+
+        :param self: Self reference
+        :type self:  
+        :param names: Names
+        :type names: Iterable[str]
+        '''
+        return tuple(sorted(names, key=self._order.__getitem__))
+
+    def _memoize(self, key:tuple[str, str], result:tuple[str, ...]) -> list[str]:
+        '''
+        Stores a query result, discarding the oldest result when full
+
+        :param self: Self reference
+        :type self:  
+        :param key: Query mode and pattern
+        :type key: tuple[str, str]
+        :param result: Matching names
+        :type result: tuple[str, ...]
+        '''
+        if len(self._cache) >= self.cacheSize:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = result
+        return list(result)
+
+    def prefix(self, prefix:str) -> list[str]:
+        '''
+        Returns the names starting with the prefix
+
+        :param self: Self reference
+        :type self:  
+        :param prefix: Literal prefix
+        :type prefix: str
+        '''
+        key = ('prefix', prefix)
+        result = self._cache.get(key, None)
+        if result is not None:
+            return list(result)
+        return self._memoize(key, self._ordered(self._range(prefix)))
+
+    def match(self, regexp:str) -> list[str]:
+        '''
+        Returns the names matched by the regular expression from their
+        start, as with re.match.  An empty expression matches every name.
+
+        :param self: Self reference
+        :type self:  
+        :param regexp: Regular expression
+        :type regexp: str
+        '''
+        if regexp == '':
+            return self.names()
+        key = ('match', regexp)
+        result = self._cache.get(key, None)
+        if result is not None:
+            return list(result)
+        matcher = re.compile(regexp).match
+        return self._memoize(key, self._ordered(
+            name for name in self._range(regexPrefix(regexp)) if matcher(name)))
+
+    def glob(self, pattern:str) -> list[str]:
+        '''
+        Returns the names matched by the glob pattern, such as BAT*
+
+        :param self: Self reference
+        :type self:  
+        :param pattern: Glob pattern
+        :type pattern: str
+        '''
+        key = ('glob', pattern)
+        result = self._cache.get(key, None)
+        if result is not None:
+            return list(result)
+        return self._memoize(key, self._ordered(
+            name for name in self._range(globPrefix(pattern)) if fnmatchcase(name, pattern)))
@@ -0,0 +1,206 @@
+'''
+The journal records the verification steps of procedures, such as verify
+and waitFor outcomes, so that a pass can be reviewed afterwards without
+running its procedures again.
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import atexit
+import json
+import queue
+import threading
+from types import FrameType
+from typing import Any
+from . import log
+from . import times
+
+class Journal(object):
+    '''Append-only journal file with one JSON object per line.  Records are
+    encoded by the procedure threads, so a value changed after the call is
+    recorded as it was, and written in batches by a background thread, so
+    recording a step never waits for the disk.  Values that are not JSON
+    types, and dictionary keys that are not strings, are written as their
+    string form.  A record that still cannot be encoded is written as its
+    repr, so that one bad record does not stop the journal.
+    '''
+    def __init__(self, path:str, maxBatch:int=1000):
+        '''
+        Journal constructor.  The file is opened for appending.
+
+        :param self: Self reference
+        :type self:  
+        :param path: Journal file name
+        :type path: str
+        :param maxBatch: Maximum number of records per write
+        :type maxBatch: int
+        '''
+        self.path     = path
+        self.maxBatch = maxBatch
+        self._file    = open(path, 'a', encoding='utf-8')
+        self._queue:queue.SimpleQueue = queue.SimpleQueue()
+        self._closed  = False
+        self._thread  = threading.Thread(target=self._run, name='Journal', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def record(self, entry:dict[str, Any]) -> None:
+        '''
+        Encodes a record and queues it for writing
+
+        :param self: Self reference
+        :type self:  
+        :param entry: Record
+        :type entry: dict[str, Any]
+        '''
+        line = _encode(entry)
+        if line is not None:
+            self._queue.put(line)
+
+    def flush(self, timeout:float | None=None) -> bool:
+        '''
+        Waits until all records queued before the call are written.
+        Returns False if the timeout expired first.
+
+        :param self: Self reference
+        :type self:  
+        :param timeout: Maximum seconds to wait (optional)
+        :type timeout: float | None
+        '''
+        if self._closed:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout:float | None=None) -> None:
+        '''
+        Writes the queued records and closes the file
+
+        :param self: Self reference
+        :type self:  
+        :param timeout: Maximum seconds to wait (optional)
+        :type timeout: float | None
+        '''
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        '''
+        Writer thread main loop
+
+        :param self: Self reference
+        :type self:  
+        '''
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.maxBatch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines:list[str] = list()
+            flushed:list[threading.Event] = list()
+            stop = False
+            for item in batch:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    flushed.append(item)
+                else:
+                    lines.append(item)
+            if lines:
+                try:
+                    self._file.write('\n'.join(lines) + '\n')
+                    self._file.flush()
+                except Exception:
+                    log.exception('Could not write journal {0}'.format(self.path))
+            for done in flushed:
+                done.set()
+            if stop:
+                self._file.close()
+                return
+
+def _sanitized(value:Any) -> Any:
+    '''Returns a copy of a record with the dictionary keys that JSON cannot
+    encode, such as tuples, replaced by their string form
+
+    :param value: Record or value within it
+    :type value: Any
+    '''
+    if isinstance(value, dict):
+        return {key if key is None or isinstance(key, (str, int, float, bool)) else str(key): _sanitized(item)
+                for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_sanitized(item) for item in value]
+    return value
+
+def _encode(entry:dict[str, Any]) -> str | None:
+    '''Returns a record as one line of JSON.  Records that cannot be
+    encoded as they are fall back to sanitized keys, then to their repr;
+    None is returned, and the failure logged, if even that fails.
+
+    :param entry: Record
+    :type entry: dict[str, Any]
+    '''
+    try:
+        return json.dumps(entry, default=str, separators=(',', ':'))
+    except Exception:
+        pass
+    try:
+        return json.dumps(_sanitized(entry), default=str, separators=(',', ':'))
+    except Exception:
+        pass
+    try:
+        return json.dumps({'unencodable': repr(entry)}, separators=(',', ':'))
+    except Exception:
+        log.exception('Could not encode journal record')
+        return None
+
+_journal:Journal | None = None
+
+def setJournal(journal:Journal | None) -> Journal | None:
+    '''Sets the journal that records verify and waitFor outcomes, returning
+    the previous one.  With None, nothing is recorded.
+
+    :param journal: Journal
+    :type journal: Journal | None
+    '''
+    global _journal
+    previous = _journal
+    _journal = journal
+    return previous
+
+def currentJournal() -> Journal | None:
+    '''Returns the journal in use, or None
+    '''
+    return _journal
+
+def journalStep(kind:str, outcome:bool, frame:FrameType | None, line:int | None=None, **fields:Any) -> None:
+    '''Records a verification step in the journal, if there is one.  The
+    procedure is named by the __scriptname__ of the module of the frame.
+
+    :param kind: Step type, such as verify or waitFor
+    :type kind: str
+    :param outcome: True if the step succeeded
+    :type outcome: bool
+    :param frame: Frame of the procedure making the step
+    :type frame: FrameType | None
+    :param line: Line of the step, if the frame has moved on since (optional)
+    :type line: int | None
+    :param fields: Additional values to record
+    :type fields: Any
+    '''
+    journal = _journal
+    if journal is None:
+        return
+    entry:dict[str, Any] = {'time': times.nowNanos(), 'kind': kind, 'outcome': outcome}
+    if frame is not None:
+        names = frame.f_globals
+        entry['procedure'] = names.get('__scriptname__', names.get('__name__'))
+        entry['file'] = frame.f_code.co_filename
+        entry['line'] = frame.f_lineno if line is None else line
+    entry.update(fields)
+    journal.record(entry)
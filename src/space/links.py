@@ -4,6 +4,7 @@ The Links class is a legacy support class that maps to Asset objects.
 __author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
 __copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
 from .assets import Asset
+from .registries import assetRegistry
 from .space_pythons import spacePython
 
 def Link(link_name:str) -> Asset:
@@ -12,4 +13,9 @@ def Link(link_name:str) -> Asset:
     :param link_name: Link name
     :type link_name: str 
     '''
+    # Assets registered in the asset registry are found without
+    # creating the SpacePython implementation
+    asset = assetRegistry().get(link_name)
+    if asset is not None:
+        return asset
     return spacePython().lookupAsset(link_name)
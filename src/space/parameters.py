@@ -5,17 +5,23 @@ language implementation.
 __author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm), Brad Kizzort'
 __copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable
+import inspect
 import re
-from .times import SpecificTime, TimeInterval
+import threading
+import weakref
+from .times import SpecificTime, TimeInterval, toNanos, notifyWaiters
 from datetime import datetime, timedelta
-import calendar    #Needed for time conversions
-from datetime import datetime
 from .constants import MixedParameterValue, NullableMixedParameterValue
+from .errors import IllegalValueError
+from .arrays import np, requireNumpy
+from .histories import ParameterHistory
+from .subscriptions import Subscription
 
 class Parameter(ABC):  #Normative
     ''' Represents all parameters within SpacePython
     '''
+    __slots__ = ()
     @abstractmethod
     def value(self) -> NullableMixedParameterValue:
         '''Return the current value of the Parameter or None if no value has been 
@@ -77,11 +83,173 @@ class Parameter(ABC):  #Normative
         '''
         pass
 
+    def history(self) -> ParameterHistory | None:
+        '''Returns the sample history of the Parameter, or None if history 
+        has not been enabled.  Implementations that retain samples append each 
+        new sample to this history.
+        
+        :param self: Self reference
+        :type self:  
+        '''
+        return getattr(self, '_history', None)
+
+    def enumeration(self) -> 'EnumerationR | None':
+        '''Returns the enumeration restricting the values of the Parameter, or 
+        None.  Implementations that keep restrictions override this so that 
+        enumerated values are stored as integer codes.
+        
+        :param self: Self reference
+        :type self:  
+        '''
+        return None
+
+    def enableHistory(self, capacity:int) -> ParameterHistory:
+        '''Enables retention of the most recent samples of the Parameter and 
+        returns the history.  An existing history that is at least as large 
+        is kept; a smaller one is replaced by a larger copy of its samples.
+        
+        :param self: Self reference
+        :type self:  
+        :param capacity: Number of samples to retain
+        :type capacity: int 
+        '''
+        history = self.history()
+        if history is None:
+            history = ParameterHistory.forType(self.type(), capacity, self.enumeration())
+        elif history.capacity() < capacity:
+            history = history.resized(capacity)
+        else:
+            return history
+        # Parameter has no slots of its own; the history is kept in the 
+        # instance dictionary of implementations that use this default
+        setattr(self, '_history', history)
+        return history
+
+    def subscribe(self, callback:Callable[['Parameter', MixedParameterValue, SpecificTime], None], 
+                  deadband:float=0.0, minInterval:float=0.0) -> Subscription:
+        '''Registers a callback for updates of the Parameter.  The callback is 
+        called as callback(parameter, value, time) from the subscription 
+        dispatcher thread.  Updates that change a numeric value by no more than 
+        deadband, or that arrive within minInterval seconds of the previous 
+        delivered update, are not delivered.  Returns the Subscription, which 
+        can be canceled.
+        
+        :param self: Self reference
+        :type self:  
+        :param callback: Function called with each update
+        :type callback: Callable[[Parameter, MixedParameterValue, SpecificTime], None]
+        :param deadband: Minimum change of a numeric value (optional)
+        :type deadband: float 
+        :param minInterval: Minimum seconds between updates (optional)
+        :type minInterval: float 
+        '''
+        subscription = Subscription(callback, deadband, minInterval)
+        subscription.attach(self)
+        return subscription
+
+    def notifySubscribers(self, value:MixedParameterValue, time:SpecificTime | int) -> None:
+        '''Offers a new sample to the subscriptions of the Parameter and 
+        wakes the wait scheduler.  Implementations call this from their 
+        ingest path after the value of the Parameter has changed.  The time 
+        may be given as nanoseconds since the epoch, in which case the 
+        SpecificTime is only built if there are subscriptions.
+        
+        :param self: Self reference
+        :type self:  
+        :param value: New value
+        :type value: MixedParameterValue 
+        :param time: Sample time
+        :type time: SpecificTime | int 
+        '''
+        subscriptions = getattr(self, '_subscriptions', ())
+        if subscriptions:
+            if isinstance(time, int):
+                time = SpecificTime.fromClockNanos(time)
+            for subscription in subscriptions:
+                subscription.offer(self, value, time)
+        notifyWaiters()
+
+    def _attach(self, subscription:Subscription) -> None:
+        '''Adds a subscription to the Parameter.  The tuple is replaced rather 
+        than modified so the ingest path never needs a lock.
+        
+        :param self: Self reference
+        :type self:  
+        :param subscription: Subscription
+        :type subscription: Subscription 
+        '''
+        # kept in the instance dictionary, as for the history
+        setattr(self, '_subscriptions', getattr(self, '_subscriptions', ()) + (subscription,))
+
+    def _detach(self, subscription:Subscription) -> None:
+        '''Removes a subscription from the Parameter.
+        
+        :param self: Self reference
+        :type self:  
+        :param subscription: Subscription
+        :type subscription: Subscription 
+        '''
+        setattr(self, '_subscriptions', tuple(s for s in getattr(self, '_subscriptions', ()) if s is not subscription))
+
 # Instances of the Restriction can be added to a Parameter so that value changes can be 
-# validated
-class Restriction(object):
+# validated.  Restrictions are immutable and interned: constructing a Restriction equal 
+# to an existing one returns the shared instance, so that large databases with many 
+# identical restrictions hold one object (and one compiled pattern) for each.
+_restrictions:'weakref.WeakValueDictionary[tuple[Any, ...], Restriction]' = weakref.WeakValueDictionary()
+_restrictionsLock = threading.Lock()
+_signatures:dict[type, inspect.Signature] = dict()
+
+def _freeze(value:Any) -> tuple[Any, ...]:
+    '''
+    Returns a hashable key for a constructor argument.  The type is part of 
+    the key so that, for example, MinInclusiveR(1) and MinInclusiveR(1.0) 
+    remain distinct.
+    
+    :param value: Constructor argument
+    :type value: Any
+    '''
+    if isinstance(value, (list, tuple)):
+        return (tuple, tuple(_freeze(v) for v in value))
+    return (type(value), value)
+
+class _InternedRestriction(type):
+    '''Metaclass that returns the shared instance for equal Restrictions
+    '''
+    def __call__(cls, *args:Any, **kwargs:Any) -> Any:
+        '''
+        Returns the interned Restriction for the constructor arguments
+        
+        :param cls: Class reference
+        :type cls:  
+        :param args: Constructor arguments
+        :type args: Any
+        :param kwargs: Constructor keyword arguments
+        :type kwargs: Any
+        '''
+        signature = _signatures.get(cls, None)
+        if signature is None:
+            signature = _signatures[cls] = inspect.signature(getattr(cls, '__init__'))
+        bound = signature.bind(None, *args, **kwargs)
+        bound.apply_defaults()
+        key = (cls,) + tuple(_freeze(v) for v in list(bound.arguments.values())[1:])
+        with _restrictionsLock:
+            restriction = _restrictions.get(key, None)
+        if restriction is None:
+            # constructed without the lock, since __init__ may build other
+            # Restrictions; the first instance stored wins a race
+            created = super().__call__(*args, **kwargs)
+            object.__setattr__(created, '_key', key)
+            with _restrictionsLock:
+                restriction = _restrictions.setdefault(key, created)
+        return restriction
+
+class Restriction(object, metaclass=_InternedRestriction):
     '''Base class for all value restrictions.
     '''
+    __slots__ = ('_key', '__weakref__')
+    # class and constructor arguments, set once by _InternedRestriction
+    _key:tuple[Any, ...]
+
     def __init__(self):
         '''
         Restriction constructor
@@ -91,6 +259,56 @@ class Restriction(object):
         '''
         pass
 
+    def __setattr__(self, name:str, value:Any) -> None:
+        '''
+        Prevents changes once the Restriction has been constructed
+        
+        :param self: Self reference
+        :type self:  
+        :param name: Attribute name
+        :type name: str 
+        :param value: Attribute value
+        :type value: Any
+        '''
+        if hasattr(self, '_key'):
+            raise AttributeError('{0} is immutable'.format(self))
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name:str) -> None:
+        '''
+        Prevents changes once the Restriction has been constructed
+        
+        :param self: Self reference
+        :type self:  
+        :param name: Attribute name
+        :type name: str 
+        '''
+        raise AttributeError('{0} is immutable'.format(self))
+
+    def __eq__(self, other:object) -> bool:
+        '''
+        Restrictions are equal if they have the same class and arguments
+        
+        :param self: Self reference
+        :type self:  
+        :param other: Object to compare
+        :type other: object 
+        '''
+        if self is other:
+            return True
+        if not isinstance(other, Restriction):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        '''
+        Returns the hash of the class and arguments
+        
+        :param self: Self reference
+        :type self:  
+        '''
+        return hash(self._key)
+
     @abstractmethod
     def validate(self, value:Any) -> bool:
         '''
@@ -103,9 +321,80 @@ class Restriction(object):
         '''
         pass
 
+    def validateArray(self, values:Any) -> tuple['np.ndarray', 'np.ndarray']:
+        '''
+        Validates a NumPy array of samples in one call. Returns a boolean mask 
+        that is True where the sample is valid and the indices of the samples 
+        that violate the restriction.
+        
+        :param self: Self reference
+        :type self:  
+        :param values: Array (or sequence) of samples
+        :type values: np.ndarray
+        '''
+        requireNumpy('validateArray')
+        mask = self._arrayMask(np.asarray(values))
+        return mask, np.flatnonzero(~mask)
+
+    def _arrayMask(self, values:'np.ndarray') -> 'np.ndarray':
+        '''
+        Returns the validity mask for an array of samples.  Restrictions that 
+        can be vectorized override this; the default validates each sample.
+        
+        :param self: Self reference
+        :type self:  
+        :param values: Array of samples
+        :type values: np.ndarray
+        '''
+        validate = self.validate
+        return np.fromiter((bool(validate(v)) for v in values.flat), dtype=bool, 
+                           count=values.size).reshape(values.shape)
+
+def _epochNanosArray(values:'np.ndarray') -> 'np.ndarray | None':
+    '''
+    Returns a datetime64 array as integer nanoseconds since the epoch or a 
+    timedelta64 array as integer nanoseconds, or None if the array is not a 
+    NumPy time type.
+    
+    :param values: Array of samples
+    :type values: np.ndarray
+    '''
+    if values.dtype.kind == 'M':
+        return values.astype('datetime64[ns]').astype(np.int64)
+    if values.dtype.kind == 'm':
+        return values.astype('timedelta64[ns]').astype(np.int64)
+    return None
+
+def _secondsToNanos(seconds:int | float) -> int:
+    '''
+    Converts a bound in seconds to integer nanoseconds
+    
+    :param seconds: Number of seconds
+    :type seconds: int | float
+    '''
+    if isinstance(seconds, int):
+        return seconds*1000000000
+    return round(seconds*1000000000)
+
+def _nanosArray(values:'np.ndarray') -> 'np.ndarray | None':
+    '''
+    Returns the nanoseconds within the second of a datetime64 or timedelta64 
+    array, or None if the array is not a NumPy time type.
+    
+    :param values: Array of samples
+    :type values: np.ndarray
+    '''
+    if values.dtype.kind in 'Mm':
+        unit = 'datetime64[ns]' if values.dtype.kind == 'M' else 'timedelta64[ns]'
+        return values.astype(unit).astype(np.int64) % 1000000000
+    return None
+
 class EnumerationR(Restriction):
-    '''Limits a string Parameter to a list of values
+    '''Limits a string Parameter to a list of values.  Each value is also 
+    assigned a small integer code, its position in the list, so that samples 
+    can be stored compactly and turned back into strings when read.
     '''
+    __slots__ = ('names', 'members', '_codes')
     def __init__(self, names:list[str]=list()):
         '''
         Restriction constructor
@@ -115,7 +404,12 @@ class EnumerationR(Restriction):
         :param names: List of values
         :type names: list[str]
         '''
-        self.names = names
+        self.names = tuple(names)
+        self.members = frozenset(names)
+        codes:dict[str, int] = dict()
+        for code, name in enumerate(names):
+            codes.setdefault(name, code)
+        self._codes = codes
     def validate(self, value:str) -> bool:
         '''
         Validation function
@@ -126,10 +420,55 @@ class EnumerationR(Restriction):
         :type value: str 
         '''
         try:
-            self.names.index(value)
-            return True
-        except:
+            return value in self.members
+        except TypeError:
+            # unhashable values cannot be members
             return False
+    def encode(self, value:str) -> int:
+        '''
+        Returns the integer code of a value
+        
+        :param self: Self reference
+        :type self:  
+        :param value: Enumeration value
+        :type value: str 
+        '''
+        code = self._codes.get(value, None)
+        if code is None:
+            raise IllegalValueError('Violates restriction {0}'.format(self))
+        return code
+    def decode(self, code:int) -> str:
+        '''
+        Returns the value for an integer code
+        
+        :param self: Self reference
+        :type self:  
+        :param code: Integer code
+        :type code: int 
+        '''
+        return self.names[code]
+    def typecode(self) -> str:
+        '''
+        Returns the smallest array typecode that holds every code
+        
+        :param self: Self reference
+        :type self:  
+        '''
+        if len(self.names) <= 0x100:
+            return 'B'
+        if len(self.names) <= 0x10000:
+            return 'H'
+        return 'I'
+    def _arrayMask(self, values:'np.ndarray') -> 'np.ndarray':
+        '''
+        Returns the validity mask for an array of samples
+        
+        :param self: Self reference
+        :type self:  
+        :param values: Array of samples
+        :type values: np.ndarray
+        '''
+        return np.isin(values, list(self.names))
     def __repr__(self) -> str:
         '''
         Returns class representation
@@ -137,13 +476,14 @@ class EnumerationR(Restriction):
         :param self: Self reference
         :type self:  
         '''
-        return 'EnumerationR({0})'.format(self.names)
+        return 'EnumerationR({0})'.format(list(self.names))
         
 class FractionDigitsR(Restriction):
     '''Restricts the number of digits after the decimal for a float Parameter.
     Not really a limit on the value but could be used to control conversions to 
     and from a string
     '''
+    __slots__ = ('length',)
     def __init__(self, length:int):
         '''
         Restriction constructor
@@ -176,6 +516,7 @@ class FractionDigitsR(Restriction):
 class LengthR(Restriction):
     '''Requires a string Parameter to have a specific length
     '''
+    __slots__ = ('length',)
     def __init__(self, length:int):
         '''
         Restriction constructor
@@ -211,6 +552,7 @@ class LengthR(Restriction):
 class MaxExclusiveR(Restriction):
     '''Requires that an integer or floating parameter be less than a value
     '''
+    __slots__ = ('maxVal',)
     def __init__(self, maxVal: int | float):
         '''
         Restriction constructor
@@ -234,6 +576,16 @@ class MaxExclusiveR(Restriction):
             return True
         else:
             return False
+    def _arrayMask(self, values:'np.ndarray') -> 'np.ndarray':
+        '''
+        Returns the validity mask for an array of samples
+        
+        :param self: Self reference
+        :type self:  
+        :param values: Array of samples
+        :type values: np.ndarray
+        '''
+        return values < self.maxVal
     def __repr__(self) -> str:
         '''
         Returns class representation
@@ -246,6 +598,7 @@ class MaxExclusiveR(Restriction):
 class MaxInclusiveR(Restriction):
     '''Requires that an integer or floating parameter not exceed a value
     '''
+    __slots__ = ('maxVal',)
     def __init__(self, maxVal:int | float):
         '''
         Restriction constructor
@@ -269,6 +622,16 @@ class MaxInclusiveR(Restriction):
             return True
         else:
             return False
+    def _arrayMask(self, values:'np.ndarray') -> 'np.ndarray':
+        '''
+        Returns the validity mask for an array of samples
+        
+        :param self: Self reference
+        :type self:  
+        :param values: Array of samples
+        :type values: np.ndarray
+        '''
+        return values <= self.maxVal
     def __repr__(self) -> str:
         '''
         Returns class representation
@@ -281,6 +644,7 @@ class MaxInclusiveR(Restriction):
 class MaxLengthR(Restriction):
     '''Requires that a string Parameter not exceed a specified length
     '''
+    __slots__ = ('length',)
     def __init__(self, length:int):
         '''
         Restriction constructor
@@ -317,6 +681,7 @@ class MaxSecondsExclusiveR(Restriction):
     '''Requires that the seconds portion of a time Parameter not be less than a 
     value
     '''
+    __slots__ = ('maxVal', '_maxNanos')
     def __init__(self, maxVal:int | float):
         '''
         Restriction constructor
@@ -327,6 +692,7 @@ class MaxSecondsExclusiveR(Restriction):
         :type maxVal:  
         '''
         self.maxVal = maxVal
+        self._maxNanos = _secondsToNanos(maxVal)
     def validate(self, value:TimeInterval | timedelta | SpecificTime | datetime) -> bool:
         '''
         Validation function
@@ -336,17 +702,24 @@ class MaxSecondsExclusiveR(Restriction):
         :param value: Input value to check
         :type value: TimeInterval | timedelta | SpecificTime | datetime
         '''
-        if isinstance(value, TimeInterval) or isinstance(value, timedelta):
-            # TimeInterval and datetime.timedelta will return a total_seconds
-            seconds = value.total_seconds()
-        else:
-            # SpecificTime and datetime.datetime need to be converted to seconds
-            tt = value.utctimetuple()
-            seconds = calendar.timegm(tt)
-        if seconds < self.maxVal:
+        # Times and intervals compare as integer nanoseconds
+        if toNanos(value) < self._maxNanos:
             return True
         else:
             return False
+    def _arrayMask(self, values:'np.ndarray') -> 'np.ndarray':
+        '''
+        Returns the validity mask for an array of samples
+        
+        :param self: Self reference
+        :type self:  
+        :param values: Array of samples
+        :type values: np.ndarray
+        '''
+        nanos = _epochNanosArray(values)
+        if nanos is None:
+            return Restriction._arrayMask(self, values)
+        return nanos < self._maxNanos
     def __repr__(self) -> str:
         '''
         Returns class representation
@@ -360,6 +733,7 @@ class MaxSecondsInclusiveR(Restriction):
     '''Requires that the nanoseconds portion of a time Parameter not exceed a 
     value
     '''
+    __slots__ = ('maxVal', '_maxNanos')
     def __init__(self, maxVal:int):
         '''
         Restriction constructor
@@ -370,6 +744,7 @@ class MaxSecondsInclusiveR(Restriction):
         :type maxVal: int 
         '''
         self.maxVal = maxVal
+        self._maxNanos = _secondsToNanos(maxVal)
     def validate(self, value:TimeInterval | timedelta | SpecificTime | datetime) -> bool:
         '''
         Validation function
@@ -379,17 +754,24 @@ class MaxSecondsInclusiveR(Restriction):
         :param value: Input value to check
         :type value: TimeInterval | timedelta | SpecificTime | datetime
         '''
-        if isinstance(value, TimeInterval) or isinstance(value, timedelta):
-            # TimeInterval and datetime.timedelta will return a total_seconds
-            seconds = value.total_seconds()
-        else:
-            # SpecificTime and datetime.datetime need to be converted to seconds
-            tt = value.utctimetuple()
-            seconds = calendar.timegm(tt)
-        if seconds <= self.maxVal:
+        # Times and intervals compare as integer nanoseconds
+        if toNanos(value) <= self._maxNanos:
             return True
         else:
             return False
+    def _arrayMask(self, values:'np.ndarray') -> 'np.ndarray':
+        '''
+        Returns the validity mask for an array of samples
+        
+        :param self: Self reference
+        :type self:  
+        :param values: Array of samples
+        :type values: np.ndarray
+        '''
+        nanos = _epochNanosArray(values)
+        if nanos is None:
+            return Restriction._arrayMask(self, values)
+        return nanos <= self._maxNanos
     def __repr__(self) -> str:
         '''
         Returns class representation
@@ -403,6 +785,7 @@ class MaxNanosR(Restriction):
     '''Requires that the nanoseconds portion of a time Parameter not exceed a 
     value
     '''
+    __slots__ = ('maxVal',)
     def __init__(self, maxVal:int):
         '''
         Restriction constructor
@@ -435,6 +818,19 @@ class MaxNanosR(Restriction):
             return True
         else:
             return False
+    def _arrayMask(self, values:'np.ndarray') -> 'np.ndarray':
+        '''
+        Returns the validity mask for an array of samples
+        
+        :param self: Self reference
+        :type self:  
+        :param values: Array of samples
+        :type values: np.ndarray
+        '''
+        nanos = _nanosArray(values)
+        if nanos is None:
+            return Restriction._arrayMask(self, values)
+        return nanos <= self.maxVal
     def __repr__(self) -> str:
         '''
         Returns class representation
@@ -447,6 +843,7 @@ class MaxNanosR(Restriction):
 class MinExclusiveR(Restriction):
     '''Requires that an integer or floating parameter be less than a value
     '''
+    __slots__ = ('minVal',)
     def __init__(self, minVal:int | float):
         '''
         Restriction constructor
@@ -470,6 +867,16 @@ class MinExclusiveR(Restriction):
             return True
         else:
             return False
+    def _arrayMask(self, values:'np.ndarray') -> 'np.ndarray':
+        '''
+        Returns the validity mask for an array of samples
+        
+        :param self: Self reference
+        :type self:  
+        :param values: Array of samples
+        :type values: np.ndarray
+        '''
+        return values > self.minVal
     def __repr__(self) -> str:
         '''
         Returns class representation
@@ -482,6 +889,7 @@ class MinExclusiveR(Restriction):
 class MinInclusiveR(Restriction):
     '''Requires that an integer or floating parameter not exceed a value
     '''
+    __slots__ = ('minVal',)
     def __init__(self, minVal:int | float):
         '''
         Restriction constructor
@@ -505,6 +913,16 @@ class MinInclusiveR(Restriction):
             return True
         else:
             return False
+    def _arrayMask(self, values:'np.ndarray') -> 'np.ndarray':
+        '''
+        Returns the validity mask for an array of samples
+        
+        :param self: Self reference
+        :type self:  
+        :param values: Array of samples
+        :type values: np.ndarray
+        '''
+        return values >= self.minVal
     def __repr__(self) -> str:
         '''
         Returns class representation
@@ -517,6 +935,7 @@ class MinInclusiveR(Restriction):
 class MinLengthR(Restriction):
     '''Requires that a string Parameter not exceed a specified length
     '''
+    __slots__ = ('length',)
     def __init__(self, length:int):
         '''
         Restriction constructor
@@ -553,6 +972,7 @@ class MinSecondsExclusiveR(Restriction):
     '''Requires that the seconds portion of a time Parameter not be less than a 
     value
     '''
+    __slots__ = ('minVal', '_minNanos')
     def __init__(self, minVal:int):
         '''
         Restriction constructor
@@ -562,6 +982,7 @@ class MinSecondsExclusiveR(Restriction):
         :param minVal: Minimum seconds
         :type minVal: int '''
         self.minVal = minVal
+        self._minNanos = _secondsToNanos(minVal)
     def validate(self, value:TimeInterval | timedelta | SpecificTime | datetime) -> bool:
         '''
         Validation function
@@ -571,17 +992,24 @@ class MinSecondsExclusiveR(Restriction):
         :param value: Input value to check
         :type value: TimeInterval | timedelta | SpecificTime | datetime
         '''
-        if isinstance(value, TimeInterval) or isinstance(value, timedelta):
-            # TimeInterval and datetime.timedelta will return a total_seconds
-            seconds = value.total_seconds()
-        else:
-            # SpecificTime and datetime.datetime need to be converted to seconds
-            tt = value.utctimetuple()
-            seconds = calendar.timegm(tt)
-        if seconds > self.minVal:
+        # Times and intervals compare as integer nanoseconds
+        if toNanos(value) > self._minNanos:
             return True
         else:
             return False
+    def _arrayMask(self, values:'np.ndarray') -> 'np.ndarray':
+        '''
+        Returns the validity mask for an array of samples
+        
+        :param self: Self reference
+        :type self:  
+        :param values: Array of samples
+        :type values: np.ndarray
+        '''
+        nanos = _epochNanosArray(values)
+        if nanos is None:
+            return Restriction._arrayMask(self, values)
+        return nanos > self._minNanos
     def __repr__(self) -> str:
         '''
         Returns class representation
@@ -595,6 +1023,7 @@ class MinSecondsInclusiveR(Restriction):
     '''Requires that the nanoseconds portion of a time Parameter not exceed a 
     value
     '''
+    __slots__ = ('minVal', '_minNanos')
     def __init__(self, minVal:int):
         '''
         Restriction constructor
@@ -605,6 +1034,7 @@ class MinSecondsInclusiveR(Restriction):
         :type minVal: int 
         '''
         self.minVal = minVal
+        self._minNanos = _secondsToNanos(minVal)
     def validate(self, value:TimeInterval | timedelta | SpecificTime | datetime) -> bool:
         '''
         Validation function
@@ -614,17 +1044,24 @@ class MinSecondsInclusiveR(Restriction):
         :param value: Input value to check
         :type value: TimeInterval | timedelta | SpecificTime | datetime
         '''
-        if isinstance(value, TimeInterval) or isinstance(value, timedelta):
-            # TimeInterval and datetime.timedelta will return a total_seconds
-            seconds = value.total_seconds()
-        else:
-            # SpecificTime and datetime.datetime need to be converted to seconds
-            tt = value.utctimetuple()
-            seconds = calendar.timegm(tt)
-        if seconds >= self.minVal:
+        # Times and intervals compare as integer nanoseconds
+        if toNanos(value) >= self._minNanos:
             return True
         else:
             return False
+    def _arrayMask(self, values:'np.ndarray') -> 'np.ndarray':
+        '''
+        Returns the validity mask for an array of samples
+        
+        :param self: Self reference
+        :type self:  
+        :param values: Array of samples
+        :type values: np.ndarray
+        '''
+        nanos = _epochNanosArray(values)
+        if nanos is None:
+            return Restriction._arrayMask(self, values)
+        return nanos >= self._minNanos
     def __repr__(self) -> str:
         '''
         Returns class representation
@@ -638,6 +1075,7 @@ class MinNanosR(Restriction):
     '''Requires that the nanoseconds portion of a time Parameter not exceed a 
     value
     '''
+    __slots__ = ('minVal',)
     def __init__(self, minVal:int):
         '''
         Restriction constructor
@@ -670,6 +1108,19 @@ class MinNanosR(Restriction):
             return True
         else:
             return False
+    def _arrayMask(self, values:'np.ndarray') -> 'np.ndarray':
+        '''
+        Returns the validity mask for an array of samples
+        
+        :param self: Self reference
+        :type self:  
+        :param values: Array of samples
+        :type values: np.ndarray
+        '''
+        nanos = _nanosArray(values)
+        if nanos is None:
+            return Restriction._arrayMask(self, values)
+        return nanos >= self.minVal
     def __repr__(self) -> str:
         '''
         Returns class representation
@@ -682,6 +1133,7 @@ class MinNanosR(Restriction):
 class PatternR(Restriction):
     '''Requires that a string Parameter match a specified pattern
     '''
+    __slots__ = ('pattern', 're')
     def __init__(self, pattern:str):
         '''
         Restriction constructor
@@ -720,6 +1172,7 @@ class TotalDigitsR(Restriction):
     Not really a limit on the value but could be used to control conversions to 
     and from a string
     '''
+    __slots__ = ('maxVal',)
     def __init__(self, maxVal:int):
         '''
         Restriction constructor
@@ -0,0 +1,372 @@
+'''
+The asset registry holds the Assets known to an implementation under
+hierarchical paths, such as SAT1.ADCS.Wheel1, and answers lookupAsset and
+findAssets queries without scanning every Asset.
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import threading
+from typing import Iterable
+from .assets import Asset
+from .errors import IllegalAssetError
+from .indexes import NameIndex
+
+# Separator of the levels of an asset path
+SEPARATOR = '.'
+
+class _Node(object):
+    '''Level of the asset path tree'''
+    __slots__ = ('asset', 'children')
+
+    def __init__(self):
+        '''
+        Node constructor
+
+        :param self: Self reference
+        :type self:  
+        '''
+        self.asset:Asset | None = None
+        self.children:dict[str, '_Node'] = dict()
+
+class AssetRegistry(object):
+    '''Registry of Assets by hierarchical path.  Paths are kept in a tree
+    for lookups and subtree queries, and in a NameIndex for regular
+    expression and glob queries, so a pattern that starts with literal text
+    only examines the paths with that prefix.  Assets are also indexed by
+    type and by state.  The state index is not refreshed by itself: it holds
+    the state read at register() or given to the last updateState().
+    Pattern queries keep registration order.
+    '''
+    def __init__(self):
+        '''
+        AssetRegistry constructor
+
+        :param self: Self reference
+        :type self:  
+        '''
+        self._root = _Node()
+        self._paths = NameIndex()
+        self._types:dict[str, dict[str, None]] = dict()
+        self._states:dict[str, dict[str, None]] = dict()
+        self._typeOf:dict[str, str] = dict()
+        self._stateOf:dict[str, str] = dict()
+        self._lock = threading.RLock()
+
+    def register(self, asset:Asset, path:str | None=None, assetType:str | None=None) -> str:
+        '''
+        Registers an Asset, replacing any Asset with the same path, and
+        returns its path
+
+        :param self: Self reference
+        :type self:  
+        :param asset: Asset
+        :type asset: Asset
+        :param path: Dotted path, such as SAT1.ADCS.Wheel1 (defaults to the Asset name)
+        :type path: str | None
+        :param assetType: Asset type, such as SpaceSystem or GemsDevice (defaults to the class name)
+        :type assetType: str | None
+        '''
+        if path is None:
+            path = asset.name()
+        if path == '' or '' in path.split(SEPARATOR):
+            raise IllegalAssetError('Illegal asset path {0}'.format(path))
+        if assetType is None:
+            assetType = type(asset).__name__
+        with self._lock:
+            if path in self._paths:
+                self._unindex(path)
+            node = self._root
+            for level in path.split(SEPARATOR):
+                child = node.children.get(level, None)
+                if child is None:
+                    child = node.children[level] = _Node()
+                node = child
+            node.asset = asset
+            self._paths.add(path)
+            self._typeOf[path] = assetType
+            self._types.setdefault(assetType, dict())[path] = None
+            self._index(path, asset.state())
+        return path
+
+    def unregister(self, path:str) -> Asset:
+        '''
+        Removes the Asset with the path, returning it.  Assets below the
+        path stay registered.
+
+        :param self: Self reference
+        :type self:  
+        :param path: Dotted path
+        :type path: str
+        '''
+        with self._lock:
+            nodes = self._nodes(path)
+            if nodes is None or nodes[-1].asset is None:
+                raise IllegalAssetError('Asset {0} does not exist'.format(path))
+            asset = nodes[-1].asset
+            nodes[-1].asset = None
+            self._unindex(path)
+            self._paths.remove(path)
+            # prune the levels that no longer lead to an Asset
+            levels = path.split(SEPARATOR)
+            for i in range(len(levels) - 1, -1, -1):
+                node = nodes[i + 1]
+                if node.asset is not None or node.children:
+                    break
+                del nodes[i].children[levels[i]]
+        return asset
+
+    def _nodes(self, path:str) -> list[_Node] | None:
+        '''
+        Returns the nodes from the root to the path, or None if the path is
+        not in the tree
+
+        :param self: Self reference
+        :type self:  
+        :param path: Dotted path
+        :type path: str
+        '''
+        node = self._root
+        nodes = [node]
+        if path == '':
+            return nodes
+        for level in path.split(SEPARATOR):
+            node = node.children.get(level, None)
+            if node is None:
+                return None
+            nodes.append(node)
+        return nodes
+
+    def _index(self, path:str, state:str) -> None:
+        '''
+        Adds the path to the state index
+
+        :param self: Self reference
+        :type self:  
+        :param path: Dotted path
+        :type path: str
+        :param state: Asset state
+        :type state: str
+        '''
+        self._stateOf[path] = state
+        self._states.setdefault(state, dict())[path] = None
+
+    def _unindex(self, path:str) -> None:
+        '''
+        Removes the path from the type and state indexes
+
+        :param self: Self reference
+        :type self:  
+        :param path: Dotted path
+        :type path: str
+        '''
+        for index, of in ((self._types, self._typeOf), (self._states, self._stateOf)):
+            key = of.pop(path)
+            paths = index[key]
+            del paths[path]
+            if not paths:
+                del index[key]
+
+    def updateState(self, path:str, state:str | None=None) -> None:
+        '''
+        Updates the state index for the Asset with the path.  Implementations
+        call it when the state of an Asset changes.
+
+        :param self: Self reference
+        :type self:  
+        :param path: Dotted path
+        :type path: str
+        :param state: New state (defaults to the state reported by the Asset)
+        :type state: str | None
+        '''
+        with self._lock:
+            asset = self.get(path)
+            if asset is None:
+                raise IllegalAssetError('Asset {0} does not exist'.format(path))
+            if state is None:
+                state = asset.state()
+            if self._stateOf[path] != state:
+                paths = self._states[self._stateOf[path]]
+                del paths[path]
+                if not paths:
+                    del self._states[self._stateOf[path]]
+                self._index(path, state)
+
+    def get(self, path:str) -> Asset | None:
+        '''
+        Returns the Asset with the path, or None
+
+        :param self: Self reference
+        :type self:  
+        :param path: Dotted path
+        :type path: str
+        '''
+        node = self._root
+        for level in path.split(SEPARATOR):
+            node = node.children.get(level, None)
+            if node is None:
+                return None
+        return node.asset
+
+    def lookup(self, path:str) -> Asset:
+        '''
+        Returns the Asset with the path, raising IllegalAssetError if there
+        is none
+
+        :param self: Self reference
+        :type self:  
+        :param path: Dotted path
+        :type path: str
+        '''
+        asset = self.get(path)
+        if asset is None:
+            raise IllegalAssetError('Asset {0} does not exist'.format(path))
+        return asset
+
+    def __len__(self) -> int:
+        '''
+        Returns the number of Assets
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return len(self._paths)
+
+    def __contains__(self, path:object) -> bool:
+        '''
+        Returns True if an Asset is registered with the path
+
+        :param self: Self reference
+        :type self:  
+        :param path: Dotted path
+        :type path: str
+        '''
+        return path in self._paths
+
+    def paths(self) -> list[str]:
+        '''
+        Returns the paths of all Assets in registration order
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return self._paths.names()
+
+    def children(self, path:str='') -> list[str]:
+        '''
+        Returns the names of the levels directly below the path, whether or
+        not an Asset is registered at them
+
+        :param self: Self reference
+        :type self:  
+        :param path: Dotted path (defaults to the top level)
+        :type path: str
+        '''
+        with self._lock:
+            nodes = self._nodes(path)
+            return [] if nodes is None else list(nodes[-1].children)
+
+    def subtree(self, path:str) -> list[str]:
+        '''
+        Returns the paths of the Asset with the path and of all Assets below
+        it, so SAT1 includes SAT1.ADCS but not SAT10
+
+        :param self: Self reference
+        :type self:  
+        :param path: Dotted path
+        :type path: str
+        '''
+        with self._lock:
+            if path == '':
+                return self._paths.names()
+            paths = self._paths.prefix(path + SEPARATOR)
+            if path in self._paths:
+                paths.insert(0, path)
+            return paths
+
+    def _select(self, paths:Iterable[str], assetType:str | None, state:str | None) -> list[str]:
+        '''
+        Filters the paths by the type and state indexes
+
+        :param self: Self reference
+        :type self:  
+        :param paths: Dotted paths
+        :type paths: Iterable[str]
+        :param assetType: Asset type (optional)
+        :type assetType: str | None
+        :param state: Asset state (optional)
+        :type state: str | None
+        '''
+        if assetType is not None:
+            typed = self._types.get(assetType, {})
+            paths = [p for p in paths if p in typed]
+        if state is not None:
+            stated = self._states.get(state, {})
+            paths = [p for p in paths if p in stated]
+        return list(paths)
+
+    def find(self, pattern:str='', glob:bool=False, assetType:str | None=None, state:str | None=None) -> list[Asset]:
+        '''
+        Returns the Assets whose paths are matched by a regular expression
+        (from the start of the path, as with re.match) or a glob pattern,
+        optionally restricted to a type and a state.  The state is the one
+        indexed at register() or by the last updateState(), not the one the
+        Asset reports now.
+
+        :param self: Self reference
+        :type self:  
+        :param pattern: Regular expression or glob pattern
+        :type pattern: str
+        :param glob: True if the pattern is a glob pattern
+        :type glob: bool
+        :param assetType: Asset type (optional)
+        :type assetType: str | None
+        :param state: Asset state (optional)
+        :type state: str | None
+        '''
+        with self._lock:
+            if pattern == '' and (assetType is not None or state is not None):
+                # start from the smaller index instead of every path
+                indexes = [index.get(key, {}) for index, key in
+                           ((self._types, assetType), (self._states, state)) if key is not None]
+                smallest = min(indexes, key=len)
+                paths:Iterable[str] = smallest
+            elif glob:
+                paths = self._paths.glob(pattern)
+            else:
+                paths = self._paths.match(pattern)
+            return [self.lookup(p) for p in self._select(paths, assetType, state)]
+
+    def ofType(self, assetType:str) -> list[Asset]:
+        '''
+        Returns the Assets of a type
+
+        :param self: Self reference
+        :type self:  
+        :param assetType: Asset type, such as SpaceSystem or GemsDevice
+        :type assetType: str
+        '''
+        return self.find(assetType=assetType)
+
+    def inState(self, state:str) -> list[Asset]:
+        '''
+        Returns the Assets in a state, as indexed at register() or by the
+        last updateState() of each Asset
+
+        :param self: Self reference
+        :type self:  
+        :param state: Asset state
+        :type state: str
+        '''
+        return self.find(state=state)
+
+_assetRegistry:AssetRegistry | None = None
+_assetRegistryLock = threading.Lock()
+
+def assetRegistry() -> AssetRegistry:
+    '''Returns the shared asset registry
+    '''
+    global _assetRegistry
+    with _assetRegistryLock:
+        if _assetRegistry is None:
+            _assetRegistry = AssetRegistry()
+    return _assetRegistry
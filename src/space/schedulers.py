@@ -0,0 +1,527 @@
+'''
+Schedulers that let many procedures wait, and many time-tagged actions
+run, on one thread rather than a thread each.
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import concurrent.futures
+import datetime
+import functools
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable
+from . import log
+from .constants import MixedFlagValue
+from .times import SpecificTime, WaitStatus, _nextPollPeriod, toNanos
+
+class _Waiter(object):
+    '''Internal class holding one pending waitFor condition
+    '''
+    __slots__ = ('condition', 'pollPeriod', 'backoff', 'maxPollPeriod', 'deadline', 'done', 'result', 'error', 'polls')
+    def __init__(self, condition:Callable[[], bool], pollPeriod:float, backoff:float,
+                 maxPollPeriod:float | None, deadline:float):
+        '''
+        Waiter constructor
+
+        :param self: Self reference
+        :type self:  
+        :param condition: Verifier function
+        :type condition: Callable[[],bool]
+        :param pollPeriod: Seconds before the next evaluation of the condition
+        :type pollPeriod: float
+        :param backoff: Factor applied to the poll period after each evaluation
+        :type backoff: float
+        :param maxPollPeriod: Largest poll period in seconds (optional)
+        :type maxPollPeriod: float | None
+        :param deadline: time.monotonic() value at which the wait times out
+        :type deadline: float
+        '''
+        self.condition     = condition
+        self.pollPeriod    = pollPeriod
+        self.backoff       = backoff
+        self.maxPollPeriod = maxPollPeriod
+        self.deadline      = deadline
+        self.done          = threading.Event()
+        self.result        = False
+        self.error:Exception | None = None
+        self.polls         = 0
+
+class WaitScheduler(object):
+    '''Evaluates the conditions of many waitFor calls on a single thread.
+    Pending conditions are kept in a heap ordered by their next evaluation
+    time, and all conditions that are due are evaluated in one pass.  A
+    waiting procedure is only woken when its condition becomes true, its
+    deadline passes or its condition raises an exception.
+
+    wake() evaluates every pending condition at once.  When event driven,
+    it is called by the Parameter ingest path through notifyWaiters() and
+    conditions are not polled at all: they are evaluated when the wait
+    starts, on each wake() and at the deadline, so they should only depend
+    on Parameter values.  A polling scheduler is not woken by ingest.
+
+    Conditions run on the scheduler thread, so they must be thread safe
+    and should return quickly.
+    '''
+    def __init__(self, eventDriven:bool=False):
+        '''
+        WaitScheduler constructor
+
+        :param self: Self reference
+        :type self:  
+        :param eventDriven: True to evaluate conditions on wake() instead of polling
+        :type eventDriven: bool
+        '''
+        self.eventDriven = eventDriven
+        self._heap:list[tuple[float, int, _Waiter]] = list()
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._woken = False
+        self._waiting = 0
+        self._thread:threading.Thread | None = None
+
+    def waitFor(self, boolean:Callable[[], bool], timeout:float=5, pollPeriod:float=0.1,
+                backoff:float=1.0, maxPollPeriod:float | None=None) -> bool:
+        '''
+        Blocks until the condition is true, returning True, or until the
+        timeout expires, returning False.  An exception raised by the
+        condition is raised again in the waiting thread.
+
+        :param self: Self reference
+        :type self:  
+        :param boolean: Verifier function
+        :type boolean: Callable[[],bool]
+        :param timeout: Timeout for the verifier in seconds
+        :type timeout: float
+        :param pollPeriod: Frequency of polling in seconds
+        :type pollPeriod: float
+        :param backoff: Factor applied to the poll period after each poll
+        :type backoff: float
+        :param maxPollPeriod: Largest poll period in seconds (optional)
+        :type maxPollPeriod: float | None
+        '''
+        return self.waitForStatus(boolean, timeout, pollPeriod, backoff, maxPollPeriod).satisfied
+
+    def waitForStatus(self, boolean:Callable[[], bool], timeout:float=5, pollPeriod:float=0.1,
+                      backoff:float=1.0, maxPollPeriod:float | None=None) -> WaitStatus:
+        '''
+        Same as waitFor, but returns the outcome together with the time
+        waited and the number of evaluations of the condition
+
+        :param self: Self reference
+        :type self:  
+        :param boolean: Verifier function
+        :type boolean: Callable[[],bool]
+        :param timeout: Timeout for the verifier in seconds
+        :type timeout: float
+        :param pollPeriod: Frequency of polling in seconds
+        :type pollPeriod: float
+        :param backoff: Factor applied to the poll period after each poll
+        :type backoff: float
+        :param maxPollPeriod: Largest poll period in seconds (optional)
+        :type maxPollPeriod: float | None
+        '''
+        start = time.monotonic()
+        waiter = _Waiter(boolean, pollPeriod, backoff, maxPollPeriod, start + max(timeout, 0.0))
+        # an event driven condition is evaluated once registered, so an update
+        # made before any wake() could reach it is not missed
+        due = start if self.eventDriven else min(start + pollPeriod, waiter.deadline)
+        with self._condition:
+            if self._thread is None:
+                thread = threading.Thread(target=self._run, name='WaitScheduler', daemon=True)
+                thread.start()
+                self._thread = thread
+            heapq.heappush(self._heap, (due, next(self._counter), waiter))
+            self._waiting += 1
+            self._condition.notify()
+        try:
+            waiter.done.wait()
+        finally:
+            with self._condition:
+                self._waiting -= 1
+        if waiter.error is not None:
+            raise waiter.error
+        return WaitStatus(waiter.result, time.monotonic() - start, waiter.polls)
+
+    def wake(self) -> None:
+        '''
+        Evaluates every pending condition as soon as possible
+
+        :param self: Self reference
+        :type self:  
+        '''
+        # Also wakes while conditions are being evaluated, so that an update
+        # made during the evaluation is not missed
+        if self._waiting:
+            with self._condition:
+                self._woken = True
+                self._condition.notify()
+
+    def pending(self) -> int:
+        '''
+        Returns the number of waits in progress
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return self._waiting
+
+    def isSchedulerThread(self) -> bool:
+        '''
+        Returns True when called from the scheduler thread, where waiting
+        on the scheduler would deadlock
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return threading.current_thread() is self._thread
+
+    def _due(self) -> list[tuple[float, int, _Waiter]]:
+        '''
+        Blocks until conditions are due and removes them from the heap.
+        Called with the lock held.
+
+        :param self: Self reference
+        :type self:  
+        '''
+        heap = self._heap
+        while True:
+            if self._woken:
+                self._woken = False
+                due = heap[:]
+                heap.clear()
+                return due
+            if heap:
+                delay = heap[0][0] - time.monotonic()
+                if delay <= 0:
+                    now = time.monotonic()
+                    due = list()
+                    while heap and heap[0][0] <= now:
+                        due.append(heapq.heappop(heap))
+                    return due
+                self._condition.wait(delay)
+            else:
+                self._condition.wait()
+
+    def _run(self) -> None:
+        '''
+        Scheduler thread main loop
+
+        :param self: Self reference
+        :type self:  
+        '''
+        while True:
+            with self._condition:
+                due = self._due()
+            now = time.monotonic()
+            later:list[tuple[float, int, _Waiter]] = list()
+            for scheduled, sequence, waiter in due:
+                waiter.polls += 1
+                try:
+                    if waiter.condition() is True:
+                        waiter.result = True
+                        waiter.done.set()
+                        continue
+                except Exception as e:
+                    waiter.error = e
+                    waiter.done.set()
+                    continue
+                if now >= waiter.deadline:
+                    waiter.done.set()
+                    continue
+                if self.eventDriven:
+                    scheduled = waiter.deadline
+                elif scheduled <= now:
+                    scheduled += waiter.pollPeriod
+                    if scheduled <= now:
+                        # fell behind, so poll again one period from now
+                        scheduled = now + waiter.pollPeriod
+                    waiter.pollPeriod = _nextPollPeriod(waiter.pollPeriod, waiter.backoff, waiter.maxPollPeriod)
+                later.append((min(scheduled, waiter.deadline), sequence, waiter))
+            if later:
+                with self._condition:
+                    for entry in later:
+                        heapq.heappush(self._heap, entry)
+
+class TimeTag(object):
+    '''A time-tagged action held by a TimeTagScheduler.  After the action
+    has run, firedAt holds the SpecificTime it ran and jitter the number of
+    milliseconds it ran after its time tag.
+    '''
+    __slots__ = ('time', 'action', 'name', 'firedAt', 'jitter', 'error', '_due', '_sequence', '_state')
+    def __init__(self, when:datetime.datetime, due:int, action:Callable[[], Any], name:str):
+        '''
+        TimeTag constructor
+
+        :param self: Self reference
+        :type self:  
+        :param when: Time tag
+        :type when: SpecificTime
+        :param due: time.monotonic_ns() value of the time tag
+        :type due: int
+        :param action: Function called at the time tag
+        :type action: Callable[[], Any]
+        :param name: Description of the action
+        :type name: str
+        '''
+        self.time      = when
+        self.action    = action
+        self.name      = name
+        self.firedAt:SpecificTime | None = None
+        self.jitter:float | None = None
+        self.error:Exception | None = None
+        self._due      = due
+        self._sequence = 0
+        self._state    = 'pending'
+
+    def state(self) -> str:
+        '''
+        Returns pending, canceled, fired or failed
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return self._state
+
+    def __repr__(self) -> str:
+        '''
+        Returns class representation
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return 'TimeTag({0}, {1!r}, {2})'.format(self.time, self.name, self._state)
+
+class TimeTagScheduler(object):
+    '''Runs time-tagged actions from a single dispatcher thread.  Pending
+    actions are kept in a heap ordered by time tag.  Time tags are taken
+    relative to SpecificTime.now(), as in waitUntil, and are converted to
+    the monotonic clock when scheduled, so stepping the system time does
+    not move them.
+
+    Actions run on the dispatcher thread unless an executor is provided,
+    so they should return quickly.  The lateness of each action is
+    recorded in milliseconds; see jitter().
+    '''
+    def __init__(self, executor:concurrent.futures.Executor | None=None):
+        '''
+        TimeTagScheduler constructor
+
+        :param self: Self reference
+        :type self:  
+        :param executor: Executor running the actions (optional)
+        :type executor: concurrent.futures.Executor | None
+        '''
+        self.executor = executor
+        self._heap:list[tuple[int, int, TimeTag]] = list()
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread:threading.Thread | None = None
+        self._fired = 0
+        self._totalJitter = 0.0
+        self._maxJitter = 0.0
+
+    def _due(self, when:datetime.datetime | datetime.timedelta) -> int:
+        '''
+        Returns the time.monotonic_ns() value of a time tag
+
+        :param self: Self reference
+        :type self:  
+        :param when: Time tag, or interval from now
+        :type when: SpecificTime | TimeInterval
+        '''
+        if isinstance(when, datetime.timedelta):
+            delay = when
+        else:
+            delay = when - SpecificTime.now(when.tzinfo)
+        return time.monotonic_ns() + toNanos(delay)
+
+    def _push(self, tag:TimeTag) -> None:
+        '''
+        Adds the tag to the heap, starting the dispatcher thread if needed.
+        Called with the lock held.
+
+        :param self: Self reference
+        :type self:  
+        :param tag: Time tag
+        :type tag: TimeTag
+        '''
+        if self._thread is None:
+            thread = threading.Thread(target=self._run, name='TimeTagScheduler', daemon=True)
+            thread.start()
+            self._thread = thread
+        tag._sequence = next(self._counter)
+        heapq.heappush(self._heap, (tag._due, tag._sequence, tag))
+        self._condition.notify()
+
+    def schedule(self, when:datetime.datetime | datetime.timedelta, action:Callable[[], Any], name:str='') -> TimeTag:
+        '''
+        Schedules a function to be called at a time tag.  A time tag in the
+        past runs as soon as possible.
+
+        :param self: Self reference
+        :type self:  
+        :param when: Time tag, or interval from now
+        :type when: SpecificTime | TimeInterval
+        :param action: Function called at the time tag
+        :type action: Callable[[], Any]
+        :param name: Description of the action (optional)
+        :type name: str
+        '''
+        if isinstance(when, datetime.timedelta):
+            when = SpecificTime.now() + when
+        tag = TimeTag(when, self._due(when), action, name or getattr(action, '__name__', repr(action)))
+        with self._condition:
+            self._push(tag)
+        return tag
+
+    def scheduleCommand(self, when:datetime.datetime | datetime.timedelta, asset:Any, command:Any,
+                        _flags:dict[str, MixedFlagValue]=dict(), **args:Any) -> TimeTag:
+        '''
+        Schedules a command to be sent to an Asset at a time tag
+
+        :param self: Self reference
+        :type self:  
+        :param when: Time tag, or interval from now
+        :type when: SpecificTime | TimeInterval
+        :param asset: Asset receiving the command
+        :type asset: Asset
+        :param command: Command name or object
+        :type command: Command | str
+        :param _flags: Flags for the command
+        :type _flags: dict[str, MixedFlagValue]
+        :param args: Keyword of command arguments
+        :type args: Any
+        '''
+        name = command if isinstance(command, str) else command.name()
+        return self.schedule(when, functools.partial(asset.send, command, _flags, **args),
+                             '{0}.{1}'.format(asset.name(), name))
+
+    def cancel(self, tag:TimeTag) -> bool:
+        '''
+        Cancels a pending action.  Returns False if it already ran or was
+        canceled.
+
+        :param self: Self reference
+        :type self:  
+        :param tag: Time tag returned by schedule
+        :type tag: TimeTag
+        '''
+        with self._condition:
+            if tag._state != 'pending':
+                return False
+            # the heap entry is discarded when it comes due
+            tag._state = 'canceled'
+            return True
+
+    def reschedule(self, tag:TimeTag, when:datetime.datetime | datetime.timedelta) -> bool:
+        '''
+        Moves a pending action to a new time tag.  Returns False if it
+        already ran or was canceled.
+
+        :param self: Self reference
+        :type self:  
+        :param tag: Time tag returned by schedule
+        :type tag: TimeTag
+        :param when: New time tag, or interval from now
+        :type when: SpecificTime | TimeInterval
+        '''
+        if isinstance(when, datetime.timedelta):
+            when = SpecificTime.now() + when
+        due = self._due(when)
+        with self._condition:
+            if tag._state != 'pending':
+                return False
+            # the old heap entry no longer matches the sequence and is discarded
+            tag.time = when
+            tag._due = due
+            self._push(tag)
+            return True
+
+    def pending(self) -> list[TimeTag]:
+        '''
+        Returns the pending actions in time tag order
+
+        :param self: Self reference
+        :type self:  
+        '''
+        with self._condition:
+            entries = sorted(self._heap)
+        return [tag for _, sequence, tag in entries if tag._state == 'pending' and tag._sequence == sequence]
+
+    def jitter(self) -> dict[str, float]:
+        '''
+        Returns the number of actions run and the mean and maximum number of
+        milliseconds they ran after their time tags
+
+        :param self: Self reference
+        :type self:  
+        '''
+        with self._condition:
+            fired = self._fired
+            return {'count': fired, 'mean': self._totalJitter / fired if fired else 0.0, 'max': self._maxJitter}
+
+    def _fire(self, tag:TimeTag) -> None:
+        '''
+        Runs the action of a tag
+
+        :param self: Self reference
+        :type self:  
+        :param tag: Time tag
+        :type tag: TimeTag
+        '''
+        try:
+            tag.action()
+        except Exception as e:
+            tag.error = e
+            tag._state = 'failed'
+            log.exception('Time tagged action {0} failed'.format(tag.name))
+
+    def _run(self) -> None:
+        '''
+        Dispatcher thread main loop
+
+        :param self: Self reference
+        :type self:  
+        '''
+        heap = self._heap
+        while True:
+            with self._condition:
+                while True:
+                    if heap:
+                        due, sequence, tag = heap[0]
+                        if tag._state != 'pending' or tag._sequence != sequence:
+                            heapq.heappop(heap)
+                            continue
+                        delay = due - time.monotonic_ns()
+                        if delay <= 0:
+                            heapq.heappop(heap)
+                            break
+                        self._condition.wait(delay / 1e9)
+                    else:
+                        self._condition.wait()
+                jitter = (time.monotonic_ns() - due) / 1e6
+                tag._state = 'fired'
+                tag.jitter = jitter
+                self._fired += 1
+                self._totalJitter += jitter
+                if jitter > self._maxJitter:
+                    self._maxJitter = jitter
+            tag.firedAt = SpecificTime.now()
+            if self.executor is not None:
+                self.executor.submit(self._fire, tag)
+            else:
+                self._fire(tag)
+
+_timeTagScheduler:TimeTagScheduler | None = None
+_timeTagSchedulerLock = threading.Lock()
+
+def timeTagScheduler() -> TimeTagScheduler:
+    '''Returns the shared time tag scheduler
+    '''
+    global _timeTagScheduler
+    with _timeTagSchedulerLock:
+        if _timeTagScheduler is None:
+            _timeTagScheduler = TimeTagScheduler()
+    return _timeTagScheduler
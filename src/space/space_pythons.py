@@ -7,9 +7,12 @@ __copyright__ = 'Object Management Group under RF-Limited license (https://www.o
 from abc import ABC, abstractmethod
 from importlib import import_module
 import os
+from typing import Mapping, Sequence
 from .assets import Asset
+from .parameters import Parameter
 from .procedure_engines import ProcedureEngine
 from .constants import MixedFlagValue
+from .updates import updateCoalescer
 
 class SpacePython(ABC):  #Normative
     '''
@@ -43,6 +46,23 @@ class SpacePython(ABC):  #Normative
         '''
         pass
 
+    def updateMany(self, requests:Mapping[Asset, Sequence[str | Parameter]], timeout:float | None=None) -> None:
+        '''Refreshes the parameters of several Assets, returning once every 
+        requested value has been polled.  Polls of different Assets run 
+        concurrently.  Duplicate names are polled once, and names requested 
+        by concurrent procedures for the same Asset are merged into one 
+        updateParameters call.  Raises TimeoutError if the polls take longer 
+        than the timeout.
+        
+        :param self: Self reference
+        :type self:  
+        :param requests: Parameters or parameter names to refresh for each Asset
+        :type requests: Mapping[Asset, Sequence[str | Parameter]]
+        :param timeout: Maximum seconds to wait (optional)
+        :type timeout: float | None
+        '''
+        updateCoalescer().update(requests, timeout)
+
     @abstractmethod
     def procedureEngine(self) -> ProcedureEngine:
         '''Returns implementation of Procedure Engine sub-interface
@@ -0,0 +1,402 @@
+'''
+Subscriptions deliver Parameter updates to procedures as they arrive, so
+that a procedure can react to telemetry without polling.
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import heapq
+import itertools
+import queue
+import threading
+import time
+from typing import Any, Callable
+from . import log
+
+class Subscription(object):
+    '''A registration for updates of one or more Parameters.
+    Updates are filtered on the ingest path by the deadband and minimum
+    interval and then handed to a SubscriptionDispatcher, which calls the
+    callback from its own thread.  The latest sample held back by the
+    minimum interval is delivered when the interval ends, so the final
+    value of a parameter that settles is not lost.  A Parameter subscription calls
+    callback(parameter, value, time); an Asset subscription calls
+    callback(values) with a dictionary of parameter name to value.
+    '''
+    def __init__(self, callback:Callable[..., None], deadband:float=0.0, minInterval:float=0.0,
+                 grouped:bool=False, dispatcher:'SubscriptionDispatcher | None'=None):
+        '''
+        Subscription constructor
+
+        :param self: Self reference
+        :type self:  
+        :param callback: Function called with the updates
+        :type callback: Callable[..., None]
+        :param deadband: Numeric change required before an update is delivered
+        :type deadband: float
+        :param minInterval: Minimum number of seconds between delivered updates of a parameter
+        :type minInterval: float
+        :param grouped: True to deliver a dictionary of values per batch
+        :type grouped: bool
+        :param dispatcher: Dispatcher delivering the updates (optional)
+        :type dispatcher: SubscriptionDispatcher | None
+        '''
+        self.callback    = callback
+        self.deadband    = deadband
+        self.minInterval = minInterval
+        self.grouped     = grouped
+        self._dispatcher = dispatcher if dispatcher is not None else subscriptionDispatcher()
+        self._minNanos   = int(minInterval * 1000000000)
+        self._last:dict[str, tuple[Any, int]] = dict()
+        # latest sample held back by the minimum interval, by parameter name
+        self._held:dict[str, tuple[Any, Any, Any]] = dict()
+        self._lock = threading.Lock()
+        self._parameters:list[Any] = list()
+        self._active = True
+
+    def active(self) -> bool:
+        '''
+        Returns True until the subscription is canceled
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return self._active
+
+    def attach(self, parameter:Any) -> None:
+        '''
+        Adds a Parameter to the subscription
+
+        :param self: Self reference
+        :type self:  
+        :param parameter: Parameter to receive updates from
+        :type parameter: Parameter
+        '''
+        parameter._attach(self)
+        self._parameters.append(parameter)
+
+    def cancel(self) -> None:
+        '''
+        Stops delivery of updates.  Updates already queued are discarded.
+
+        :param self: Self reference
+        :type self:  
+        '''
+        self._active = False
+        for parameter in self._parameters:
+            parameter._detach(self)
+        self._parameters = list()
+
+    def offer(self, parameter:Any, value:Any, time:Any) -> None:
+        '''
+        Called on the ingest path for each new sample of an attached
+        Parameter.  Queues the update for delivery if it passes the deadband
+        and minimum interval filters.
+
+        :param self: Self reference
+        :type self:  
+        :param parameter: Updated Parameter
+        :type parameter: Parameter
+        :param value: New value
+        :type value: MixedParameterValue
+        :param time: Sample time
+        :type time: SpecificTime
+        '''
+        if self.accept(parameter, value, time):
+            self._dispatcher.submit(self, parameter, value, time)
+
+    def accept(self, parameter:Any, value:Any, time:Any) -> bool:
+        '''
+        Applies the deadband and minimum interval filters to a new sample and
+        returns True if it should be delivered.  A sample held back by the
+        minimum interval is kept and delivered by the dispatcher when the
+        interval ends, unless a later sample replaces it.  Used directly by
+        ingest paths that submit several updates to the dispatcher at once.
+
+        :param self: Self reference
+        :type self:  
+        :param parameter: Updated Parameter
+        :type parameter: Parameter
+        :param value: New value
+        :type value: MixedParameterValue
+        :param time: Sample time
+        :type time: SpecificTime
+        '''
+        if not self._active:
+            return False
+        name = parameter.name()
+        now = _monotonicNanos()
+        with self._lock:
+            last = self._last.get(name, None)
+            if last is not None:
+                lastValue, lastNanos = last
+                if now - lastNanos < self._minNanos:
+                    if name not in self._held:
+                        self._dispatcher.release(self, name, lastNanos + self._minNanos)
+                    self._held[name] = (parameter, value, time)
+                    return False
+                self._held.pop(name, None)
+                if self._withinDeadband(value, lastValue):
+                    return False
+            self._last[name] = (value, now)
+        return True
+
+    def _withinDeadband(self, value:Any, lastValue:Any) -> bool:
+        '''
+        Returns True if the value is too close to the last delivered value
+        to be delivered
+
+        :param self: Self reference
+        :type self:  
+        :param value: New value
+        :type value: MixedParameterValue
+        :param lastValue: Last delivered value
+        :type lastValue: MixedParameterValue
+        '''
+        if self.deadband <= 0.0:
+            return False
+        try:
+            return abs(value - lastValue) <= self.deadband
+        except TypeError:
+            # Non-numeric values have no deadband, only change
+            return value == lastValue
+
+    def _release(self, name:str) -> tuple[Any, Any, Any] | None:
+        '''
+        Returns the sample held back for the parameter if it should now be
+        delivered.  Called by the dispatcher when the minimum interval ends.
+
+        :param self: Self reference
+        :type self:  
+        :param name: Parameter name
+        :type name: str
+        '''
+        with self._lock:
+            held = self._held.pop(name, None)
+            if held is None or not self._active:
+                return None
+            last = self._last.get(name, None)
+            if last is not None and self._withinDeadband(held[1], last[0]):
+                return None
+            self._last[name] = (held[1], _monotonicNanos())
+            return held
+
+    def dispatcher(self) -> 'SubscriptionDispatcher':
+        '''
+        Returns the dispatcher delivering the updates
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return self._dispatcher
+
+    def deliver(self, updates:dict[str, tuple[Any, Any, Any]]) -> None:
+        '''
+        Calls the callback with a batch of updates.  Called by the dispatcher.
+
+        :param self: Self reference
+        :type self:  
+        :param updates: Latest (parameter, value, time) by parameter name
+        :type updates: dict[str, tuple[Parameter, MixedParameterValue, SpecificTime]]
+        '''
+        if not self._active:
+            return
+        if self.grouped:
+            self.callback({name: update[1] for name, update in updates.items()})
+        else:
+            for parameter, value, time in updates.values():
+                self.callback(parameter, value, time)
+
+class SubscriptionDispatcher(object):
+    '''Delivers subscription updates on a dedicated thread.  Updates queued
+    while callbacks run are delivered together in the next batch; within a
+    batch, only the latest value of each Parameter is delivered.  Samples
+    held back by a minimum interval are released by the same thread when
+    their interval ends.
+    '''
+    def __init__(self, maxBatch:int=1000):
+        '''
+        SubscriptionDispatcher constructor
+
+        :param self: Self reference
+        :type self:  
+        :param maxBatch: Maximum number of queued updates per batch
+        :type maxBatch: int
+        '''
+        self.maxBatch = maxBatch
+        self._queue:queue.SimpleQueue = queue.SimpleQueue()
+        self._thread:threading.Thread | None = None
+        self._lock = threading.Lock()
+        # (due monotonic nanoseconds, sequence, subscription, parameter name),
+        # only used by the dispatcher thread
+        self._releases:list[tuple[int, int, Subscription, str]] = list()
+        self._sequence = itertools.count()
+
+    def submit(self, subscription:Subscription, parameter:Any, value:Any, time:Any) -> None:
+        '''
+        Queues an update for delivery, starting the dispatcher thread if needed
+
+        :param self: Self reference
+        :type self:  
+        :param subscription: Subscription to deliver to
+        :type subscription: Subscription
+        :param parameter: Updated Parameter
+        :type parameter: Parameter
+        :param value: New value
+        :type value: MixedParameterValue
+        :param time: Sample time
+        :type time: SpecificTime
+        '''
+        if self._thread is None:
+            self._start()
+        self._queue.put((subscription, parameter, value, time))
+
+    def submitMany(self, updates:list[tuple[Subscription, Any, Any, Any]]) -> None:
+        '''
+        Queues several updates so that they are delivered in the same batch
+
+        :param self: Self reference
+        :type self:  
+        :param updates: List of (subscription, parameter, value, time)
+        :type updates: list[tuple[Subscription, Parameter, MixedParameterValue, SpecificTime]]
+        '''
+        if self._thread is None:
+            self._start()
+        self._queue.put(updates)
+
+    def release(self, subscription:Subscription, name:str, due:int) -> None:
+        '''
+        Asks for the sample held back by a subscription to be delivered at
+        a time of the monotonic clock
+
+        :param self: Self reference
+        :type self:  
+        :param subscription: Subscription holding the sample
+        :type subscription: Subscription
+        :param name: Parameter name
+        :type name: str
+        :param due: Monotonic clock time in nanoseconds
+        :type due: int
+        '''
+        if self._thread is None:
+            self._start()
+        self._queue.put(_Release(subscription, name, due))
+
+    def flush(self, timeout:float | None=None) -> bool:
+        '''
+        Waits until all updates queued before the call have been delivered.
+        Returns False if the timeout expired first.
+
+        :param self: Self reference
+        :type self:  
+        :param timeout: Maximum seconds to wait (optional)
+        :type timeout: float | None
+        '''
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def _start(self) -> None:
+        '''
+        Starts the dispatcher thread
+
+        :param self: Self reference
+        :type self:  
+        '''
+        with self._lock:
+            if self._thread is None:
+                thread = threading.Thread(target=self._run, name='SubscriptionDispatcher', daemon=True)
+                thread.start()
+                self._thread = thread
+
+    def _run(self) -> None:
+        '''
+        Dispatcher thread main loop
+
+        :param self: Self reference
+        :type self:  
+        '''
+        releases = self._releases
+        while True:
+            batch:list[Any] = list()
+            try:
+                if releases:
+                    wait = max(0, releases[0][0] - _monotonicNanos()) / 1e9
+                    batch.append(self._queue.get(timeout=wait))
+                else:
+                    batch.append(self._queue.get())
+            except queue.Empty:
+                pass
+            while batch and len(batch) < self.maxBatch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            pending:dict[Subscription, dict[str, tuple[Any, Any, Any]]] = dict()
+            flushed:list[threading.Event] = list()
+            updates:list[tuple[Subscription, Any, Any, Any]] = list()
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    flushed.append(item)
+                elif isinstance(item, _Release):
+                    heapq.heappush(releases, (item.due, next(self._sequence), item.subscription, item.name))
+                elif isinstance(item, list):
+                    updates.extend(item)
+                else:
+                    updates.append(item)
+            now = _monotonicNanos()
+            while releases and releases[0][0] <= now:
+                _, _, subscription, name = heapq.heappop(releases)
+                held = subscription._release(name)
+                if held is not None:
+                    updates.append((subscription,) + held)
+            for subscription, parameter, value, time in updates:
+                pending.setdefault(subscription, dict())[parameter.name()] = (parameter, value, time)
+            for subscription, latest in pending.items():
+                try:
+                    subscription.deliver(latest)
+                except Exception:
+                    log.exception('Subscription callback failed')
+            for done in flushed:
+                done.set()
+
+class _Release(object):
+    '''Request to deliver a held sample when its minimum interval ends'''
+    __slots__ = ('subscription', 'name', 'due')
+
+    def __init__(self, subscription:Subscription, name:str, due:int):
+        '''
+        Release constructor
+
+        :param self: Self reference
+        :type self:  
+        :param subscription: Subscription holding the sample
+        :type subscription: Subscription
+        :param name: Parameter name of the held sample
+        :type name: str
+        :param due: Monotonic clock in nanoseconds at which the minimum interval ends
+        :type due: int
+        '''
+        self.subscription = subscription
+        self.name = name
+        self.due = due
+
+def _monotonicNanos() -> int:
+    '''
+    Returns the monotonic clock in nanoseconds
+    '''
+    return time.monotonic_ns()
+
+_dispatcher:SubscriptionDispatcher | None = None
+_dispatcherLock = threading.Lock()
+
+def subscriptionDispatcher() -> SubscriptionDispatcher:
+    '''Returns the shared dispatcher used by subscriptions that do not
+    provide their own.
+    '''
+    global _dispatcher
+    with _dispatcherLock:
+        if _dispatcher is None:
+            _dispatcher = SubscriptionDispatcher()
+    return _dispatcher
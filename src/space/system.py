@@ -3,26 +3,33 @@ Implements Space Python language functions
 '''
 __author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm), Brad Kizzort'
 __copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
-import inspect
+from typing import Any
+from . import journals
 from .errors import VerifyError
+from .times import _callerFrame, _callerLine
 
-def verify(boolean:bool) -> bool:  #Normative
+def verify(boolean:bool, **values:Any) -> bool:  #Normative
     '''Verify(boolean)
     Returns True if boolean value is True,
     A False raises an exception which must be caught by procedure
-    if the procedure is to continue 
+    if the procedure is to continue.
+    Keyword values involved in the verification are recorded in the 
+    journal, if one is set.
     
     :param boolean: Verification function
     :type boolean: bool 
+    :param values: Values involved in the verification
+    :type values: Any 
     '''
     # The reasons for calling verify rather than a simple 
     # if not boolean:
     #     raise Exception
     # is that it allows the TT&C system to log the verification step and
     # provides a short-hand notation  
-    frame = inspect.stack()[1]   # Get the stack frame of the caller
-    line  = frame[0].f_lineno  # Get the local variables of the caller
-    del frame
+    if journals._journal is not None:
+        fields:dict[str, Any] = {'values': values} if values else {}
+        journals.journalStep('verify', bool(boolean), _callerFrame(), **fields)
     if not boolean:
-        raise VerifyError('Verify at line %d is False' % line)
-    return True
\ No newline at end of file
+        # Only a failed verify needs the line of the caller
+        raise VerifyError('Verify at line %d is False' % _callerLine())
+    return True
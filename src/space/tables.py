@@ -0,0 +1,501 @@
+'''
+ParameterTable is a columnar store for the parameters of an Asset.  The
+values, raw values and sample times of all parameters are held in parallel
+columns indexed by a slot number, and each Parameter is a small view onto
+one slot.
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+from array import array
+import threading
+from typing import Any, Callable, Iterable, Sequence
+from .constants import MixedParameterValue, NullableMixedParameterValue, getParameterFunction, isSupportedParameterType
+from .errors import IllegalValueError, UndefinedTypeError, UnknownParameterError
+from .histories import ParameterHistory
+from .indexes import NameIndex
+from .parameters import Parameter, Restriction, EnumerationR
+from .subscriptions import Subscription, SubscriptionDispatcher
+from .times import SpecificTime, nowNanos, notifyWaiters
+from .validators import FusedValidator, compileRestrictions
+
+# sample time of a parameter that has not been sampled
+NO_TIME = -0x8000000000000000
+
+class ParameterTable(object):
+    '''Columnar store of parameter definitions and samples.  Parameters are
+    added once and addressed by slot number; bulk reads copy a whole column.
+    '''
+    def __init__(self):
+        '''
+        ParameterTable constructor
+
+        :param self: Self reference
+        :type self:  
+        '''
+        self._index:dict[str, int] = dict()
+        self._names:list[str] = list()
+        self._types:list[str] = list()
+        self._converters:list[Callable[[Any], Any]] = list()
+        self._validators:list[FusedValidator] = list()
+        self._descriptions:list[str] = list()
+        self._units:list[str | None] = list()
+        self._values:list[NullableMixedParameterValue] = list()
+        self._raw:list[NullableMixedParameterValue] = list()
+        self._times = array('q')
+        self._views:list['TableParameter | None'] = list()
+        self._nameIndex = NameIndex()
+        # sparse columns, only populated for some parameters
+        self._histories:dict[int, ParameterHistory] = dict()
+        self._subscriptions:dict[int, tuple[Subscription, ...]] = dict()
+        # serializes writers so that batches are applied as a whole
+        self._lock = threading.Lock()
+
+    def add(self, name:str, type:str, description:str='', units:str | None=None,
+            restriction:list[Restriction]=list(), value:NullableMixedParameterValue=None) -> int:
+        '''
+        Adds a parameter definition and returns its slot number
+
+        :param self: Self reference
+        :type self:  
+        :param name: Parameter name
+        :type name: str
+        :param type: Data type
+        :type type: str
+        :param description: Description (optional)
+        :type description: str
+        :param units: Engineering units (optional)
+        :type units: str | None
+        :param restriction: Value restrictions (optional)
+        :type restriction: list[Restriction]
+        :param value: Initial value (optional)
+        :type value: NullableMixedParameterValue
+        '''
+        if not isSupportedParameterType(type):
+            raise UndefinedTypeError('Could not create parameter of data type <{0}>'.format(type))
+        if name in self._index:
+            raise IllegalValueError('Parameter {0} is already defined'.format(name))
+        slot = len(self._names)
+        self._index[name] = slot
+        self._names.append(name)
+        self._types.append(type)
+        self._converters.append(getParameterFunction(type))
+        self._validators.append(compileRestrictions(restriction))
+        self._descriptions.append(description)
+        self._units.append(units)
+        self._values.append(value)
+        self._raw.append(None)
+        self._times.append(NO_TIME)
+        self._views.append(None)
+        self._nameIndex.add(name)
+        return slot
+
+    def __len__(self) -> int:
+        '''
+        Returns the number of parameters
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return len(self._names)
+
+    def slot(self, name:str) -> int | None:
+        '''
+        Returns the slot number of a parameter, or None if it is not defined
+
+        :param self: Self reference
+        :type self:  
+        :param name: Parameter name
+        :type name: str
+        '''
+        return self._index.get(name, None)
+
+    def parameter(self, name:str) -> 'TableParameter | None':
+        '''
+        Returns the Parameter view of a parameter, or None if it is not defined
+
+        :param self: Self reference
+        :type self:  
+        :param name: Parameter name
+        :type name: str
+        '''
+        slot = self._index.get(name, None)
+        if slot is None:
+            return None
+        view = self._views[slot]
+        if view is None:
+            view = self._views[slot] = TableParameter(self, slot)
+        return view
+
+    def names(self) -> list[str]:
+        '''
+        Returns the parameter names in slot order
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return self._names[:]
+
+    def find(self, pattern:str='', glob:bool=False) -> list[str]:
+        '''
+        Returns the names of the parameters matched by a regular expression
+        (from the start of the name, as with re.match) or a glob pattern,
+        in slot order.  Queries use the name index and are memoized.
+
+        :param self: Self reference
+        :type self:  
+        :param pattern: Regular expression or glob pattern
+        :type pattern: str
+        :param glob: True if the pattern is a glob pattern
+        :type glob: bool
+        '''
+        if glob:
+            return self._nameIndex.glob(pattern)
+        return self._nameIndex.match(pattern)
+
+    def values(self, names:Iterable[str] | None=None) -> list[NullableMixedParameterValue]:
+        '''
+        Returns the current values of the named parameters, or of all
+        parameters in slot order
+
+        :param self: Self reference
+        :type self:  
+        :param names: Parameter names (optional)
+        :type names: Iterable[str] | None
+        '''
+        if names is None:
+            return self._values[:]
+        values = self._values
+        index = self._index
+        return [values[index[name]] for name in names]
+
+    def times(self) -> array:
+        '''
+        Returns the sample times of all parameters in slot order, as
+        nanoseconds since the epoch (NO_TIME if not sampled)
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return array('q', self._times)
+
+    def snapshot(self) -> dict[str, NullableMixedParameterValue]:
+        '''
+        Returns a dictionary of parameter name to current value
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return dict(zip(self._names, self._values))
+
+    def setValue(self, slot:int, value:MixedParameterValue, raw:NullableMixedParameterValue=None) -> None:
+        '''
+        Converts, validates and stores a new value, then records it in the
+        history of the parameter and offers it to the subscriptions
+
+        :param self: Self reference
+        :type self:  
+        :param slot: Slot number
+        :type slot: int
+        :param value: New value
+        :type value: MixedParameterValue
+        :param raw: New raw value (optional)
+        :type raw: NullableMixedParameterValue
+        '''
+        value = self._converters[slot](value)
+        validator = self._validators[slot]
+        if not validator.validate(value):
+            raise IllegalValueError('Violates restriction {0}'.format(validator.violation(value)))
+        with self._lock:
+            nanos = nowNanos()
+            self._values[slot] = value
+            if raw is not None:
+                self._raw[slot] = raw
+            self._times[slot] = nanos
+            history = self._histories.get(slot, None)
+            if history is not None:
+                history.append(value, nanos)
+        self._publish([slot], [value], nanos)
+
+    def setValues(self, names:Sequence[str], values:Sequence[MixedParameterValue]) -> None:
+        '''
+        Sets the values of several parameters as one update.  Every value is
+        converted and validated before any is stored, so either all values
+        are set or, if any is invalid, none are.  All values share one sample
+        time and are offered to subscriptions together.
+
+        :param self: Self reference
+        :type self:  
+        :param names: Parameter names
+        :type names: Sequence[str]
+        :param values: New values, in the same order as names
+        :type values: Sequence[MixedParameterValue]
+        '''
+        if len(names) != len(values):
+            raise IllegalValueError('{0} names provided for {1} values'.format(len(names), len(values)))
+        index = self._index
+        slots = [index.get(name, -1) for name in names]
+        unknown = [name for name, slot in zip(names, slots) if slot < 0]
+        if unknown:
+            raise UnknownParameterError('Parameters not defined: {0}'.format(', '.join(unknown)))
+        converters = self._converters
+        converted = [converters[slot](value) for slot, value in zip(slots, values)]
+        validators = self._validators
+        errors:list[str] = list()
+        for slot, value in zip(slots, converted):
+            validator = validators[slot]
+            if not validator.validate(value):
+                errors.append('{0} violates restriction {1}'.format(self._names[slot], validator.violation(value)))
+        if errors:
+            raise IllegalValueError('; '.join(errors))
+        histories = self._histories
+        with self._lock:
+            nanos = nowNanos()
+            for slot, value in zip(slots, converted):
+                self._values[slot] = value
+                self._times[slot] = nanos
+                if histories:
+                    history = histories.get(slot, None)
+                    if history is not None:
+                        history.append(value, nanos)
+        self._publish(slots, converted, nanos)
+
+    def _publish(self, slots:list[int], values:list[MixedParameterValue], nanos:int) -> None:
+        '''
+        Offers new values to the subscriptions of the parameters and wakes
+        the wait scheduler.  Called after the values have been stored and
+        recorded in the histories under the lock, so that samples reach the
+        columns and histories in sample time order.
+
+        :param self: Self reference
+        :type self:  
+        :param slots: Slot numbers
+        :type slots: list[int]
+        :param values: New values
+        :type values: list[MixedParameterValue]
+        :param nanos: Sample time in nanoseconds since the epoch
+        :type nanos: int
+        '''
+        subscriptions = self._subscriptions
+        if subscriptions:
+            time = SpecificTime.fromClockNanos(nanos)
+            # updates of one batch are handed to each dispatcher together
+            updates:dict[SubscriptionDispatcher, list[tuple[Subscription, Any, Any, Any]]] = dict()
+            for slot, value in zip(slots, values):
+                offered = subscriptions.get(slot, None)
+                if offered:
+                    view = self.parameter(self._names[slot])
+                    for subscription in offered:
+                        if subscription.accept(view, value, time):
+                            updates.setdefault(subscription.dispatcher(), list()).append((subscription, view, value, time))
+            for dispatcher, batch in updates.items():
+                dispatcher.submitMany(batch)
+        notifyWaiters()
+
+class TableParameter(Parameter):
+    '''Parameter view onto one slot of a ParameterTable.  It holds only the
+    table reference and the slot number.
+    '''
+    __slots__ = ('_table', '_slot')
+
+    def __init__(self, table:ParameterTable, slot:int):
+        '''
+        TableParameter constructor
+
+        :param self: Self reference
+        :type self:  
+        :param table: Table holding the parameter
+        :type table: ParameterTable
+        :param slot: Slot number
+        :type slot: int
+        '''
+        self._table = table
+        self._slot  = slot
+
+    def value(self) -> NullableMixedParameterValue:
+        '''Return the current value of the Parameter or None if no value has been
+        reported
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return self._table._values[self._slot]
+
+    def raw(self) -> NullableMixedParameterValue:
+        '''Return the current raw value of the Parameter or None if no value has
+        been reported
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return self._table._raw[self._slot]
+
+    def name(self) -> str:
+        '''Returns the name of the Parameter.
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return self._table._names[self._slot]
+
+    def setValue(self, value:MixedParameterValue) -> None:
+        '''Set the value of the Parameter, validating against any restrictions.
+        This method will raise an exception if the new value does not meet the
+        restrictions on the Parameter value.
+
+        :param self: Self reference
+        :type self:  
+        :param value: Value
+        :type value: MixedParameterValue
+        '''
+        self._table.setValue(self._slot, value)
+
+    def sample(self) -> dict[str, MixedParameterValue]:
+        '''Return a dictionary of information about current sample, including
+        time and values.
+
+        :param self: Self reference
+        :type self:  
+        '''
+        out:dict[str, MixedParameterValue] = dict()
+        value = self._table._values[self._slot]
+        if value is not None:
+            out["value"] = value
+        nanos = self._table._times[self._slot]
+        if nanos != NO_TIME:
+            out["time"] = SpecificTime.fromClockNanos(nanos)
+        return out
+
+    def type(self) -> str:
+        '''Returns the data type of the Parameter.
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return self._table._types[self._slot]
+
+    def description(self) -> str:
+        '''Returns the description of the Parameter.
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return self._table._descriptions[self._slot]
+
+    def units(self) -> str | None:
+        '''Returns the engineering units of the Parameter, if any.
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return self._table._units[self._slot]
+
+    def history(self) -> ParameterHistory | None:
+        '''Returns the sample history of the Parameter, or None if history
+        has not been enabled.
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return self._table._histories.get(self._slot, None)
+
+    def enableHistory(self, capacity:int) -> ParameterHistory:
+        '''Enables retention of the most recent samples of the Parameter and
+        returns the history.  An existing history that is at least as large
+        is kept; a smaller one is replaced by a larger copy of its samples.
+
+        :param self: Self reference
+        :type self:  
+        :param capacity: Number of samples to retain
+        :type capacity: int
+        '''
+        enumeration = self.enumeration()
+        # under the table lock so that no sample is appended to the old
+        # history while it is copied
+        with self._table._lock:
+            history = self.history()
+            if history is None:
+                history = ParameterHistory.forType(self.type(), capacity, enumeration)
+            elif history.capacity() < capacity:
+                history = history.resized(capacity)
+            else:
+                return history
+            self._table._histories[self._slot] = history
+        return history
+
+    def enumeration(self) -> EnumerationR | None:
+        '''Returns the enumeration restricting the values of the Parameter, or
+        None.
+
+        :param self: Self reference
+        :type self:  
+        '''
+        for restriction in self._table._validators[self._slot].restrictions:
+            if isinstance(restriction, EnumerationR):
+                return restriction
+        return None
+
+    def notifySubscribers(self, value:MixedParameterValue, time:SpecificTime | int) -> None:
+        '''Offers a new sample to the subscriptions of the Parameter and 
+        wakes the wait scheduler.
+
+        :param self: Self reference
+        :type self:  
+        :param value: New value
+        :type value: MixedParameterValue
+        :param time: Sample time, or nanoseconds since the epoch
+        :type time: SpecificTime | int
+        '''
+        subscriptions = self._table._subscriptions.get(self._slot, ())
+        if subscriptions:
+            if isinstance(time, int):
+                time = SpecificTime.fromClockNanos(time)
+            for subscription in subscriptions:
+                subscription.offer(self, value, time)
+        notifyWaiters()
+
+    def _attach(self, subscription:Subscription) -> None:
+        '''Adds a subscription to the Parameter.
+
+        :param self: Self reference
+        :type self:  
+        :param subscription: Subscription
+        :type subscription: Subscription
+        '''
+        subscriptions = self._table._subscriptions
+        subscriptions[self._slot] = subscriptions.get(self._slot, ()) + (subscription,)
+
+    def _detach(self, subscription:Subscription) -> None:
+        '''Removes a subscription from the Parameter.
+
+        :param self: Self reference
+        :type self:  
+        :param subscription: Subscription
+        :type subscription: Subscription
+        '''
+        subscriptions = self._table._subscriptions
+        remaining = tuple(s for s in subscriptions.get(self._slot, ()) if s is not subscription)
+        if remaining:
+            subscriptions[self._slot] = remaining
+        else:
+            subscriptions.pop(self._slot, None)
+
+    def __str__(self) -> str:
+        '''
+        Returns the current value as a string
+
+        :param self: Self reference
+        :type self:  
+        '''
+        value = self.value()
+        if value is not None:
+            return str(value)
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        '''
+        Returns class representation
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return 'Parameter({0}, dType={1})'.format(self.name(), self.type())
@@ -5,15 +5,180 @@ they are a thin veneer on the Python datetime types.
 '''
 __author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm), Brad Kizzort'
 __copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
-import inspect
+import inspect, sys
 import datetime, time
+from types import FrameType
+import functools, re, warnings
+from . import correlations, journals
+from .arrays import np, requireNumpy
 from .errors import TimeoutError
-from typing import Callable
+from typing import Any, Callable, Iterable, TYPE_CHECKING
+if TYPE_CHECKING:
+    from .correlations import ClockCorrelation
+    from .schedulers import WaitScheduler
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_NANOS_PER_SECOND = 1000000000
+
+# Number of parsed time strings kept by the fromStr caches
+PARSE_CACHE_SIZE = 1024
+
+# Default string formats of SpecificTime and TimeInterval
+_TIME_FORMAT = '%04d-%02d-%02dT%02d:%02d:%02d.%06d'
+_INTERVAL_FORMAT = '%dT%02d:%02d:%02d.%06d'
+
+# Digits after the microseconds of an ISO 8601 time
+_SUBMICROSECONDS = re.compile(r'[.,]\d{6}(\d{1,3})')
+
+# [s][D]T[HH:][MM:]SS[.NNNNNNNNN], see TimeInterval.fromStr
+_INTERVAL = re.compile(r'([-+])?(?:(\d+)T)?(?:(?:(\d*):)?(\d*):)?(\d*)(?:\.(\d+))?')
+
+def toNanos(value:datetime.datetime | datetime.timedelta | int) -> int:
+    '''Returns a time as integer nanoseconds since the epoch or an interval 
+    as integer nanoseconds.  Times without a time zone are taken as UTC.  
+    Integers are returned unchanged.
+    
+    :param value: Time, interval or nanoseconds
+    :type value: SpecificTime | TimeInterval | datetime | timedelta | int
+    '''
+    if isinstance(value, (SpecificTime, TimeInterval)):
+        return value.toNanos()
+    if isinstance(value, datetime.datetime):
+        offset = value.utcoffset()
+        if offset is not None:
+            value = value.replace(tzinfo=None) - offset
+        value = value - _EPOCH
+    if isinstance(value, datetime.timedelta):
+        return (value.days*86400 + value.seconds)*_NANOS_PER_SECOND + value.microseconds*1000
+    return int(value)
+
+def _intervalFields(strval:str) -> tuple[int, int, int]:
+    '''Parses a TimeInterval string, see TimeInterval.fromStr, and returns 
+    the days, seconds and nanoseconds of the interval.  Fields are taken 
+    from the right as seconds, minutes and hours, a bare number is taken as 
+    hours, and a negative sign applies to the days when present.
+    
+    :param strval: Input time string
+    :type strval: str 
+    '''
+    strval = strval.strip()
+    match = _INTERVAL.fullmatch(strval)
+    if match is None or len(strval) == 0:
+        raise ValueError('Invalid time interval <{0}>'.format(strval))
+    sign, days, hours, mins, secs, fraction = match.groups()
+    if mins is None:
+        # Without a colon the number is hours: HH[.NNNNNNNNN]
+        hours, secs = secs, None
+    elif hours is None:
+        # With one colon the fields are HH:SS
+        hours, mins = mins, None
+    if secs == '' or mins == '':
+        raise ValueError('Invalid time interval <{0}>'.format(strval))
+    nsecs = 0
+    if fraction is not None:
+        nsecs = int(fraction[:9].ljust(9, '0'))
+    seconds = int(hours or 0)*3600 + int(mins or 0)*60 + int(secs or 0)
+    days = int(days or 0)
+    if sign == '-':
+        if days == 0:
+            return 0, -seconds, nsecs
+        days = -days
+    return days, seconds, nsecs
+
+def _intervalNanos(strval:str) -> int:
+    '''Parses a TimeInterval string to integer nanoseconds
+    
+    :param strval: Input time string
+    :type strval: str 
+    '''
+    days, secs, nsecs = _intervalFields(strval)
+    return (days*86400 + secs)*_NANOS_PER_SECOND + nsecs
+
+class Clock(object):
+    '''Source of the current time, as integer nanoseconds since the epoch.  
+    This clock reads the system wall clock, so it follows any step applied 
+    to the system time.
+    '''
+    def nanos(self) -> int:
+        '''Return the current time in nanoseconds since the epoch
+        
+        :param self: Self reference
+        :type self:  
+        '''
+        return time.time_ns()
+
+class MonotonicClock(Clock):
+    '''Clock that reads the monotonic clock, offset to the wall clock when 
+    created or resynchronized.  Time never steps backwards or jumps when the 
+    system time is stepped, e.g. by NTP; call resync() to realign.
+    '''
+    def __init__(self):
+        '''
+        MonotonicClock constructor
+        
+        :param self: Self reference
+        :type self:  
+        '''
+        self.resync()
+    def resync(self) -> None:
+        '''Realign the clock with the system wall clock
+        
+        :param self: Self reference
+        :type self:  
+        '''
+        self._offset = time.time_ns() - time.monotonic_ns()
+    def nanos(self) -> int:
+        '''Return the current time in nanoseconds since the epoch
+        
+        :param self: Self reference
+        :type self:  
+        '''
+        return time.monotonic_ns() + self._offset
+
+_clock:Clock = MonotonicClock()
+
+def setClock(clock:Clock) -> Clock:
+    '''Replace the clock used for SpecificTime.now() and nowNanos(), 
+    returning the previous clock.
+    
+    :param clock: New clock
+    :type clock: Clock
+    '''
+    global _clock
+    previous = _clock
+    _clock = clock
+    return previous
+
+def nowNanos() -> int:
+    '''Return the current time as integer nanoseconds since the epoch.  This 
+    is the cheapest way to timestamp a sample; build a SpecificTime with 
+    SpecificTime.fromClockNanos only when it is needed.
+    '''
+    return _clock.nanos()
+
+def clockNanos(value:datetime.datetime | int) -> int:
+    '''Returns a sample time as integer nanoseconds since the epoch, as read 
+    from the clock.  Times without a time zone are taken as local time, the 
+    basis of SpecificTime.now() and SpecificTime.fromClockNanos().  Integers 
+    are returned unchanged.
+    
+    :param value: Sample time or nanoseconds
+    :type value: SpecificTime | datetime | int
+    '''
+    if isinstance(value, datetime.datetime) and value.tzinfo is None:
+        offset = value.astimezone().utcoffset()
+        if offset is not None:
+            return toNanos(value) - toNanos(offset)
+    return toNanos(value)
 
 class SpecificTime(datetime.datetime):  #Normative
     '''SpecificTime(year, month, day[, hour[, minute[, second[, microsecond]]])
     Represents a specific time for timetags and time expressions
     '''
+    # nanoseconds below the microsecond resolution of datetime
+    _extraNanos = 0
+    # nanoseconds since the epoch, set by toNanos() and fromNanos()
+    _epochNanos:int
     def dayOfYear(self) -> int:
         '''Return the day of the year with January 1 as 1.
         
@@ -27,7 +192,24 @@ class SpecificTime(datetime.datetime):  #Normative
         :param self: Self reference
         :type self:  
         '''
-        return self.microsecond*1000
+        return self.microsecond*1000 + self._extraNanos
+    def toNanos(self) -> int:
+        '''Return the time as integer nanoseconds since the epoch.  A time 
+        without a time zone is taken as UTC.  The value is computed once and 
+        cached.
+        
+        :param self: Self reference
+        :type self:  
+        '''
+        try:
+            return self._epochNanos
+        except AttributeError:
+            offset = self.utcoffset()
+            t = self.replace(tzinfo=None) - offset if offset is not None else self
+            delta = datetime.datetime.__sub__(t, _EPOCH)
+            self._epochNanos = (delta.days*86400 + delta.seconds)*_NANOS_PER_SECOND \
+                               + delta.microseconds*1000 + self._extraNanos
+            return self._epochNanos
     @classmethod
     def today(cls) -> 'SpecificTime':
         '''
@@ -46,32 +228,168 @@ class SpecificTime(datetime.datetime):  #Normative
         :type cls:  
         :param tz: Time zone
         :type tz:  '''
-        t = datetime.datetime.now(tz)
-        return cls(t.year, t.month, t.day, t.hour,  t.minute,\
-                   t.second, t.microsecond, tz)
+        return cls.fromClockNanos(_clock.nanos(), tz)
+    @classmethod
+    def fromClockNanos(cls, nanos:int, tz:datetime.tzinfo | None = None) -> 'SpecificTime':
+        '''
+        Returns the instance that now() returns when the clock reads nanos: 
+        local time without time zone information, or the time in tz.  Sample 
+        times are built this way so that they compare with now().
+        
+        :param cls: Class member
+        :type cls:  
+        :param nanos: Nanoseconds since the epoch
+        :type nanos: int
+        :param tz: Time zone
+        :type tz:  '''
+        # microseconds / 1e6 is within half a microsecond, so the rounding 
+        # in fromtimestamp gives the exact microsecond
+        t = cls.fromtimestamp((nanos // 1000) / 1e6, tz)
+        if nanos % 1000:
+            t._extraNanos = nanos % 1000
+        return t
+    @classmethod
+    def fromNanos(cls, nanos:int, tz:datetime.tzinfo | None = None) -> 'SpecificTime':
+        '''
+        Returns an instance for nanoseconds since the epoch, keeping the 
+        full nanosecond precision.  Without a time zone the result is UTC 
+        without time zone information, matching toNanos(); use 
+        fromClockNanos() for sample times compared with now().
+        
+        :param cls: Class member
+        :type cls:  
+        :param nanos: Nanoseconds since the epoch
+        :type nanos: int
+        :param tz: Time zone
+        :type tz:  '''
+        if tz is None:
+            t = cls(1970, 1, 1) + datetime.timedelta(microseconds=nanos // 1000)
+            if nanos % 1000:
+                t._extraNanos = nanos % 1000
+        else:
+            t = cls.fromClockNanos(nanos, tz)
+        t._epochNanos = nanos
+        return t
     @classmethod
+    @functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
     def fromStr(cls, strval:str) -> 'SpecificTime':
         '''Convert from a string representation to a SpecificTime
         Expected format:YYYY-MM-DDTHH:MM:SS.NNNNNN
         May optionally end with a timezone indicator, such as Z.
+        Up to nine fractional digits are kept.  Recently parsed strings 
+        are cached, so the same instance may be returned for equal strings.
         
         :param cls: Class member
         :type cls:  
         :param strval: Input time string
         :type strval: str  
         '''
-        t = datetime.datetime.fromisoformat(strval)
-        return cls(t.year, t.month, t.day, t.hour,  t.minute,\
-                   t.second, t.microsecond, t.tzinfo)
+        t = cls.fromisoformat(strval)
+        match = _SUBMICROSECONDS.search(strval)
+        if match is not None:
+            t._extraNanos = int(match.group(1).ljust(3, '0'))
+        return t
+    @classmethod
+    def parseMany(cls, values:Iterable[Any]) -> 'np.ndarray':
+        '''Convert a column of time strings, or datetimes, to a datetime64[ns]
+        array in UTC.  Requires NumPy.  Strings without a time zone are 
+        parsed by NumPy in one call; others are converted one at a time 
+        with fromStr.
+        
+        :param cls: Class member
+        :type cls:  
+        :param values: Input time strings
+        :type values: Iterable[str | datetime]
+        '''
+        np = requireNumpy('SpecificTime.parseMany')
+        values = list(values)
+        if all(isinstance(v, str) for v in values):
+            try:
+                with warnings.catch_warnings():
+                    # NumPy warns about, rather than rejects, time zones
+                    warnings.simplefilter('error')
+                    out = np.array(values, dtype='datetime64[ns]')
+                if not np.isnat(out).any():
+                    return out
+            except (ValueError, OverflowError, Warning):
+                pass
+        return np.array([toNanos(v if isinstance(v, datetime.datetime) else cls.fromStr(v))
+                         for v in values], dtype=np.int64).view('datetime64[ns]')
+    @classmethod
+    def fromSpacecraftClock(cls, count:float, correlation:'ClockCorrelation | None' = None) -> 'SpecificTime':
+        '''Returns the UTC time of a spacecraft clock count.  Without a 
+        correlation, the one set with setClockCorrelation is used.
+        
+        :param cls: Class member
+        :type cls:  
+        :param count: Spacecraft clock count
+        :type count: float 
+        :param correlation: Clock correlation (optional)
+        :type correlation: ClockCorrelation | None 
+        '''
+        if correlation is None:
+            correlation = correlations.clockCorrelation()
+        return cls.fromNanos(correlation.toNanos(count))
+    def toSpacecraftClock(self, correlation:'ClockCorrelation | None' = None) -> float:
+        '''Returns the spacecraft clock count at this UTC time.  Without a 
+        correlation, the one set with setClockCorrelation is used.
+        
+        :param self: Self reference
+        :type self:  
+        :param correlation: Clock correlation (optional)
+        :type correlation: ClockCorrelation | None 
+        '''
+        if correlation is None:
+            correlation = correlations.clockCorrelation()
+        return correlation.fromNanos(self.toNanos())
+    @classmethod
+    def fromTimeScale(cls, value:'datetime.datetime | int', scale:str) -> 'SpecificTime':
+        '''Returns the UTC time of a time read in another time scale, such 
+        as TAI, GPS or TT.
+        
+        :param cls: Class member
+        :type cls:  
+        :param value: Time in the time scale, or nanoseconds since the epoch
+        :type value: datetime | int 
+        :param scale: Time scale of the value
+        :type scale: str 
+        '''
+        return cls.fromNanos(correlations.convertTimeScale(toNanos(value), scale, 'UTC'))
+    def toTimeScale(self, scale:str) -> 'SpecificTime':
+        '''Returns this UTC time as read in another time scale, such as TAI, 
+        GPS or TT.  Times without a time zone are taken as UTC.
+        
+        :param self: Self reference
+        :type self:  
+        :param scale: Time scale of the result
+        :type scale: str 
+        '''
+        return SpecificTime.fromNanos(correlations.convertTimeScale(self.toNanos(), 'UTC', scale))
     def __str__(self) -> str:
         '''Converts a SpecificTime to the default string format
         '''
-        return self.strftime('%Y-%m-%dT%H:%M:%S.%f')
+        return _TIME_FORMAT % (self.year, self.month, self.day, self.hour, 
+                               self.minute, self.second, self.microsecond)
+    @classmethod
+    def formatMany(cls, values:Any) -> 'np.ndarray':
+        '''Converts a column of times, such as a datetime64 array, to strings 
+        in the default string format.  Requires NumPy.  Times are truncated 
+        to microseconds and missing times (NaT) are returned as 'NaT'.
+        
+        :param cls: Class member
+        :type cls:  
+        :param values: Input times
+        :type values: np.ndarray | Iterable[datetime]
+        '''
+        np = requireNumpy('SpecificTime.formatMany')
+        return np.datetime_as_string(np.asarray(values).astype('datetime64[us]'), unit='us')
     
 class TimeInterval(datetime.timedelta):  #Normative
     '''TimeInterval([days[, seconds[, microseconds[, milliseconds[, minutes[, hours[, weeks]]]]]]]) 
     Represents a positive (future) or negative (elapsed) relative time interval for time expressions
     '''
+    # nanoseconds below the microsecond resolution of timedelta
+    _extraNanos = 0
     def asSeconds(self) -> float:
         '''Return entire interval as seconds
         
@@ -85,72 +403,279 @@ class TimeInterval(datetime.timedelta):  #Normative
         :param self: Self reference
         :type self:          
         '''
-        return self.microseconds*1000
+        return self.microseconds*1000 + self._extraNanos
+    def toNanos(self) -> int:
+        '''Return entire interval as integer nanoseconds
+        
+        :param self: Self reference
+        :type self:          
+        '''
+        return (self.days*86400 + self.seconds)*_NANOS_PER_SECOND \
+               + self.microseconds*1000 + self._extraNanos
+    @classmethod
+    def fromNanos(cls, nanos:int) -> 'TimeInterval':
+        '''Returns an instance for an interval in nanoseconds, keeping the 
+        full nanosecond precision
+        
+        :param cls: Class reference
+        :type cls:  
+        :param nanos: Interval in nanoseconds
+        :type nanos: int
+        '''
+        dt = cls(microseconds=nanos // 1000)
+        if nanos % 1000:
+            dt._extraNanos = nanos % 1000
+        return dt
     @classmethod
+    @functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
     def fromStr(cls, strval:str) -> 'TimeInterval':
         '''Convert from a string representation to a TimeInterval
         Expected format:[s]DTHH:MM:SS.NNNNNNNNN
+        Recently parsed strings are cached, so the same instance may be 
+        returned for equal strings.
         
         :param cls: Class reference
         :type cls:  
         :param strval: Input time string
         :type strval: str 
         '''
-        isNegative = False
-        days = hours = mins = secs = nsecs = 0        
-        s = strval.strip()
-        if s[0] == '-':  # Check for leading sign in case days are zero
-            isNegative = True
-            s = s[1:]
-        elif s[0] == '+':
-            s = s[1:]
-        endOfDays = s.find('T')
-        if endOfDays > 0:
-            days = int(s[0:endOfDays])
-            s = s[endOfDays+1:]
-            if isNegative:
-                days = -days
-        beg = s.rfind('.')
-        if beg >= 0:
-            digits = len(s) - beg - 1
-            digits = min(9, digits)
-            nsecs = int(s[beg+1:beg+digits+1])
-            nsecs = nsecs * (10**(9-digits))
-            s = s[0:beg]
-        beg = s.rfind(':')
-        if beg >= 0:
-            secs = int(s[beg+1:])
-            s = s[0:beg]
-        beg = s.rfind(':')
-        if beg >= 0:
-            mins = int(s[beg+1:])
-            s = s[0:beg]
-        if len(s) > 0:
-            hours = int(s)
-        secs = hours*3600 + mins*60 + secs
-        if days == 0 and isNegative:
-            dt = cls(seconds=-secs, microseconds=nsecs/1000)
-        else:
-            dt = cls(days, seconds=secs, microseconds=nsecs/1000)
+        days, secs, nsecs = _intervalFields(strval)
+        dt = cls(days, seconds=secs, microseconds=nsecs//1000)
+        if nsecs % 1000:
+            dt._extraNanos = nsecs % 1000
         return dt
+    @classmethod
+    def parseMany(cls, values:Iterable[Any]) -> 'np.ndarray':
+        '''Convert a column of interval strings, or timedeltas, to a 
+        timedelta64[ns] array.  Requires NumPy.  Each distinct string is 
+        parsed once.
+        
+        :param cls: Class reference
+        :type cls:  
+        :param values: Input interval strings
+        :type values: Iterable[str | timedelta]
+        '''
+        np = requireNumpy('TimeInterval.parseMany')
+        values = list(values)
+        if len(values) > 0 and all(isinstance(v, str) for v in values):
+            unique, inverse = np.unique(np.array(values, dtype=str), return_inverse=True)
+            nanos = np.array([_intervalNanos(v) for v in unique.tolist()], dtype=np.int64)
+            return nanos[inverse].view('timedelta64[ns]')
+        return np.array([toNanos(v) if isinstance(v, datetime.timedelta) else _intervalNanos(v)
+                         for v in values], dtype=np.int64).view('timedelta64[ns]')
     def __str__(self) -> str:
         '''Converts a TimeInterval to the default string format
         
         :param self: Self reference
         :type self:  
         '''
-        seconds = self.seconds
-        hours   = int(seconds / 3600)
-        minutes = int((seconds % 3600) / 60)
-        seconds = seconds % 60
-        return '{0}T{1:02d}:{2:02d}:{3:02d}.{4:06d}' \
-          .format(self.days, hours, minutes, seconds,
-                  self.microseconds)
+        minutes, seconds = divmod(self.seconds, 60)
+        hours, minutes   = divmod(minutes, 60)
+        return _INTERVAL_FORMAT % (self.days, hours, minutes, seconds, self.microseconds)
+    @classmethod
+    def formatMany(cls, values:Any) -> 'np.ndarray':
+        '''Converts a column of intervals, such as a timedelta64 array, to 
+        strings in the default string format.  Requires NumPy.  Intervals 
+        are truncated to microseconds and missing intervals (NaT) are 
+        returned as 'NaT'.
+        
+        :param cls: Class reference
+        :type cls:  
+        :param values: Input intervals
+        :type values: np.ndarray | Iterable[timedelta]
+        '''
+        np = requireNumpy('TimeInterval.formatMany')
+        values = np.asarray(values)
+        if values.dtype.kind != 'm':
+            values = values.astype('timedelta64[us]')
+        missing = np.isnat(values)
+        micros = values.astype('timedelta64[us]').view(np.int64)
+        # floor division gives the same days and positive remainder as timedelta
+        days, micros = np.divmod(micros, 86400000000)
+        seconds, micros = np.divmod(micros, 1000000)
+        hours, seconds = np.divmod(seconds, 3600)
+        minutes, seconds = np.divmod(seconds, 60)
+        out = [_INTERVAL_FORMAT % fields for fields in 
+               zip(days.tolist(), hours.tolist(), minutes.tolist(), seconds.tolist(), micros.tolist())]
+        for i in np.flatnonzero(missing).tolist():
+            out[i] = 'NaT'
+        return np.array(out, dtype=str)
+
+_waitScheduler:'WaitScheduler | None' = None
+
+def setWaitScheduler(scheduler:'WaitScheduler | None') -> 'WaitScheduler | None':
+    '''Sets the scheduler that evaluates waitFor conditions, returning the 
+    previous one.  With None, each waitFor polls in its own thread.
+    
+    :param scheduler: Wait scheduler
+    :type scheduler: WaitScheduler | None
+    '''
+    global _waitScheduler
+    previous = _waitScheduler
+    _waitScheduler = scheduler
+    return previous
+
+def notifyWaiters() -> None:
+    '''Called by Parameter ingest paths after values change, so that an 
+    event driven wait scheduler can evaluate pending waitFor conditions at 
+    once.  A polling scheduler evaluates them on its own schedule.
+    '''
+    scheduler = _waitScheduler
+    if scheduler is not None and scheduler.eventDriven:
+        scheduler.wake()
+
+if hasattr(sys, '_getframe'):
+    _getframe = sys._getframe
+else:  # interpreters without sys._getframe
+    def _getframe(depth:int=0) -> FrameType:
+        '''Returns the frame depth levels above the caller, like sys._getframe
+        
+        :param depth: Number of frames above the caller
+        :type depth: int 
+        '''
+        frame = inspect.currentframe()
+        if frame is None:
+            raise ValueError('call stack is not available')
+        for _ in range(depth + 1):
+            frame = frame.f_back
+            if frame is None:
+                raise ValueError('call stack is not deep enough')
+        return frame
+
+def _callerFrame(depth:int=1) -> FrameType | None:
+    '''Returns the frame of a caller of the function calling this one; with 
+    a depth of 1, its immediate caller.  Returns None if the interpreter 
+    does not provide the frames.
+    
+    :param depth: Number of frames above the calling function
+    :type depth: int 
+    '''
+    try:
+        return _getframe(depth + 1)
+    except (AttributeError, ValueError):
+        return None
 
-def waitFor(boolean:Callable[[],bool], timeout:float=5, pollPeriod:float=0.1) -> bool:  #Normative
+def _callerLine(depth:int=1) -> int:
+    '''Returns the line number being executed by a caller of the function 
+    calling this one; with a depth of 1, its immediate caller.  Only the 
+    frame is looked up, so this is cheap enough to call on every verify.  
+    Returns 0 if the interpreter does not provide the frames.
+    
+    :param depth: Number of frames above the calling function
+    :type depth: int 
+    '''
+    frame = _callerFrame(depth + 1)
+    return frame.f_lineno if frame is not None else 0
+
+class WaitStatus(object):
+    '''Outcome of a wait for a condition: whether the condition was 
+    satisfied, the seconds waited and the number of times the condition was 
+    evaluated.
+    '''
+    __slots__ = ('satisfied', 'elapsed', 'polls')
+    def __init__(self, satisfied:bool, elapsed:float, polls:int):
+        '''
+        WaitStatus constructor
+        
+        :param self: Self reference
+        :type self:  
+        :param satisfied: True if the condition became true
+        :type satisfied: bool
+        :param elapsed: Seconds waited
+        :type elapsed: float
+        :param polls: Number of evaluations of the condition
+        :type polls: int
+        '''
+        self.satisfied = satisfied
+        self.elapsed   = elapsed
+        self.polls     = polls
+    def __repr__(self) -> str:
+        '''Returns class representation
+        
+        :param self: Self reference
+        :type self:  
+        '''
+        return 'WaitStatus(satisfied={0}, elapsed={1:.6f}, polls={2})'.format(self.satisfied, self.elapsed, self.polls)
+
+def _nextPollPeriod(pollPeriod:float, backoff:float, maxPollPeriod:float | None) -> float:
+    '''Returns the poll period after backing off
+    
+    :param pollPeriod: Current poll period in seconds
+    :type pollPeriod: float 
+    :param backoff: Factor applied to the poll period
+    :type backoff: float 
+    :param maxPollPeriod: Largest poll period in seconds (optional)
+    :type maxPollPeriod: float | None 
+    '''
+    pollPeriod *= backoff
+    if maxPollPeriod is not None and pollPeriod > maxPollPeriod:
+        return maxPollPeriod
+    return pollPeriod
+
+def _waitFor(boolean:Callable[[],bool], timeout:float, pollPeriod:float, 
+             backoff:float, maxPollPeriod:float | None) -> WaitStatus:
+    '''Waits for the condition until a time.monotonic() deadline, so the 
+    time taken by the condition itself counts against the timeout.  The last 
+    poll is made at the deadline.
+    
+    :param boolean: Verifier function
+    :type boolean: Callable[[],bool]
+    :param timeout: Timeout for the verifier in seconds
+    :type timeout: float 
+    :param pollPeriod: Initial polling interval in seconds
+    :type pollPeriod: float 
+    :param backoff: Factor applied to the polling interval after each poll
+    :type backoff: float 
+    :param maxPollPeriod: Largest polling interval in seconds (optional)
+    :type maxPollPeriod: float | None 
+    '''
+    start = time.monotonic()
+    deadline = start + timeout
+    polls = 1
+    if boolean() is True:
+        return WaitStatus(True, time.monotonic() - start, polls)
+    scheduler = _waitScheduler
+    if scheduler is not None and not scheduler.isSchedulerThread():
+        status = scheduler.waitForStatus(boolean, deadline - time.monotonic(), pollPeriod, backoff, maxPollPeriod)
+        return WaitStatus(status.satisfied, time.monotonic() - start, polls + status.polls)
+    while True:
+        now = time.monotonic()
+        if now >= deadline:
+            return WaitStatus(False, now - start, polls)
+        time.sleep(min(pollPeriod, deadline - now))
+        polls += 1
+        if boolean() is True:
+            return WaitStatus(True, time.monotonic() - start, polls)
+        pollPeriod = _nextPollPeriod(pollPeriod, backoff, maxPollPeriod)
+
+def _waitOutcome(status:WaitStatus, timeout:float, frame:FrameType | None, line:int | None=None) -> WaitStatus:
+    '''Journals a completed wait and raises TimeoutError naming the line of 
+    the procedure if the condition did not become true.
+    
+    :param status: Outcome of the wait
+    :type status: WaitStatus 
+    :param timeout: Timeout for the verifier in seconds
+    :type timeout: float 
+    :param frame: Frame of the procedure that waited
+    :type frame: FrameType | None 
+    :param line: Line of the wait, if the frame has moved on since (optional)
+    :type line: int | None 
+    '''
+    if journals._journal is not None:
+        journals.journalStep('waitFor', status.satisfied, frame, line, 
+                             elapsed=status.elapsed, polls=status.polls, timeout=timeout)
+    if not status.satisfied:
+        if line is None:
+            line = frame.f_lineno if frame is not None else 0
+        raise TimeoutError('Wait at line %d timed out' % line)
+    return status
+
+def waitFor(boolean:Callable[[],bool], timeout:float=5, pollPeriod:float=0.1, 
+            backoff:float=1.0, maxPollPeriod:float | None=None) -> bool:  #Normative
     '''Wait for the provided Boolean function to become true
 Default timeout of 5 seconds and default polling interval of 100 milliseconds 
-is used unless overridden in the call.
+is used unless overridden in the call.  With a backoff greater than 1, the 
+polling interval grows by that factor after each poll, up to maxPollPeriod.
     
     :param boolean: Verifier function
     :type boolean: Callable[[],bool]
@@ -158,18 +683,32 @@ is used unless overridden in the call.
     :type timeout: float 
     :param pollPeriod: Frequency of polling in seconds
     :type pollPeriod: float 
+    :param backoff: Factor applied to the polling interval after each poll
+    :type backoff: float 
+    :param maxPollPeriod: Largest polling interval in seconds (optional)
+    :type maxPollPeriod: float | None 
     '''
-    frame = inspect.stack()[1]
-    line = frame[0].f_lineno
-    del frame
-    while boolean() is not True:
-        if timeout <= 0.0:
-            raise TimeoutError('Wait at line %d timed out' % line)
-        else:
-            time.sleep(pollPeriod)
-            timeout -= pollPeriod
+    _waitOutcome(_waitFor(boolean, timeout, pollPeriod, backoff, maxPollPeriod), timeout, _callerFrame())
     return True
 
+def waitForStatus(boolean:Callable[[],bool], timeout:float=5, pollPeriod:float=0.1, 
+                  backoff:float=1.0, maxPollPeriod:float | None=None) -> WaitStatus:
+    '''Same as waitFor, but returns a WaitStatus with the seconds waited 
+    and the number of polls once the Boolean function is true.
+    
+    :param boolean: Verifier function
+    :type boolean: Callable[[],bool]
+    :param timeout: Timeout for the verifier in seconds
+    :type timeout: float 
+    :param pollPeriod: Frequency of polling in seconds
+    :type pollPeriod: float 
+    :param backoff: Factor applied to the polling interval after each poll
+    :type backoff: float 
+    :param maxPollPeriod: Largest polling interval in seconds (optional)
+    :type maxPollPeriod: float | None 
+    '''
+    return _waitOutcome(_waitFor(boolean, timeout, pollPeriod, backoff, maxPollPeriod), timeout, _callerFrame())
+
 def wait(seconds:float) -> None:  #Normative
     '''Wait for the specified number of seconds 
     
@@ -0,0 +1,165 @@
+'''
+The update coalescer refreshes parameters of several Assets at once.  Polls
+of different Assets run concurrently, and requests made for the same Asset
+while a poll is running are merged into its next poll.
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import concurrent.futures
+import threading
+from typing import Mapping, Sequence
+from .assets import Asset
+from .errors import TimeoutError
+from .parameters import Parameter
+
+class _Batch(object):
+    '''Parameter names waiting for the next poll of an Asset, with the names
+    and future of each requester'''
+    __slots__ = ('names', 'requests')
+
+    def __init__(self):
+        self.names:dict[str, None] = dict()
+        self.requests:list[tuple[list[str], concurrent.futures.Future]] = list()
+
+class UpdateCoalescer(object):
+    '''Runs Asset.updateParameters for many Assets through a thread pool.
+    Each Asset has at most one poll running.  Names requested while it runs
+    are collected, without duplicates, into a single next poll shared by all
+    the requesters, so every value a request waits for was polled after the
+    request was made.  If that poll fails and it was shared, each requester
+    is polled again with its own names, so an error such as an unknown name
+    only fails the requests that made it.
+    '''
+    def __init__(self, maxWorkers:int | None=None):
+        '''
+        UpdateCoalescer constructor
+
+        :param self: Self reference
+        :type self:  
+        :param maxWorkers: Maximum number of concurrent polls (optional)
+        :type maxWorkers: int | None
+        '''
+        self._executor = concurrent.futures.ThreadPoolExecutor(maxWorkers, thread_name_prefix='UpdateParameters')
+        self._lock = threading.Lock()
+        self._pending:dict[Asset, _Batch] = dict()
+        self._running:set[Asset] = set()
+
+    def request(self, asset:Asset, names:Sequence[str | Parameter]) -> concurrent.futures.Future:
+        '''
+        Adds the names to the next poll of the Asset and returns a future
+        completed when the names have been polled
+
+        :param self: Self reference
+        :type self:  
+        :param asset: Asset
+        :type asset: Asset
+        :param names: Parameters or parameter names
+        :type names: Sequence[str | Parameter]
+        '''
+        with self._lock:
+            batch = self._pending.get(asset, None)
+            if batch is None:
+                batch = self._pending[asset] = _Batch()
+            requested = [name if isinstance(name, str) else name.name() for name in names]
+            for name in requested:
+                batch.names[name] = None
+            future:concurrent.futures.Future = concurrent.futures.Future()
+            batch.requests.append((requested, future))
+            if asset not in self._running:
+                self._running.add(asset)
+                self._executor.submit(self._poll, asset)
+            return future
+
+    def update(self, requests:Mapping[Asset, Sequence[str | Parameter]], timeout:float | None=None) -> None:
+        '''
+        Refreshes the parameters of each Asset and waits until every poll
+        has completed.  The first error raised by a poll is raised again.
+
+        :param self: Self reference
+        :type self:  
+        :param requests: Parameters or parameter names to refresh for each Asset
+        :type requests: Mapping[Asset, Sequence[str | Parameter]]
+        :param timeout: Maximum seconds to wait (optional)
+        :type timeout: float | None
+        '''
+        futures = [self.request(asset, names) for asset, names in requests.items() if len(names) > 0]
+        done, notDone = concurrent.futures.wait(futures, timeout)
+        if notDone:
+            raise TimeoutError('Parameter update timed out after {0} seconds'.format(timeout))
+        for future in futures:
+            future.result()
+
+    def shutdown(self) -> None:
+        '''
+        Stops the thread pool once the requested polls have run
+
+        :param self: Self reference
+        :type self:  
+        '''
+        self._executor.shutdown(wait=True)
+
+    def _poll(self, asset:Asset) -> None:
+        '''
+        Polls the Asset until no names are waiting.  When a poll merging
+        several requests fails, each request is polled on its own so that
+        it receives its own result.
+
+        :param self: Self reference
+        :type self:  
+        :param asset: Asset
+        :type asset: Asset
+        '''
+        while True:
+            with self._lock:
+                batch = self._pending.pop(asset, None)
+                if batch is None:
+                    self._running.discard(asset)
+                    return
+            requests = [(names, future) for names, future in batch.requests if future.set_running_or_notify_cancel()]
+            if not requests:
+                continue
+            names:list[str | Parameter] = list(batch.names) if len(requests) == len(batch.requests) else \
+                list(dict.fromkeys(name for requested, _ in requests for name in requested))
+            try:
+                asset.updateParameters(names)
+            except BaseException as e:
+                if len(requests) == 1:
+                    requests[0][1].set_exception(e)
+                    continue
+                for requested, future in requests:
+                    self._pollOne(asset, requested, future)
+            else:
+                for _, future in requests:
+                    future.set_result(None)
+
+    def _pollOne(self, asset:Asset, names:list[str], future:concurrent.futures.Future) -> None:
+        '''
+        Polls the names of a single request and completes its future
+
+        :param self: Self reference
+        :type self:  
+        :param asset: Asset
+        :type asset: Asset
+        :param names: Parameter names of the request
+        :type names: list[str]
+        :param future: Future of the request
+        :type future: concurrent.futures.Future
+        '''
+        try:
+            asset.updateParameters(list(names))
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(None)
+
+_updateCoalescer:UpdateCoalescer | None = None
+_updateCoalescerLock = threading.Lock()
+
+def updateCoalescer() -> UpdateCoalescer:
+    '''Returns the shared update coalescer
+    '''
+    global _updateCoalescer
+    with _updateCoalescerLock:
+        if _updateCoalescer is None:
+            _updateCoalescer = UpdateCoalescer()
+    return _updateCoalescer
@@ -0,0 +1,353 @@
+'''
+Compiles the Restrictions of a Parameter into a single fused validator so
+that a value change costs one function call rather than one call per
+Restriction.
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+from typing import Any, Callable, Iterable
+from datetime import timedelta
+from . import log
+from .arrays import np
+from .errors import IllegalRestrictionError
+from .times import SpecificTime, TimeInterval, toNanos
+from .parameters import Restriction, EnumerationR, FractionDigitsR, LengthR, \
+    MaxExclusiveR, MaxInclusiveR, MaxLengthR, MaxSecondsExclusiveR, \
+    MaxSecondsInclusiveR, MaxNanosR, MinExclusiveR, MinInclusiveR, MinLengthR, \
+    MinSecondsExclusiveR, MinSecondsInclusiveR, MinNanosR, PatternR, TotalDigitsR
+
+def _nanos(value:Any) -> int:
+    '''
+    Returns the nanoseconds within the second of a time value in the same 
+    way as the nanos restrictions
+
+    :param value: Input time value
+    :type value: TimeInterval | timedelta | SpecificTime | datetime
+    '''
+    if isinstance(value, (SpecificTime, TimeInterval)):
+        return value.nanos()
+    if isinstance(value, timedelta):
+        return value.microseconds*1000
+    return value.microsecond*1000
+
+class _Interval(object):
+    '''Internal class that merges lower and upper bounds into one interval
+    '''
+    def __init__(self, subject:str):
+        '''
+        Interval constructor
+
+        :param self: Self reference
+        :type self:  
+        :param subject: Expression the bounds apply to
+        :type subject: str
+        '''
+        self.subject = subject
+        # (bound, inclusive, restriction, position in the restriction list)
+        self.lower:tuple[Any, bool, Restriction, int] | None = None
+        self.upper:tuple[Any, bool, Restriction, int] | None = None
+
+    def addLower(self, bound:Any, inclusive:bool, restriction:Restriction, position:int) -> int | None:
+        '''
+        Tightens the lower bound. Returns the position of the restriction made
+        redundant, if any.  Positions rather than restrictions identify the
+        redundant entry, since equal restrictions are the same interned object.
+
+        :param self: Self reference
+        :type self:  
+        :param bound: Lower bound
+        :type bound: Any
+        :param inclusive: True if the bound itself is allowed
+        :type inclusive: bool
+        :param restriction: Restriction defining the bound
+        :type restriction: Restriction
+        :param position: Position of the restriction in the restriction list
+        :type position: int
+        '''
+        if self.lower is not None:
+            current, currentInclusive, _, currentPosition = self.lower
+            if bound < current or (bound == current and (inclusive or not currentInclusive)):
+                return position
+            self.lower = (bound, inclusive, restriction, position)
+            return currentPosition
+        self.lower = (bound, inclusive, restriction, position)
+        return None
+
+    def addUpper(self, bound:Any, inclusive:bool, restriction:Restriction, position:int) -> int | None:
+        '''
+        Tightens the upper bound. Returns the position of the restriction made
+        redundant, if any.
+
+        :param self: Self reference
+        :type self:  
+        :param bound: Upper bound
+        :type bound: Any
+        :param inclusive: True if the bound itself is allowed
+        :type inclusive: bool
+        :param restriction: Restriction defining the bound
+        :type restriction: Restriction
+        :param position: Position of the restriction in the restriction list
+        :type position: int
+        '''
+        if self.upper is not None:
+            current, currentInclusive, _, currentPosition = self.upper
+            if bound > current or (bound == current and (inclusive or not currentInclusive)):
+                return position
+            self.upper = (bound, inclusive, restriction, position)
+            return currentPosition
+        self.upper = (bound, inclusive, restriction, position)
+        return None
+
+    def check(self) -> None:
+        '''
+        Raises IllegalRestrictionError if no value fits in the interval
+
+        :param self: Self reference
+        :type self:  
+        '''
+        if self.lower is None or self.upper is None:
+            return
+        lower, lowerInclusive, lowerRestriction, _ = self.lower
+        upper, upperInclusive, upperRestriction, _ = self.upper
+        if lower > upper or (lower == upper and not (lowerInclusive and upperInclusive)):
+            raise IllegalRestrictionError('{0} contradicts {1}'.format(lowerRestriction, upperRestriction))
+
+    def expression(self, bind:Callable[[Any], str]) -> str | None:
+        '''
+        Returns the chained comparison for the interval, or None if unbounded
+
+        :param self: Self reference
+        :type self:  
+        :param bind: Function that binds a constant and returns its name
+        :type bind: Callable[[Any], str]
+        '''
+        expr = self.subject
+        if self.lower is not None:
+            bound, inclusive, _, _ = self.lower
+            expr = '{0} {1} {2}'.format(bind(bound), '<=' if inclusive else '<', expr)
+        if self.upper is not None:
+            bound, inclusive, _, _ = self.upper
+            expr = '{0} {1} {2}'.format(expr, '<=' if inclusive else '<', bind(bound))
+        if expr == self.subject:
+            return None
+        return expr
+
+class FusedValidator(Restriction):
+    '''Validates a value against a list of restrictions with a single compiled
+    check. Minimum and maximum bounds are merged into one interval comparison,
+    enumerations are intersected into a set and contradictory restrictions are
+    rejected when the validator is built.
+    '''
+    __slots__ = ('restrictions', 'redundant', '_active', '_check')
+    def __init__(self, restrictions:list[Restriction]=list()):
+        '''
+        Restriction constructor
+
+        :param self: Self reference
+        :type self:  
+        :param restrictions: Restrictions to compile
+        :type restrictions: list[Restriction]
+        '''
+        self.restrictions = tuple(restrictions)
+        self.redundant:tuple[Restriction, ...] = tuple()
+        self._active:tuple[Restriction, ...] = tuple()
+        self._check = self._compile()
+
+    def _compile(self) -> Callable[[Any], bool]:
+        '''
+        Builds the fused check function from the restrictions
+
+        :param self: Self reference
+        :type self:  
+        '''
+        values  = _Interval('value')
+        lengths = _Interval('len(value)')
+        seconds = _Interval('_toNanos(value)')
+        nanos   = _Interval('_nanos(value)')
+        members:frozenset[Any] | None = None
+        patterns:dict[str, PatternR] = dict()
+        others:list[Restriction] = list()
+        # positions of the restrictions implied by the others
+        redundant:set[int] = set()
+        for i, r in enumerate(self.restrictions):
+            dropped:int | None = None
+            if isinstance(r, MinInclusiveR):
+                dropped = values.addLower(r.minVal, True, r, i)
+            elif isinstance(r, MinExclusiveR):
+                dropped = values.addLower(r.minVal, False, r, i)
+            elif isinstance(r, MaxInclusiveR):
+                dropped = values.addUpper(r.maxVal, True, r, i)
+            elif isinstance(r, MaxExclusiveR):
+                dropped = values.addUpper(r.maxVal, False, r, i)
+            elif isinstance(r, LengthR):
+                dropped = lengths.addLower(r.length, True, r, i)
+                if dropped is not None:
+                    redundant.add(dropped)
+                dropped = lengths.addUpper(r.length, True, r, i)
+            elif isinstance(r, MinLengthR):
+                dropped = lengths.addLower(r.length, True, r, i)
+            elif isinstance(r, MaxLengthR):
+                dropped = lengths.addUpper(r.length, True, r, i)
+            elif isinstance(r, MinSecondsInclusiveR):
+                dropped = seconds.addLower(r._minNanos, True, r, i)
+            elif isinstance(r, MinSecondsExclusiveR):
+                dropped = seconds.addLower(r._minNanos, False, r, i)
+            elif isinstance(r, MaxSecondsInclusiveR):
+                dropped = seconds.addUpper(r._maxNanos, True, r, i)
+            elif isinstance(r, MaxSecondsExclusiveR):
+                dropped = seconds.addUpper(r._maxNanos, False, r, i)
+            elif isinstance(r, MinNanosR):
+                dropped = nanos.addLower(r.minVal, True, r, i)
+            elif isinstance(r, MaxNanosR):
+                dropped = nanos.addUpper(r.maxVal, True, r, i)
+            elif isinstance(r, EnumerationR):
+                names = r.members
+                if members is not None and members <= names:
+                    dropped = i
+                else:
+                    members = names if members is None else members & names
+                    if len(members) == 0:
+                        raise IllegalRestrictionError('{0} excludes every value'.format(r))
+            elif isinstance(r, PatternR):
+                if r.pattern in patterns:
+                    dropped = i
+                else:
+                    patterns[r.pattern] = r
+            elif isinstance(r, (FractionDigitsR, TotalDigitsR)):
+                # These control formatting only and always validate
+                continue
+            else:
+                others.append(r)
+            if dropped is not None:
+                redundant.add(dropped)
+        # a LengthR may be redundant as one bound but still define the other
+        for interval in (values, lengths, seconds, nanos):
+            for bound in (interval.lower, interval.upper):
+                if bound is not None:
+                    redundant.discard(bound[3])
+        self.redundant = tuple(self.restrictions[i] for i in sorted(redundant))
+        self._active = tuple(r for i, r in enumerate(self.restrictions) if i not in redundant and
+                             not isinstance(r, (FractionDigitsR, TotalDigitsR)))
+        for interval in (values, lengths, seconds, nanos):
+            interval.check()
+        if len(self.redundant) > 0:
+            log.debug('Redundant restrictions {0}'.format(self.redundant))
+
+        # Fold the remaining checks into a single expression, cheapest first
+        namespace:dict[str, Any] = {'_toNanos': toNanos, '_nanos': _nanos,
+                                    '_fallback': self._validateEach}
+        def bind(constant:Any) -> str:
+            name = '_c{0}'.format(len(namespace))
+            namespace[name] = constant
+            return name
+        terms:list[str] = list()
+        for interval in (values, lengths):
+            expr = interval.expression(bind)
+            if expr is not None:
+                terms.append(expr)
+        if members is not None:
+            terms.append('value in {0}'.format(bind(members)))
+        for interval in (seconds, nanos):
+            expr = interval.expression(bind)
+            if expr is not None:
+                terms.append(expr)
+        for pattern in patterns.values():
+            terms.append('{0}(value) is not None'.format(bind(pattern.re.match)))
+        for other in others:
+            terms.append('{0}(value)'.format(bind(other.validate)))
+        if len(terms) == 0:
+            terms.append('True')
+        # Values of an unexpected type take the per-restriction path so that
+        # the outcome is the same as validating each restriction in turn
+        source = 'def _fused(value):\n' \
+                 '    try:\n' \
+                 '        return bool({0})\n' \
+                 '    except TypeError:\n' \
+                 '        return _fallback(value)\n'.format(' and '.join(terms))
+        exec(source, namespace)
+        return namespace['_fused']
+
+    def _validateEach(self, value:Any) -> bool:
+        '''
+        Validates the value against each restriction in turn
+
+        :param self: Self reference
+        :type self:  
+        :param value: Input value to check
+        :type value: Any
+        '''
+        for r in self.restrictions:
+            if not r.validate(value):
+                return False
+        return True
+
+    def validate(self, value:Any) -> bool:
+        '''
+        Validation function
+
+        :param self: Self reference
+        :type self:  
+        :param value: Input value to check
+        :type value: Any
+        '''
+        return self._check(value)
+
+    def validateMany(self, values:Iterable[Any]) -> list[bool]:
+        '''
+        Validates a batch of values, returning one result per value
+
+        :param self: Self reference
+        :type self:  
+        :param values: Input values to check
+        :type values: Iterable[Any]
+        '''
+        check = self._check
+        return [check(value) for value in values]
+
+    def _arrayMask(self, values:'np.ndarray') -> 'np.ndarray':
+        '''
+        Returns the validity mask for an array of samples, combining the 
+        vectorized checks of the non-redundant restrictions
+
+        :param self: Self reference
+        :type self:  
+        :param values: Array of samples
+        :type values: np.ndarray
+        '''
+        mask = np.ones(values.shape, dtype=bool)
+        for r in self._active:
+            mask &= r._arrayMask(values)
+        return mask
+
+    def violation(self, value:Any) -> Restriction | None:
+        '''
+        Returns the first restriction that the value violates, or None.
+        Intended for error reporting after validate() has failed.
+
+        :param self: Self reference
+        :type self:  
+        :param value: Input value to check
+        :type value: Any
+        '''
+        for r in self.restrictions:
+            if not r.validate(value):
+                return r
+        return None
+
+    def __repr__(self) -> str:
+        '''
+        Returns class representation
+
+        :param self: Self reference
+        :type self:  
+        '''
+        return 'FusedValidator({0})'.format(list(self.restrictions))
+
+def compileRestrictions(restrictions:list[Restriction]) -> FusedValidator:
+    '''Compiles a list of restrictions into a single fused validator.
+    Raises IllegalRestrictionError if the restrictions contradict each other.
+
+    :param restrictions: Restrictions of a Parameter
+    :type restrictions: list[Restriction]
+    '''
+    return FusedValidator(restrictions)
@@ -7,7 +7,7 @@
 '''
 # The preceding documentation corresponds to the HeaderComment within
 # the metamodel.
-from space import TimeInterval, SpecificTime, spacePython
+from space import TimeInterval, SpecificTime, spacePython, SpacePythonException
 from space import SUCCESSFUL, MixedParameterValue, NullableMixedParameterValue, ParserParameter, FAILED
 from datetime import datetime
 # The following are commonly accepted metadata items for python scripts
@@ -51,18 +51,15 @@ def invoke(args:dict[str, MixedParameterValue]) -> int:
 # Commands, and Directives for the spacecraft, control system,
 # and equipment managed by the procedure.
     sat1 = spacePython().lookupAsset('SAT1')
-    MomentumWheelState = sat1.lookupParameter('MomentumWheelState')
-    if MomentumWheelState == None:
-        print('MomentumWheelState was not found')
-        return FAILED
-    MomentumWheelSpeed = sat1.lookupParameter('MomentumWheelSpeed')
-    if MomentumWheelSpeed == None:
-        print('MomentumWheelSpeed was not found')
-        return FAILED
-    setWheelSpeed      = sat1.lookupCommand('SetWheelSpeed')
-    if setWheelSpeed == None:
-        print('SetWheelSpeed was not found')
+    try:
+        parameters = sat1.lookupParameters(['MomentumWheelState', 'MomentumWheelSpeed'])
+        commands   = sat1.lookupCommands(['SetWheelSpeed'])
+    except SpacePythonException as e:
+        print(e)
         return FAILED
+    MomentumWheelState = parameters['MomentumWheelState']
+    MomentumWheelSpeed = parameters['MomentumWheelSpeed']
+    setWheelSpeed      = commands['SetWheelSpeed']
 #
 # The "core" of the procedure example
 #
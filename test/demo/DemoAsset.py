@@ -1,43 +1,45 @@
 __author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm), Brad Kizzort'
 __copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
-from space import Asset, Parameter, Command, MixedFlagValue, SpacePythonException, log
-from typing import Any
-import re
+from space import Asset, Parameter, Command, MixedFlagValue, MixedParameterValue, SpacePythonException, UnknownCommandError, UnknownParameterError, ParameterTable, NameIndex, assetRegistry, log
+from typing import Any, Sequence
 from .DemoParameter import DemoParameter
 from .DemoCommand import DemoCommand
 
 class DemoAsset(Asset):
 
-    def __init__(self, name: str, parameters:dict[str, DemoParameter]= dict(), commands:dict[str, DemoCommand] = dict()):
+    def __init__(self, name: str, parameters:dict[str, DemoParameter]= dict(), commands:dict[str, DemoCommand] = dict(),
+                 assetType:str='SpaceSystem'):
         self._name = name
-        self._parameters:dict[str, DemoParameter] = parameters
+        # parameter values are held in a columnar table; lookups return views
+        self._parameters = ParameterTable()
+        for p in parameters.values():
+            self._parameters.add(p.name(), p.type(), description=p._description, units=p._units,
+                                 restriction=p._restriction, value=p._value)
 
         for c in list(commands.values()):
             c.setAsset(self)
 
         self._commands:dict[str, DemoCommand] = commands
-
-        assets_[name] = self
-
-    def lookupParameter(self, parameterName:str) -> Parameter | None:
-        if parameterName in self._parameters:
-            return self._parameters[parameterName]
-        else:
-            return None
-
-    def findParameters(self, regexp:str='') -> list[Parameter]:
-        keys = list(self._parameters.keys())
-        out_list:list[Parameter] = []
-        if regexp != '':
-            does_it = re.compile(regexp)
-            keys = list(filter(does_it.match, keys))
-
-            # build output
-            for k in keys:
-                out_list.append(self._parameters[k])
-        else:
-            out_list = list(self._parameters.values())
-        return out_list
+        self._commandIndex = NameIndex(commands.keys())
+
+        assetRegistry().register(self, assetType=assetType)
+
+    def lookupParameter(self, parameterName:str, historySize:int=0) -> Parameter | None:
+        p = self._parameters.parameter(parameterName)
+        if p is not None and historySize > 0:
+            p.enableHistory(historySize)
+        return p
+
+    def lookupParameters(self, parameterNames:Sequence[str], historySize:int=0) -> dict[str, Parameter]:
+        unknown = [name for name in parameterNames if self._parameters.slot(name) is None]
+        if unknown:
+            raise UnknownParameterError('Parameters not defined for {0}: {1}'.format(self._name, ', '.join(unknown)))
+        return {name: self.lookupParameter(name, historySize) for name in parameterNames}
+
+    def findParameters(self, regexp:str='', glob:bool=False) -> list[Parameter]:
+        # names are resolved by the table's name index
+        parameter = self._parameters.parameter
+        return [parameter(k) for k in self._parameters.find(regexp, glob)]
     
     def updateParameters(self, parameterList:list[str | Parameter]=[]) -> None:
         # This method is expected to cause a poll of the device
@@ -53,18 +55,19 @@ class DemoAsset(Asset):
             raise SpacePythonException('No Parameters specified on updateParameters')
 
     def setParameters(self, **valueMap:Any) -> None: #dict[str, MixedParameterValue]
-        params = list(valueMap.keys())
-        if len(params) > 0:
+        self.setParameterValues(list(valueMap.keys()), list(valueMap.values()))
+
+    def setParameterValues(self, names:Sequence[str], values:Sequence[MixedParameterValue]) -> None:
+        if len(names) > 0:
             out = 'Setting {0} parameters:'.format(self._name)
-            for param in params:
-                out += ' {name}={value}'.format(name=param, value=valueMap[param])
+            for name, value in zip(names, values):
+                out += ' {name}={value}'.format(name=name, value=value)
             log.info(out)
 
-            # set value in local table
-            for param in params:
-                p = self.lookupParameter(param)
-                if p != None:
-                    p.setValue(valueMap[param])
+            # set values in local table as one update, skipping names
+            # that are not parameters of this asset
+            known = [ii for ii, name in enumerate(names) if self._parameters.slot(name) is not None]
+            self._parameters.setValues([names[ii] for ii in known], [values[ii] for ii in known])
         else: 
             raise SpacePythonException('No Parameters specified on set')
 
@@ -74,19 +77,15 @@ class DemoAsset(Asset):
         else:
             return None
     
-    def findCommands(self, regexp:str='') -> list[Command]:
-        keys = list(self._commands.keys())
-        out_list:list[Command] = []
-        if regexp != '':
-            does_it = re.compile(regexp)
-            keys = list(filter(does_it.match, keys))
-
-            # build output
-            for k in keys:
-                out_list.append(self._commands[k])
-        else:
-            out_list = list(self._commands.values())
-        return out_list
+    def lookupCommands(self, commandNames:Sequence[str]) -> dict[str, Command]:
+        unknown = [name for name in commandNames if name not in self._commands]
+        if unknown:
+            raise UnknownCommandError('Commands not defined for {0}: {1}'.format(self._name, ', '.join(unknown)))
+        return {name: self._commands[name] for name in commandNames}
+    
+    def findCommands(self, regexp:str='', glob:bool=False) -> list[Command]:
+        keys = self._commandIndex.glob(regexp) if glob else self._commandIndex.match(regexp)
+        return [self._commands[k] for k in keys]
     
     def __repr__(self):
         return "Command('{0}')".format(self.name)
@@ -109,6 +108,3 @@ class DemoAsset(Asset):
     
     def state(self) -> str:
         return "UP"
-    
-# storage of known assets
-assets_:dict[str,DemoAsset] = dict()
@@ -1,6 +1,7 @@
 __author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm), Brad Kizzort'
 __copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
-from space import Parameter, MixedParameterValue, NullableMixedParameterValue, isSupportedParameterType, UndefinedTypeError, getParameterFunction, SpecificTime, IllegalValueError, Restriction
+from space import Parameter, MixedParameterValue, NullableMixedParameterValue, isSupportedParameterType, UndefinedTypeError, getParameterFunction, SpecificTime, nowNanos, IllegalValueError, Restriction, compileRestrictions
+from space.parameters import EnumerationR
 from typing import Any
 
 class DemoParameter(Parameter):
@@ -18,11 +19,13 @@ class DemoParameter(Parameter):
         self._value:NullableMixedParameterValue = None
         self._raw   = None
         self._time  = None
+        self._nanos:int | None = None
 
         options = list(kwds.keys())
         for option in options:
             if hasattr(self, option):
                 setattr(self, option, kwds[option])
+        self._validator = compileRestrictions(self._restriction)
 
     def value(self) -> NullableMixedParameterValue:
         return self._value
@@ -36,18 +39,35 @@ class DemoParameter(Parameter):
     def setValue(self, value: MixedParameterValue) -> None:
         # If the value supplied is not of the specified type, try to convert it using the type converter
         value = getParameterFunction(self._type)(value)
-        for restriction in self._restriction:
-            if not restriction.validate(value):
-                raise IllegalValueError('Violates restriction {0}'.format(restriction))
+        if not self._validator.validate(value):
+            raise IllegalValueError('Violates restriction {0}'.format(self._validator.violation(value)))
         self._value = value
-        self._time  = SpecificTime.now()
+        # Stamp with the integer clock; the SpecificTime is built on demand
+        self._nanos = nowNanos()
+        self._time  = None
+        history = self.history()
+        if history is not None:
+            history.append(value, self._nanos)
+        self.notifySubscribers(value, self._nanos)
+
+    def _sampleTime(self) -> SpecificTime | None:
+        if self._time is None and self._nanos is not None:
+            self._time = SpecificTime.fromClockNanos(self._nanos)
+        return self._time
+
+    def enumeration(self) -> EnumerationR | None:
+        for restriction in self._restriction:
+            if isinstance(restriction, EnumerationR):
+                return restriction
+        return None
 
     def sample(self) -> dict[str, MixedParameterValue]:
         out:dict[str, MixedParameterValue] = dict()
         if self._value != None:
             out["value"] = self._value
-        if self._time != None:
-            out["time"] = self._time
+        time = self._sampleTime()
+        if time != None:
+            out["time"] = time
 
         return out
     
@@ -43,15 +43,19 @@ def loadFromYaml(specFile:str | None = None) -> None:
     loader.add_constructor('!Restriction', restriction_constructor)
     # Load the datasets
     for item in loader.get_data():
-        DemoAsset(item.name, item.pSet, item.cSet)
+        DemoAsset(item.name, item.pSet, item.cSet, item.assetType)
 
 class SpaceSystem(object):
+    assetType = 'SpaceSystem'
+
     def __init__(self, name:str, pSet:dict[str, DemoParameter], cSet:dict[str, DemoCommand]):
         self.name = name
         self.pSet = pSet
         self.cSet = cSet
         
 class Device(object):
+    assetType = 'GemsDevice'
+
     def __init__(self, name:str, pSet:dict[str, DemoParameter], cSet:dict[str, DemoCommand]):
         self.name = name
         self.pSet = pSet
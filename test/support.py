@@ -0,0 +1,80 @@
+'''
+Helpers shared by the unit tests
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import re
+from typing import Any
+from space import Asset, Command, MixedFlagValue, Parameter, MixedParameterValue, NullableMixedParameterValue, \
+    UnknownParameterError, nowNanos
+
+class PlainParameter(Parameter):
+    '''Parameter that relies on the default implementations of the
+    optional Parameter methods'''
+
+    def __init__(self, name:str='PLAIN', type:str='double'):
+        self._name  = name
+        self._type  = type
+        self._value:NullableMixedParameterValue = None
+
+    def value(self) -> NullableMixedParameterValue:
+        return self._value
+
+    def raw(self) -> NullableMixedParameterValue:
+        return self._value
+
+    def name(self) -> str:
+        return self._name
+
+    def setValue(self, value:MixedParameterValue) -> None:
+        self._value = value
+        self.notifySubscribers(value, nowNanos())
+
+    def sample(self) -> dict[str, MixedParameterValue]:
+        return {'value': self._value}
+
+    def type(self) -> str:
+        return self._type
+
+class PlainAsset(Asset):
+    '''Asset of PlainParameters that implements only the abstract methods,
+    with the one argument lookupParameter of the normative interface.  It
+    records the names of each poll and the commands sent.'''
+
+    def __init__(self, name:str='PLAIN', parameters:list[Parameter]=list()):
+        self._name = name
+        self._parameters = {parameter.name(): parameter for parameter in parameters}
+        self.polls:list[list[str]] = list()
+        self.sent:list[tuple[str, dict[str, Any]]] = list()
+
+    def lookupParameter(self, parameterName:str) -> Parameter | None:  # type: ignore[override]
+        return self._parameters.get(parameterName, None)
+
+    def findParameters(self, regexp:str='', glob:bool=False) -> list[Parameter]:
+        return [p for name, p in self._parameters.items() if re.match(regexp, name)]
+
+    def updateParameters(self, parameterList:list[str | Parameter]=[]) -> None:
+        names = [p if isinstance(p, str) else p.name() for p in parameterList]
+        unknown = [name for name in names if name not in self._parameters]
+        if unknown:
+            raise UnknownParameterError('Parameters not defined: {0}'.format(', '.join(unknown)))
+        self.polls.append(names)
+
+    def setParameters(self, **valueMap:Any) -> None:
+        for name, value in valueMap.items():
+            self._parameters[name].setValue(value)
+
+    def lookupCommand(self, commandName:str) -> Command | None:
+        return None
+
+    def findCommands(self, regexp:str='', glob:bool=False) -> list[Command]:
+        return list()
+
+    def send(self, command:Command | str, _flags:dict[str, MixedFlagValue]=dict(), **args:Any) -> None:
+        self.sent.append((str(command), args))
+
+    def name(self) -> str:
+        return self._name
+
+    def state(self) -> str:
+        return 'UP'
@@ -0,0 +1,85 @@
+'''
+Tests of the asyncio versions of the wait, verify and Asset functions
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import asyncio
+import concurrent.futures
+import inspect
+import threading
+import time
+import unittest
+import space
+from space import SpecificTime, TimeInterval, VerifyError, aio
+from support import PlainAsset, PlainParameter
+
+class AioTest(unittest.IsolatedAsyncioTestCase):
+
+    async def testWaitForSharesTheLoop(self):
+        ticks = list()
+        async def ticker():
+            for i in range(5):
+                ticks.append(i)
+                await asyncio.sleep(0.01)
+        deadline = time.monotonic() + 0.1
+        await asyncio.gather(ticker(), aio.waitFor(lambda: time.monotonic() >= deadline, pollPeriod=0.01))
+        self.assertEqual(ticks, [0, 1, 2, 3, 4])
+
+    async def testCoroutineConditionAndBackoff(self):
+        deadline = time.monotonic() + 0.3
+        async def ready():
+            return time.monotonic() >= deadline
+        status = await aio.waitForStatus(ready, timeout=5, pollPeriod=0.01, backoff=2.0)
+        self.assertTrue(status.satisfied)
+        self.assertLessEqual(status.polls, 8)
+
+    async def testTimeout(self):
+        with self.assertRaises(space.TimeoutError) as raised:
+            await aio.waitFor(lambda: False, timeout=0.05, pollPeriod=0.01)
+        self.assertRegex(str(raised.exception), r'line \d+')
+
+    async def testVerify(self):
+        async def outcome(value):
+            return value
+        self.assertTrue(await aio.verify(True))
+        self.assertTrue(await aio.verify(outcome(True)))
+        with self.assertRaises(VerifyError):
+            await aio.verify(outcome(False))
+
+    async def testLineIsTakenWhenTheCallIsMade(self):
+        async def outcome(value):
+            return value
+        failed = asyncio.create_task(aio.verify(outcome(False)))
+        verifyLine = inspect.currentframe().f_lineno - 1
+        timedOut = aio.waitFor(lambda: False, timeout=0.05, pollPeriod=0.01)
+        waitLine = inspect.currentframe().f_lineno - 1
+        results = await asyncio.gather(failed, timedOut, return_exceptions=True)
+        self.assertIsInstance(results[0], VerifyError)
+        self.assertIn('line %d ' % verifyLine, str(results[0]))
+        self.assertIsInstance(results[1], space.TimeoutError)
+        self.assertIn('line %d ' % waitLine, str(results[1]))
+
+    async def testWaitUntilInThePast(self):
+        start = time.monotonic()
+        await aio.waitUntil(SpecificTime.now() - TimeInterval(seconds=10))
+        self.assertLess(time.monotonic() - start, 1)
+
+    async def testRunSyncUsesTheExecutor(self):
+        executor = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix='aio-test')
+        previous = aio.setExecutor(executor)
+        try:
+            name = await aio.runSync(lambda: threading.current_thread().name)
+        finally:
+            aio.setExecutor(previous)
+            executor.shutdown()
+        self.assertTrue(name.startswith('aio-test'))
+
+    async def testAssetDefaultsRunTheBlockingMethods(self):
+        asset = PlainAsset(parameters=[PlainParameter('VOLT')])
+        await asset.sendAsync('RESET', mode='cold')
+        await asset.updateParametersAsync(['VOLT'])
+        self.assertEqual(asset.sent, [('RESET', {'mode': 'cold'})])
+        self.assertEqual(asset.polls, [['VOLT']])
+
+if __name__ == '__main__':
+    unittest.main()
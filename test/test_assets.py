@@ -0,0 +1,68 @@
+'''
+Tests of the default Asset implementations of the batch lookups and
+subscriptions
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import unittest
+from space import CachingAsset, UnknownCommandError, UnknownParameterError
+from support import PlainAsset, PlainParameter
+
+class HistoryAsset(PlainAsset):
+    '''Asset whose lookupParameter takes a history size'''
+
+    def lookupParameter(self, parameterName, historySize=0):
+        parameter = self._parameters.get(parameterName, None)
+        if parameter is not None and historySize > 0:
+            parameter.enableHistory(historySize)
+        return parameter
+
+class CommandAsset(PlainAsset):
+    '''Asset with the commands RESET and SAFE'''
+
+    def lookupCommand(self, commandName):
+        return commandName if commandName in ('RESET', 'SAFE') else None
+
+class AssetTest(unittest.TestCase):
+
+    def setUp(self):
+        self.volt = PlainParameter('VOLT')
+        self.temp = PlainParameter('TEMP')
+
+    def testLookupParametersWithTheNormativeLookup(self):
+        asset = PlainAsset(parameters=[self.volt, self.temp])
+        self.assertEqual(asset.lookupParameters(['TEMP', 'VOLT']), {'TEMP': self.temp, 'VOLT': self.volt})
+        with self.assertRaises(UnknownParameterError) as raised:
+            asset.lookupParameters(['VOLT', 'CURR', 'LOAD'])
+        self.assertIn('CURR, LOAD', str(raised.exception))
+
+    def testHistorySizeIsPassedWhenGiven(self):
+        asset = HistoryAsset(parameters=[self.volt])
+        found = asset.lookupParameters(['VOLT'], historySize=4)
+        self.assertEqual(found['VOLT'].history().capacity(), 4)
+
+    def testLookupCommands(self):
+        asset = CommandAsset()
+        self.assertEqual(asset.lookupCommands(['SAFE', 'RESET']), {'SAFE': 'SAFE', 'RESET': 'RESET'})
+        with self.assertRaises(UnknownCommandError) as raised:
+            asset.lookupCommands(['SAFE', 'BOOT'])
+        self.assertIn('BOOT', str(raised.exception))
+
+    def testSubscribeWithTheNormativeLookup(self):
+        asset = PlainAsset(parameters=[self.volt, self.temp])
+        batches = list()
+        subscription = asset.subscribe(['VOLT', self.temp], batches.append)
+        self.volt.setValue(28.0)
+        subscription.dispatcher().flush(5)
+        subscription.cancel()
+        self.assertEqual(batches, [{'VOLT': 28.0}])
+
+    def testCachingAssetWithTheNormativeLookup(self):
+        cached = CachingAsset(PlainAsset(parameters=[self.volt]))
+        self.assertIs(cached.lookupParameter('VOLT'), self.volt)
+        self.assertEqual(cached.lookupParameters(['VOLT']), {'VOLT': self.volt})
+        cached = CachingAsset(HistoryAsset(parameters=[self.temp]))
+        self.assertEqual(cached.lookupParameter('TEMP', 3).history().capacity(), 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+'''
+Tests of the caching Asset
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import unittest
+from space import CachingAsset, SpecificTime, nowNanos
+from support import PlainAsset, PlainParameter
+
+class TimedParameter(PlainParameter):
+    '''PlainParameter whose sample time is set by the test'''
+
+    def __init__(self, name, type='double'):
+        super().__init__(name, type)
+        self.sampleNanos = None
+
+    def sample(self):
+        out = super().sample()
+        if self.sampleNanos is not None:
+            out['time'] = SpecificTime.fromClockNanos(self.sampleNanos)
+        return out
+
+class HookedAsset(PlainAsset):
+    '''PlainAsset that runs a hook during each poll'''
+    hook = None
+
+    def updateParameters(self, parameterList=[]):
+        super().updateParameters(parameterList)
+        if self.hook is not None:
+            self.hook()
+
+class CachingAssetTest(unittest.TestCase):
+
+    def setUp(self):
+        self.volt = TimedParameter('VOLT')
+        self.temp = TimedParameter('TEMP', 'float')
+        self.asset = HookedAsset(parameters=[self.volt, self.temp])
+        self.cache = CachingAsset(self.asset, defaultMaxAge=60)
+
+    def testRecentParametersAreNotPolled(self):
+        self.cache.updateParameters(['VOLT', 'TEMP'])
+        self.cache.updateParameters(['VOLT', self.temp])
+        self.assertEqual(self.asset.polls, [['VOLT', 'TEMP']])
+        statistics = self.cache.statistics()
+        self.assertEqual((statistics['hits'], statistics['misses'], statistics['entries']), (2, 2, 2))
+
+    def testAgeIsMeasuredFromTheSampleTime(self):
+        self.volt.sampleNanos = nowNanos() - 120 * 1000000000
+        self.temp.sampleNanos = nowNanos() - 1000000000
+        self.cache.updateParameters(['VOLT', 'TEMP'])
+        self.cache.updateParameters(['VOLT', 'TEMP'])
+        self.assertEqual(self.asset.polls, [['VOLT', 'TEMP'], ['VOLT']])
+        self.assertEqual(self.cache.statistics()['stale'], 1)
+
+    def testMaximumAgesByNameAndType(self):
+        self.volt.sampleNanos = self.temp.sampleNanos = nowNanos() - 10 * 1000000000
+        self.cache.setMaxAge(5, parameterType='float')
+        self.cache.updateParameters(['VOLT', 'TEMP'])
+        self.cache.updateParameters(['VOLT', 'TEMP'])
+        self.cache.setMaxAge(5, name='VOLT')
+        self.cache.updateParameters(['VOLT'])
+        self.assertEqual(self.asset.polls, [['VOLT', 'TEMP'], ['TEMP'], ['VOLT']])
+
+    def testInvalidationDuringAPollOnlyAffectsItsNames(self):
+        self.asset.hook = lambda: self.cache.invalidate(['TEMP'])
+        self.cache.updateParameters(['VOLT', 'TEMP'])
+        self.asset.hook = None
+        self.cache.updateParameters(['VOLT', 'TEMP'])
+        self.assertEqual(self.asset.polls, [['VOLT', 'TEMP'], ['TEMP']])
+
+    def testInvalidatingEveryNameDuringAPoll(self):
+        self.asset.hook = self.cache.invalidate
+        self.cache.updateParameters(['VOLT'])
+        self.asset.hook = None
+        self.cache.updateParameters(['VOLT'])
+        self.cache.updateParameters(['VOLT'])
+        self.assertEqual(self.asset.polls, [['VOLT'], ['VOLT']])
+
+    def testSettingAndSendingInvalidate(self):
+        self.cache.updateParameters(['VOLT', 'TEMP'])
+        self.cache.setParameters(VOLT=28.0)
+        self.cache.updateParameters(['VOLT', 'TEMP'])
+        self.cache.send('RESET')
+        self.cache.updateParameters(['VOLT', 'TEMP'])
+        self.assertEqual(self.asset.polls, [['VOLT', 'TEMP'], ['VOLT'], ['VOLT', 'TEMP']])
+        self.assertEqual(self.asset.sent, [('RESET', {})])
+
+    def testLeastRecentlyUsedAreEvicted(self):
+        self.cache.maxEntries = 1
+        self.cache.updateParameters(['VOLT'])
+        self.cache.updateParameters(['TEMP'])
+        self.cache.updateParameters(['VOLT'])
+        self.assertEqual(self.asset.polls, [['VOLT'], ['TEMP'], ['VOLT']])
+        self.assertEqual(self.cache.statistics()['evictions'], 2)
+
+if __name__ == '__main__':
+    unittest.main()
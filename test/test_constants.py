@@ -0,0 +1,47 @@
+'''
+Tests of the parameter type conversions
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import unittest
+from space import IllegalValueError, UndefinedTypeError
+from space.arrays import np
+from space.constants import convertMany, getParameterFunction
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class ConvertManyTest(unittest.TestCase):
+
+    def testMatchesTheScalarFunction(self):
+        for type, values in (('int', [1, '5', -7]), ('ubyte', [255, -3]), ('double', [1, '2.5']),
+                             ('boolean', [0, 1]), ('string', [1, 'On'])):
+            function = getParameterFunction(type)
+            self.assertEqual(convertMany(type, values).tolist(), [function(v) for v in values], type)
+
+    def testUnsignedLongBeyondInt64(self):
+        converted = convertMany('ulong', [2**63, 1])
+        self.assertEqual(converted.dtype, np.uint64)
+        self.assertEqual(converted.tolist(), [2**63, 1])
+        self.assertEqual(convertMany('ulong', [2**64 - 1, -1]).tolist(), [2**64 - 1, 1])
+
+    def testLongLimits(self):
+        self.assertEqual(convertMany('long', [-2**63, 2**63 - 1]).tolist(), [-2**63, 2**63 - 1])
+        with self.assertRaises(IllegalValueError):
+            convertMany('long', [2**63, 1])
+        with self.assertRaises(IllegalValueError):
+            convertMany('ulong', [2**64, 1])
+
+    def testOutOfRangeValuesAreReportedTogether(self):
+        with self.assertRaises(IllegalValueError) as raised:
+            convertMany('byte', [1, 200, 3, -200])
+        self.assertIn('[1, 3]', str(raised.exception))
+
+    def testArraysAndIterables(self):
+        self.assertEqual(convertMany('ushort', np.array([1, 2], dtype=np.uint8)).dtype, np.uint16)
+        self.assertEqual(convertMany('short', (v for v in [1, 2])).tolist(), [1, 2])
+
+    def testUnknownType(self):
+        with self.assertRaises(UndefinedTypeError):
+            convertMany('complex', [1])
+
+if __name__ == '__main__':
+    unittest.main()
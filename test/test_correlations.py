@@ -0,0 +1,103 @@
+'''
+Tests of time scale conversion and spacecraft clock correlation
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import unittest
+from space import ClockCorrelation, IllegalValueError, LeapSecondTable, SpacePythonException, SpecificTime, \
+    convertTimeScale, convertTimeScaleMany, setClockCorrelation
+from space.arrays import np
+from space.correlations import clockCorrelation
+
+SECOND = 1000000000
+# 2020-01-01T00:00:00 UTC, when TAI-UTC was 37 seconds
+Y2020 = SpecificTime(2020, 1, 1).toNanos()
+
+class TimeScaleTest(unittest.TestCase):
+
+    def testScalesAroundTai(self):
+        self.assertEqual(convertTimeScale(Y2020, 'UTC', 'TAI'), Y2020 + 37 * SECOND)
+        self.assertEqual(convertTimeScale(Y2020, 'UTC', 'GPS'), Y2020 + 18 * SECOND)
+        self.assertEqual(convertTimeScale(Y2020, 'UTC', 'TT'), Y2020 + 69184000000)
+        for scale in ('TAI', 'GPS', 'TT', 'UTC'):
+            self.assertEqual(convertTimeScale(convertTimeScale(Y2020, 'UTC', scale), scale, 'UTC'), Y2020)
+
+    def testLeapSecondTable(self):
+        table = LeapSecondTable([((1972, 1, 1), 10)])
+        self.assertEqual(table.offset(0), 10 * SECOND)
+        table.add((2030, 1, 1), 38)
+        self.assertEqual(len(table), 2)
+        later = SpecificTime(2031, 1, 1).toNanos()
+        self.assertEqual(convertTimeScale(later, 'UTC', 'TAI', table), later + 38 * SECOND)
+        self.assertEqual(convertTimeScale(Y2020, 'UTC', 'TAI', table), Y2020 + 10 * SECOND)
+
+    def testUnknownScale(self):
+        with self.assertRaises(IllegalValueError):
+            convertTimeScale(0, 'UTC', 'TCB')
+
+    def testSpecificTimeScales(self):
+        t = SpecificTime(2020, 1, 1)
+        self.assertEqual(t.toTimeScale('TAI'), SpecificTime(2020, 1, 1, 0, 0, 37))
+        self.assertEqual(SpecificTime.fromTimeScale(SpecificTime(2020, 1, 1, 0, 0, 37), 'TAI'), t)
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class TimeScaleManyTest(unittest.TestCase):
+
+    def testMatchesTheScalarConversion(self):
+        nanos = np.array([0, Y2020, Y2020 + 123], dtype=np.int64)
+        for scale in ('TAI', 'GPS', 'TT'):
+            converted = convertTimeScaleMany(nanos, 'UTC', scale)
+            self.assertEqual(converted.tolist(), [convertTimeScale(int(n), 'UTC', scale) for n in nanos])
+            self.assertEqual(convertTimeScaleMany(converted, scale, 'UTC').tolist(), nanos.tolist())
+
+    def testMissingTimesStayMissing(self):
+        values = np.array([Y2020, 'NaT'], dtype='datetime64[ns]')
+        for scale in ('UTC', 'TAI', 'GPS'):
+            converted = convertTimeScaleMany(values, 'UTC', scale)
+            self.assertEqual(converted.dtype, np.dtype('datetime64[ns]'))
+            self.assertEqual(np.isnat(converted).tolist(), [False, True], scale)
+        self.assertTrue(np.isnat(convertTimeScaleMany(values, 'TAI', 'UTC'))[1])
+
+class ClockCorrelationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.correlation = ClockCorrelation()
+        self.correlation.addSegment(0, Y2020)
+        self.correlation.addSegment(1000, Y2020 + 1000 * SECOND, rate=0.5)
+
+    def testSegments(self):
+        self.assertEqual(len(self.correlation), 2)
+        self.assertEqual(self.correlation.toNanos(10), Y2020 + 10 * SECOND)
+        self.assertEqual(self.correlation.toNanos(1010), Y2020 + 1005 * SECOND)
+        self.assertEqual(self.correlation.fromNanos(Y2020 + 1005 * SECOND), 1010)
+        with self.assertRaises(IllegalValueError):
+            self.correlation.toNanos(-1)
+        with self.assertRaises(IllegalValueError):
+            self.correlation.addSegment(2000, Y2020, rate=0)
+
+    def testTaiSegments(self):
+        correlation = ClockCorrelation('TAI')
+        correlation.addSegment(0, Y2020 + 37 * SECOND)
+        self.assertEqual(correlation.toNanos(0), Y2020)
+
+    def testDefaultCorrelation(self):
+        previous = setClockCorrelation(None)
+        try:
+            with self.assertRaises(SpacePythonException):
+                clockCorrelation()
+            setClockCorrelation(self.correlation)
+            t = SpecificTime.fromSpacecraftClock(10)
+            self.assertEqual(t, SpecificTime(2020, 1, 1, 0, 0, 10))
+            self.assertEqual(t.toSpacecraftClock(), 10)
+        finally:
+            setClockCorrelation(previous)
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def testCountArrays(self):
+        counts = np.array([10, 1010])
+        self.assertEqual(self.correlation.toNanosMany(counts).tolist(),
+                         [self.correlation.toNanos(10), self.correlation.toNanos(1010)])
+        self.assertEqual(self.correlation.toTimesMany(counts).dtype, np.dtype('datetime64[ns]'))
+
+if __name__ == '__main__':
+    unittest.main()
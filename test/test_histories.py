@@ -0,0 +1,95 @@
+'''
+Tests of the Parameter sample history
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import unittest
+from space import ParameterHistory, ParameterTable, TimeInterval
+from space.arrays import np
+from space.parameters import EnumerationR
+from support import PlainParameter
+
+class ParameterHistoryTest(unittest.TestCase):
+
+    def filled(self, capacity, count):
+        history = ParameterHistory(capacity, 'd')
+        for i in range(count):
+            history.append(float(i), i * 1000)
+        return history
+
+    def testWrapsAroundKeepingTheMostRecent(self):
+        history = self.filled(4, 10)
+        self.assertEqual(len(history), 4)
+        self.assertEqual(list(history.all().values), [6.0, 7.0, 8.0, 9.0])
+        self.assertEqual(list(history.all().times), [6000, 7000, 8000, 9000])
+        self.assertEqual(list(history.last(2).values), [8.0, 9.0])
+        self.assertEqual(len(history.last(10)), 4)
+
+    def testTimeRanges(self):
+        history = self.filled(8, 8)
+        self.assertEqual(list(history.between(2000, 5000).values), [2.0, 3.0, 4.0])
+        self.assertEqual(list(history.since(2500).values), [5.0, 6.0, 7.0])
+        self.assertEqual(list(history.since(TimeInterval.fromNanos(2500)).values), [5.0, 6.0, 7.0])
+        self.assertEqual(len(history.between(9000, 10000)), 0)
+
+    def testStatistics(self):
+        window = self.filled(4, 6).all()
+        self.assertEqual(window.minimum(), 2.0)
+        self.assertEqual(window.maximum(), 5.0)
+        self.assertEqual(window.mean(), 3.5)
+        self.assertIsNone(ParameterHistory(2).all().mean())
+
+    def testFloatValuesKeepDoublePrecision(self):
+        history = ParameterHistory.forType('float', 2)
+        history.append(0.1, 1)
+        self.assertEqual(list(history.all().values), [0.1])
+
+    def testEnumeratedValuesAreEncoded(self):
+        history = ParameterHistory.forType('string', 3, EnumerationR(['On', 'Off']))
+        for i, value in enumerate(['On', 'Off', 'On']):
+            history.append(value, i)
+        self.assertEqual(history.all().labels(), ['On', 'Off', 'On'])
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def testArraysShareStorage(self):
+        times, values = self.filled(4, 6).all().arrays()
+        self.assertEqual(values.tolist(), [2.0, 3.0, 4.0, 5.0])
+        self.assertEqual(times.dtype, np.int64)
+
+    def testResizedKeepsTheRecentSamples(self):
+        history = self.filled(4, 6)
+        larger = history.resized(8)
+        self.assertEqual(larger.capacity(), 8)
+        self.assertEqual(list(larger.all().values), [2.0, 3.0, 4.0, 5.0])
+        for i in range(6, 12):
+            larger.append(float(i), i * 1000)
+        self.assertEqual(list(larger.all().values), [float(i) for i in range(4, 12)])
+        smaller = history.resized(2)
+        self.assertEqual(list(smaller.all().times), [4000, 5000])
+
+class EnableHistoryTest(unittest.TestCase):
+
+    def testDefaultImplementationKeepsSamplesWhenGrowing(self):
+        parameter = PlainParameter()
+        history = parameter.enableHistory(2)
+        history.append(1.0, 1)
+        history.append(2.0, 2)
+        self.assertIs(parameter.enableHistory(1), history)
+        grown = parameter.enableHistory(4)
+        self.assertIs(parameter.history(), grown)
+        self.assertEqual(list(grown.all().values), [1.0, 2.0])
+
+    def testTableParameterKeepsSamplesWhenGrowing(self):
+        table = ParameterTable()
+        slot = table.add('VOLT', 'double')
+        parameter = table.parameter('VOLT')
+        parameter.enableHistory(2)
+        for value in (1.0, 2.0, 3.0):
+            table.setValue(slot, value)
+        grown = parameter.enableHistory(5)
+        table.setValue(slot, 4.0)
+        self.assertEqual(list(grown.all().values), [2.0, 3.0, 4.0])
+        self.assertIs(parameter.history(), grown)
+
+if __name__ == '__main__':
+    unittest.main()
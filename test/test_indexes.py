@@ -0,0 +1,64 @@
+'''
+Tests of the sorted name index used by findParameters and findCommands
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import re
+import unittest
+from fnmatch import fnmatchcase
+from space.indexes import NameIndex, globPrefix, regexPrefix
+
+NAMES = ['BAT_VOLT', 'BAT.TEMP', 'BATX', 'BA', 'ADCS_MODE', 'BAT_CURR', 'bat_volt', 'B1', 'BAT9']
+
+class PrefixTest(unittest.TestCase):
+
+    def testRegexPrefix(self):
+        for regexp, prefix in (('BAT', 'BAT'), ('^BAT_.*', 'BAT_'), ('BATX?', 'BAT'), ('BAT+', 'BAT'),
+                               (r'BAT\.T', 'BAT.T'), (r'BAT\d', 'BAT'), (r'BAT\.?', 'BAT'),
+                               ('BA{0}', 'B'), ('BAT|ADCS', ''), ('(BAT)', ''), ('[AB]', '')):
+            self.assertEqual(regexPrefix(regexp), prefix, regexp)
+
+    def testGlobPrefix(self):
+        self.assertEqual(globPrefix('BAT*'), 'BAT')
+        self.assertEqual(globPrefix('B?T'), 'B')
+        self.assertEqual(globPrefix('[AB]*'), '')
+        self.assertEqual(globPrefix('BAT_VOLT'), 'BAT_VOLT')
+
+class NameIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.index = NameIndex(NAMES)
+
+    def testMatchesAScan(self):
+        for regexp in ('BAT', 'BAT_', r'BAT\.', 'BATX?', r'BAT\d', 'BAT|ADCS', '.*VOLT', '(?i)bat_v', 'B', 'Z'):
+            self.assertEqual(self.index.match(regexp), [n for n in NAMES if re.match(regexp, n)], regexp)
+        for pattern in ('BAT*', 'B?', '*VOLT', '[AB]*', 'BAT_VOLT', 'Z*'):
+            self.assertEqual(self.index.glob(pattern), [n for n in NAMES if fnmatchcase(n, pattern)], pattern)
+        self.assertEqual(self.index.prefix('BAT_'), ['BAT_VOLT', 'BAT_CURR'])
+        self.assertEqual(self.index.match(''), NAMES)
+
+    def testChangesClearTheMemoizedResults(self):
+        self.assertEqual(self.index.glob('BAT_*'), ['BAT_VOLT', 'BAT_CURR'])
+        self.index.add('BAT_LOAD')
+        self.index.add('BAT_VOLT')
+        self.assertEqual(self.index.glob('BAT_*'), ['BAT_VOLT', 'BAT_CURR', 'BAT_LOAD'])
+        self.index.remove('BAT_VOLT')
+        self.index.remove('UNKNOWN')
+        self.assertEqual(self.index.glob('BAT_*'), ['BAT_CURR', 'BAT_LOAD'])
+        self.assertNotIn('BAT_VOLT', self.index)
+        self.assertEqual(len(self.index), len(NAMES))
+
+    def testResultsAreCopies(self):
+        result = self.index.match('BAT')
+        result.clear()
+        self.assertEqual(len(self.index.match('BAT')), 5)
+
+    def testCacheSizeIsBounded(self):
+        index = NameIndex(NAMES, cacheSize=2)
+        for pattern in ('A*', 'B*', 'BA*', 'BAT*'):
+            index.glob(pattern)
+        self.assertEqual(len(index._cache), 2)
+        self.assertEqual(index.glob('A*'), ['ADCS_MODE'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+'''
+Tests of the JSONL journal of verify and waitFor outcomes
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import json
+import os
+import tempfile
+import unittest
+import space
+from space import Journal, VerifyError, setJournal, verify, waitFor
+
+class Unprintable(object):
+
+    def __str__(self):
+        raise RuntimeError('str')
+
+    def __repr__(self):
+        raise RuntimeError('repr')
+
+class JournalTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'journal.jsonl')
+        self.journal = Journal(self.path)
+        self.addCleanup(self.journal.close)
+        self.addCleanup(setJournal, setJournal(self.journal))
+
+    def records(self):
+        self.assertTrue(self.journal.flush(5))
+        with open(self.path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+
+    def testStepsAreRecorded(self):
+        verify(True, voltage=28.0)
+        with self.assertRaises(VerifyError):
+            verify(False)
+        with self.assertRaises(space.TimeoutError):
+            waitFor(lambda: False, timeout=0.01, pollPeriod=0.01)
+        records = self.records()
+        self.assertEqual([(r['kind'], r['outcome']) for r in records],
+                         [('verify', True), ('verify', False), ('waitFor', False)])
+        self.assertEqual(records[0]['values'], {'voltage': 28.0})
+        self.assertEqual(records[0]['file'], __file__)
+        self.assertGreater(records[0]['line'], 0)
+        self.assertEqual(records[2]['timeout'], 0.01)
+
+    def testKeysThatAreNotStrings(self):
+        verify(True, t={(1, 2): 3})
+        verify(True, after=1)
+        records = self.records()
+        self.assertEqual(records[0]['values'], {'t': {'(1, 2)': 3}})
+        self.assertEqual(records[1]['values'], {'after': 1})
+
+    def testUnencodableRecordDoesNotStopTheWriter(self):
+        cycle:list = list()
+        cycle.append(cycle)
+        verify(True, cycle=cycle)
+        with self.assertLogs('space', 'ERROR'):
+            verify(True, bad={Unprintable(): 1})
+            self.assertTrue(self.journal.flush(5))
+        verify(True, after=1)
+        records = self.records()
+        self.assertEqual(len(records), 2)
+        self.assertIn('unencodable', records[0])
+        self.assertEqual(records[1]['values'], {'after': 1})
+
+    def testValuesAreRecordedAsTheyWereAtTheCall(self):
+        values = [1, 2, 3]
+        self.journal.record({'values': values})
+        verify(True, values=values)
+        values.append(99)
+        records = self.records()
+        self.assertEqual(records[0], {'values': [1, 2, 3]})
+        self.assertEqual(records[1]['values'], {'values': [1, 2, 3]})
+
+    def testCloseWritesQueuedRecords(self):
+        verify(True)
+        self.journal.close(5)
+        self.assertTrue(self.journal.flush())
+        with open(self.path, encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+if __name__ == '__main__':
+    unittest.main()
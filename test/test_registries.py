@@ -0,0 +1,84 @@
+'''
+Tests of the hierarchical asset registry
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import unittest
+from space import AssetRegistry, IllegalAssetError
+from support import PlainAsset
+
+class AssetRegistryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = AssetRegistry()
+        self.assets = dict()
+        for path, assetType in (('SAT1', 'SpaceSystem'), ('SAT1.ADCS.Wheel1', 'GemsDevice'),
+                                ('SAT1.ADCS.Wheel2', 'GemsDevice'), ('SAT10', 'SpaceSystem'),
+                                ('GS.Antenna', None)):
+            asset = self.assets[path] = PlainAsset(path.split('.')[-1])
+            self.registry.register(asset, path, assetType)
+
+    def testLookup(self):
+        self.assertIs(self.registry.lookup('SAT1.ADCS.Wheel1'), self.assets['SAT1.ADCS.Wheel1'])
+        self.assertIsNone(self.registry.get('SAT1.ADCS'))
+        self.assertNotIn('SAT1.ADCS', self.registry)
+        with self.assertRaises(IllegalAssetError):
+            self.registry.lookup('SAT2')
+        self.assertEqual(self.registry.register(PlainAsset('SAT3')), 'SAT3')
+        with self.assertRaises(IllegalAssetError):
+            self.registry.register(PlainAsset(), 'SAT1..ADCS')
+
+    def testTree(self):
+        self.assertEqual(self.registry.children(), ['SAT1', 'SAT10', 'GS'])
+        self.assertEqual(self.registry.children('SAT1.ADCS'), ['Wheel1', 'Wheel2'])
+        self.assertEqual(self.registry.subtree('SAT1'), ['SAT1', 'SAT1.ADCS.Wheel1', 'SAT1.ADCS.Wheel2'])
+        self.assertEqual(self.registry.subtree('SAT1.ADCS'), ['SAT1.ADCS.Wheel1', 'SAT1.ADCS.Wheel2'])
+        self.assertEqual(len(self.registry.subtree('')), 5)
+
+    def testFind(self):
+        wheels = [self.assets['SAT1.ADCS.Wheel1'], self.assets['SAT1.ADCS.Wheel2']]
+        self.assertEqual(self.registry.find('SAT1.*Wheel'), wheels)
+        self.assertEqual(self.registry.find('SAT1.*', glob=True), wheels)
+        self.assertEqual(self.registry.find(assetType='GemsDevice'), wheels)
+        self.assertEqual(self.registry.ofType('PlainAsset'), [self.assets['GS.Antenna']])
+        self.assertEqual(self.registry.find('SAT', assetType='SpaceSystem'),
+                         [self.assets['SAT1'], self.assets['SAT10']])
+        self.assertEqual(self.registry.find(assetType='Unknown'), [])
+
+    def testStates(self):
+        self.assertEqual(len(self.registry.inState('UP')), 5)
+        self.registry.updateState('SAT1.ADCS.Wheel2', 'DOWN')
+        self.assertEqual(self.registry.inState('DOWN'), [self.assets['SAT1.ADCS.Wheel2']])
+        self.assertEqual(self.registry.find(assetType='GemsDevice', state='UP'), [self.assets['SAT1.ADCS.Wheel1']])
+        self.registry.updateState('SAT1.ADCS.Wheel2')
+        self.assertEqual(self.registry.inState('DOWN'), [])
+        with self.assertRaises(IllegalAssetError):
+            self.registry.updateState('SAT2', 'DOWN')
+
+    def testStateIndexIsOnlyRefreshedByUpdateState(self):
+        antenna = self.assets['GS.Antenna']
+        antenna.state = lambda: 'DOWN'
+        self.assertEqual(self.registry.inState('DOWN'), [])
+        self.registry.updateState('GS.Antenna')
+        self.assertEqual(self.registry.inState('DOWN'), [antenna])
+
+    def testUnregisterPrunesEmptyLevels(self):
+        wheel = self.registry.unregister('SAT1.ADCS.Wheel1')
+        self.assertIs(wheel, self.assets['SAT1.ADCS.Wheel1'])
+        self.assertEqual(self.registry.children('SAT1.ADCS'), ['Wheel2'])
+        self.registry.unregister('SAT1.ADCS.Wheel2')
+        self.assertEqual(self.registry.children('SAT1'), [])
+        self.assertEqual(self.registry.find(assetType='GemsDevice'), [])
+        self.assertIn('SAT1', self.registry)
+        with self.assertRaises(IllegalAssetError):
+            self.registry.unregister('SAT1.ADCS')
+
+    def testReplacingAnAsset(self):
+        replacement = PlainAsset('SAT1')
+        self.registry.register(replacement, 'SAT1', 'GroundSystem')
+        self.assertIs(self.registry.lookup('SAT1'), replacement)
+        self.assertEqual(self.registry.ofType('SpaceSystem'), [self.assets['SAT10']])
+        self.assertEqual(len(self.registry), 5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+'''
+Tests of the Parameter value restrictions
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from space import IllegalValueError, SpecificTime, TimeInterval
+from space.parameters import EnumerationR, MaxInclusiveR, MaxNanosR, MaxSecondsExclusiveR, MaxSecondsInclusiveR, \
+    MinInclusiveR, MinNanosR, MinSecondsExclusiveR, MinSecondsInclusiveR, PatternR
+from space.times import toNanos
+
+class InternedRestrictionTest(unittest.TestCase):
+
+    def testEqualArgumentsShareAnInstance(self):
+        self.assertIs(MinInclusiveR(1), MinInclusiveR(1))
+        self.assertIs(MinInclusiveR(1), MinInclusiveR(minVal=1))
+        self.assertIs(EnumerationR(['On', 'Off']), EnumerationR(('On', 'Off')))
+        self.assertIs(PatternR('[A-Z]+'), PatternR('[A-Z]+'))
+
+    def testConstructorMayBuildOtherRestrictions(self):
+        class Outer(MinInclusiveR):
+            __slots__ = ('inner',)
+            def __init__(self, minVal):
+                super().__init__(minVal)
+                object.__setattr__(self, 'inner', MaxInclusiveR(minVal + 1))
+        result = list()
+        builder = threading.Thread(target=lambda: result.append(Outer(41)), daemon=True)
+        builder.start()
+        builder.join(5)
+        self.assertFalse(builder.is_alive(), 'interning deadlocked')
+        self.assertIs(result[0], Outer(41))
+        self.assertIs(result[0].inner, MaxInclusiveR(42))
+
+    def testArgumentTypesAreDistinguished(self):
+        self.assertIsNot(MinInclusiveR(1), MinInclusiveR(1.0))
+        self.assertNotEqual(MinInclusiveR(1), MinInclusiveR(1.0))
+        self.assertNotEqual(MinInclusiveR(1), MaxInclusiveR(1))
+
+    def testEqualityAndHash(self):
+        self.assertEqual({MinInclusiveR(2), MinInclusiveR(2), MaxInclusiveR(2)},
+                         {MinInclusiveR(2), MaxInclusiveR(2)})
+        self.assertNotEqual(MinInclusiveR(2), 2)
+
+    def testRestrictionsAreImmutable(self):
+        restriction = MinInclusiveR(3)
+        with self.assertRaises(AttributeError):
+            restriction.minVal = 4
+        with self.assertRaises(AttributeError):
+            del restriction.minVal
+        self.assertTrue(restriction.validate(3))
+
+    def testSlotsLeaveNoInstanceDictionary(self):
+        for restriction in (MinInclusiveR(0), EnumerationR(['On']), PatternR('x'), MaxSecondsInclusiveR(1)):
+            self.assertFalse(hasattr(restriction, '__dict__'), restriction)
+
+class EnumerationRTest(unittest.TestCase):
+
+    def testMembership(self):
+        enumeration = EnumerationR(['On', 'Off'])
+        self.assertTrue(enumeration.validate('On'))
+        self.assertFalse(enumeration.validate('Standby'))
+        self.assertFalse(enumeration.validate(['On']))
+
+    def testCodesArePositions(self):
+        enumeration = EnumerationR(['On', 'Off', 'Standby'])
+        self.assertEqual([enumeration.encode(name) for name in ('On', 'Off', 'Standby')], [0, 1, 2])
+        self.assertEqual(enumeration.decode(2), 'Standby')
+        with self.assertRaises(IllegalValueError):
+            enumeration.encode('Unknown')
+
+    def testDuplicateNamesKeepTheFirstCode(self):
+        enumeration = EnumerationR(['On', 'Off', 'On'])
+        self.assertEqual(enumeration.encode('On'), 0)
+
+    def testTypecodeFitsEveryCode(self):
+        self.assertEqual(EnumerationR(['A', 'B']).typecode(), 'B')
+        self.assertEqual(EnumerationR([str(i) for i in range(300)]).typecode(), 'H')
+        self.assertEqual(EnumerationR([str(i) for i in range(70000)]).typecode(), 'I')
+
+class TimeRestrictionTest(unittest.TestCase):
+
+    def testTimesCompareAsEpochNanoseconds(self):
+        bound = 86400
+        self.assertTrue(MinSecondsInclusiveR(bound).validate(SpecificTime(1970, 1, 2)))
+        self.assertFalse(MinSecondsExclusiveR(bound).validate(SpecificTime(1970, 1, 2)))
+        self.assertTrue(MaxSecondsInclusiveR(bound).validate(datetime(1970, 1, 2)))
+        self.assertFalse(MaxSecondsExclusiveR(bound).validate(datetime(1970, 1, 2)))
+        self.assertTrue(MaxSecondsExclusiveR(bound).validate(SpecificTime(1970, 1, 1, 23, 59, 59, 999999)))
+
+    def testTimeZonesAreApplied(self):
+        eastern = timezone(timedelta(hours=-5))
+        # 1970-01-01T19:00-05:00 is the first second of 1970-01-02 in UTC
+        self.assertTrue(MinSecondsInclusiveR(86400).validate(datetime(1970, 1, 1, 19, tzinfo=eastern)))
+        self.assertFalse(MinSecondsInclusiveR(86400).validate(datetime(1970, 1, 1, 18, 59, tzinfo=eastern)))
+
+    def testIntervalsAndFractionalSeconds(self):
+        self.assertTrue(MaxSecondsInclusiveR(1.5).validate(timedelta(seconds=1, microseconds=500000)))
+        self.assertFalse(MaxSecondsInclusiveR(1.5).validate(timedelta(seconds=1, microseconds=500001)))
+        self.assertFalse(MinSecondsExclusiveR(1.5).validate(TimeInterval.fromNanos(1500000000)))
+        self.assertTrue(MinSecondsExclusiveR(1.5).validate(TimeInterval.fromNanos(1500000001)))
+
+    def testSubmicrosecondPrecisionIsKept(self):
+        t = SpecificTime.fromNanos(86400 * 1000000000 + 1)
+        self.assertEqual(toNanos(t), 86400 * 1000000000 + 1)
+        self.assertTrue(MinSecondsExclusiveR(86400).validate(t))
+        self.assertTrue(MinNanosR(1).validate(t))
+        self.assertFalse(MaxNanosR(0).validate(t))
+
+    def testModuleToNanos(self):
+        self.assertEqual(toNanos(datetime(1970, 1, 1, 0, 0, 1)), 1000000000)
+        self.assertEqual(toNanos(timedelta(days=-1)), -86400 * 1000000000)
+        self.assertEqual(toNanos(SpecificTime(1970, 1, 1, 0, 0, 1)), 1000000000)
+        self.assertEqual(toNanos(42), 42)
+
+if __name__ == '__main__':
+    unittest.main()
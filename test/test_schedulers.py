@@ -0,0 +1,159 @@
+'''
+Tests of the wait and time-tag schedulers
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import concurrent.futures
+import threading
+import time
+import unittest
+from space import SpecificTime, TimeInterval, TimeTagScheduler, WaitScheduler, notifyWaiters, setWaitScheduler, \
+    waitForStatus
+from support import PlainAsset, PlainParameter
+
+class WaitSchedulerTest(unittest.TestCase):
+
+    def install(self, scheduler):
+        previous = setWaitScheduler(scheduler)
+        self.addCleanup(setWaitScheduler, previous)
+        return scheduler
+
+    def testConditionBecomesTrue(self):
+        scheduler = WaitScheduler()
+        deadline = time.monotonic() + 0.1
+        self.assertTrue(scheduler.waitFor(lambda: time.monotonic() >= deadline, timeout=5, pollPeriod=0.01))
+        self.assertEqual(scheduler.pending(), 0)
+
+    def testTimeoutAndErrors(self):
+        scheduler = WaitScheduler()
+        status = scheduler.waitForStatus(lambda: False, timeout=0.1, pollPeriod=0.02)
+        self.assertFalse(status.satisfied)
+        self.assertGreaterEqual(status.elapsed, 0.1)
+        with self.assertRaises(ZeroDivisionError):
+            scheduler.waitFor(lambda: 1 / 0, timeout=1, pollPeriod=0.01)
+
+    def testEventDrivenWaitIsWokenByIngest(self):
+        scheduler = self.install(WaitScheduler(eventDriven=True))
+        parameter = PlainParameter()
+        writer = threading.Timer(0.05, parameter.setValue, (5.0,))
+        writer.start()
+        start = time.monotonic()
+        self.assertTrue(scheduler.waitFor(lambda: parameter.value() == 5.0, timeout=10))
+        self.assertLess(time.monotonic() - start, 5)
+
+    def testEventDrivenConditionAlreadyTrue(self):
+        status = WaitScheduler(eventDriven=True).waitForStatus(lambda: True, timeout=2)
+        self.assertTrue(status.satisfied)
+        self.assertLess(status.elapsed, 1)
+        self.assertEqual(status.polls, 1)
+
+    def testEventDrivenIngestBeforeTheWaitIsRegistered(self):
+        self.install(WaitScheduler(eventDriven=True))
+        parameter = PlainParameter()
+        def condition():
+            satisfied = parameter.value() == 5.0
+            if parameter.value() is None:
+                # the ingest lands after the first check, while no wait is pending
+                parameter.setValue(5.0)
+            return satisfied
+        status = waitForStatus(condition, timeout=2)
+        self.assertTrue(status.satisfied)
+        self.assertLess(status.elapsed, 1)
+
+    def testPollingWaitIsNotWokenByIngest(self):
+        scheduler = self.install(WaitScheduler())
+        stop = threading.Event()
+        def ingest():
+            while not stop.is_set():
+                notifyWaiters()
+                time.sleep(0.001)
+        writer = threading.Thread(target=ingest)
+        writer.start()
+        try:
+            status = scheduler.waitForStatus(lambda: False, timeout=0.2, pollPeriod=10)
+        finally:
+            stop.set()
+            writer.join()
+        self.assertFalse(status.satisfied)
+        self.assertEqual(status.polls, 1)
+
+class TimeTagSchedulerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = TimeTagScheduler()
+        self.fired = list()
+        self.done = threading.Event()
+
+    def action(self, name, last=False):
+        def run():
+            self.fired.append(name)
+            if last:
+                self.done.set()
+        return run
+
+    def testActionsRunInTimeTagOrder(self):
+        self.scheduler.schedule(TimeInterval(seconds=0.06), self.action('C', True))
+        self.scheduler.schedule(TimeInterval(seconds=0.02), self.action('A'))
+        self.scheduler.schedule(SpecificTime.now() + TimeInterval(seconds=0.04), self.action('B'))
+        self.assertEqual([tag.name for tag in self.scheduler.pending()], ['run'] * 3)
+        self.assertTrue(self.done.wait(5))
+        self.assertEqual(self.fired, ['A', 'B', 'C'])
+        self.assertEqual(self.scheduler.jitter()['count'], 3)
+        self.assertEqual(self.scheduler.pending(), [])
+
+    def testPastTimeTagRunsAtOnce(self):
+        tag = self.scheduler.schedule(SpecificTime.now() - TimeInterval(seconds=60), self.action('A', True))
+        self.assertTrue(self.done.wait(5))
+        self.assertEqual(tag.state(), 'fired')
+        self.assertIsNotNone(tag.firedAt)
+        self.assertGreaterEqual(tag.jitter, 60000)
+
+    def testCancel(self):
+        tag = self.scheduler.schedule(TimeInterval(seconds=0.05), self.action('A'))
+        self.scheduler.schedule(TimeInterval(seconds=0.1), self.action('B', True))
+        self.assertTrue(self.scheduler.cancel(tag))
+        self.assertFalse(self.scheduler.cancel(tag))
+        self.assertEqual(tag.state(), 'canceled')
+        self.assertTrue(self.done.wait(5))
+        self.assertEqual(self.fired, ['B'])
+
+    def testReschedule(self):
+        first = self.scheduler.schedule(TimeInterval(seconds=0.05), self.action('A'))
+        self.scheduler.schedule(TimeInterval(seconds=0.1), self.action('B', True))
+        self.assertTrue(self.scheduler.reschedule(first, TimeInterval(seconds=0.2)))
+        self.assertEqual(self.scheduler.pending()[-1], first)
+        self.assertTrue(self.done.wait(5))
+        self.assertEqual(self.fired, ['B'])
+        self.done.clear()
+        deadline = time.monotonic() + 5
+        while first.state() == 'pending' and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.fired, ['B', 'A'])
+        self.assertFalse(self.scheduler.reschedule(first, TimeInterval(seconds=1)))
+
+    def testFailedActionIsRecorded(self):
+        def fail():
+            self.done.set()
+            raise RuntimeError('boom')
+        with self.assertLogs('space', 'ERROR'):
+            tag = self.scheduler.schedule(TimeInterval(seconds=0), fail)
+            self.assertTrue(self.done.wait(5))
+            deadline = time.monotonic() + 5
+            while tag.state() != 'failed' and time.monotonic() < deadline:
+                time.sleep(0.01)
+        self.assertIsInstance(tag.error, RuntimeError)
+
+    def testCommandsAndExecutor(self):
+        executor = concurrent.futures.ThreadPoolExecutor(1)
+        self.addCleanup(executor.shutdown)
+        scheduler = TimeTagScheduler(executor)
+        asset = PlainAsset()
+        tag = scheduler.scheduleCommand(TimeInterval(seconds=0.01), asset, 'RESET', mode='cold')
+        self.assertEqual(tag.name, 'PLAIN.RESET')
+        deadline = time.monotonic() + 5
+        while not asset.sent and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(asset.sent, [('RESET', {'mode': 'cold'})])
+
+if __name__ == '__main__':
+    unittest.main()
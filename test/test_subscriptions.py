@@ -0,0 +1,91 @@
+'''
+Tests of Parameter and Asset subscriptions
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import time
+import unittest
+from space import ParameterTable, Subscription, SubscriptionDispatcher
+from support import PlainParameter
+
+class SubscriptionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dispatcher = SubscriptionDispatcher()
+        self.received = list()
+
+    def subscribe(self, parameter, **kwds):
+        subscription = Subscription(lambda p, value, t: self.received.append(value),
+                                    dispatcher=self.dispatcher, **kwds)
+        subscription.attach(parameter)
+        return subscription
+
+    def testEveryChangeIsDelivered(self):
+        parameter = PlainParameter()
+        self.subscribe(parameter)
+        parameter.setValue(1.0)
+        self.dispatcher.flush(5)
+        parameter.setValue(2.0)
+        self.dispatcher.flush(5)
+        self.assertEqual(self.received, [1.0, 2.0])
+
+    def testDeadband(self):
+        parameter = PlainParameter()
+        self.subscribe(parameter, deadband=0.5)
+        for value in (1.0, 1.2, 1.4, 2.0):
+            parameter.setValue(value)
+            self.dispatcher.flush(5)
+        self.assertEqual(self.received, [1.0, 2.0])
+
+    def testUnchangedTextIsNotDelivered(self):
+        parameter = PlainParameter(type='string')
+        self.subscribe(parameter, deadband=1.0)
+        for value in ('On', 'On', 'Off'):
+            parameter.setValue(value)
+            self.dispatcher.flush(5)
+        self.assertEqual(self.received, ['On', 'Off'])
+
+    def testFinalThrottledSampleIsDelivered(self):
+        parameter = PlainParameter()
+        self.subscribe(parameter, minInterval=0.1)
+        for value in (1.0, 2.0, 3.0):
+            parameter.setValue(value)
+        self.dispatcher.flush(5)
+        self.assertEqual(self.received, [1.0])
+        deadline = time.monotonic() + 5
+        while len(self.received) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.received, [1.0, 3.0])
+
+    def testThrottledSampleWithinDeadbandIsDropped(self):
+        parameter = PlainParameter()
+        self.subscribe(parameter, deadband=0.5, minInterval=0.05)
+        parameter.setValue(1.0)
+        parameter.setValue(1.1)
+        time.sleep(0.2)
+        self.dispatcher.flush(5)
+        self.assertEqual(self.received, [1.0])
+
+    def testCancelStopsDelivery(self):
+        parameter = PlainParameter()
+        subscription = self.subscribe(parameter)
+        subscription.cancel()
+        parameter.setValue(1.0)
+        self.dispatcher.flush(5)
+        self.assertFalse(subscription.active())
+        self.assertEqual(self.received, [])
+
+    def testTableUpdatesAreGrouped(self):
+        table = ParameterTable()
+        table.add('VOLT', 'double')
+        table.add('TEMP', 'double')
+        batches = list()
+        subscription = Subscription(batches.append, grouped=True, dispatcher=self.dispatcher)
+        subscription.attach(table.parameter('VOLT'))
+        subscription.attach(table.parameter('TEMP'))
+        table.setValues(['VOLT', 'TEMP'], [28.0, 20.5])
+        self.dispatcher.flush(5)
+        self.assertEqual(batches, [{'VOLT': 28.0, 'TEMP': 20.5}])
+
+if __name__ == '__main__':
+    unittest.main()
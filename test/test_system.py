@@ -0,0 +1,44 @@
+'''
+Tests of the verify function and the line numbers reported by verify and
+waitFor
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import inspect
+import unittest
+import space
+from space import VerifyError, times, verify, waitFor
+
+def _noFrames(depth=0):
+    raise AttributeError('_getframe')
+
+class VerifyTest(unittest.TestCase):
+
+    def testTrueIsReturned(self):
+        self.assertTrue(verify(True))
+
+    def testFailureNamesTheLine(self):
+        line = inspect.currentframe().f_lineno + 2
+        with self.assertRaises(VerifyError) as raised:
+            verify(1 > 2)
+        self.assertEqual(str(raised.exception), 'Verify at line %d is False' % line)
+
+    def testTimeoutNamesTheLine(self):
+        line = inspect.currentframe().f_lineno + 2
+        with self.assertRaises(space.TimeoutError) as raised:
+            waitFor(lambda: False, timeout=0.01, pollPeriod=0.01)
+        self.assertEqual(str(raised.exception), 'Wait at line %d timed out' % line)
+
+    def testWithoutFramesTheLineIsZero(self):
+        getframe = times._getframe
+        times._getframe = _noFrames
+        try:
+            self.assertIsNone(times._callerFrame())
+            with self.assertRaises(VerifyError) as raised:
+                verify(False)
+        finally:
+            times._getframe = getframe
+        self.assertEqual(str(raised.exception), 'Verify at line 0 is False')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+'''
+Tests of the columnar ParameterTable and its Parameter views
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import threading
+import time
+import unittest
+from space import IllegalValueError, ParameterTable, UndefinedTypeError, UnknownParameterError
+from space.parameters import MaxInclusiveR, MinInclusiveR
+from space.tables import NO_TIME
+from space.times import nowNanos
+
+class ParameterTableTest(unittest.TestCase):
+
+    def setUp(self):
+        self.table = ParameterTable()
+        self.volt = self.table.add('BUS_VOLT', 'double', 'Bus voltage', 'V',
+                                   [MinInclusiveR(0.0), MaxInclusiveR(40.0)])
+        self.mode = self.table.add('BUS_MODE', 'string', value='Off')
+
+    def testSlotsAndViews(self):
+        self.assertEqual(len(self.table), 2)
+        self.assertEqual(self.table.slot('BUS_MODE'), self.mode)
+        self.assertIsNone(self.table.slot('UNKNOWN'))
+        self.assertIsNone(self.table.parameter('UNKNOWN'))
+        view = self.table.parameter('BUS_VOLT')
+        self.assertIs(self.table.parameter('BUS_VOLT'), view)
+        self.assertEqual((view.name(), view.type(), view.description(), view.units()),
+                         ('BUS_VOLT', 'double', 'Bus voltage', 'V'))
+        self.assertFalse(hasattr(view, '__dict__'))
+
+    def testDefinitionsAreChecked(self):
+        with self.assertRaises(IllegalValueError):
+            self.table.add('BUS_VOLT', 'double')
+        with self.assertRaises(UndefinedTypeError):
+            self.table.add('BUS_TEMP', 'complex')
+
+    def testSetValueConvertsAndValidates(self):
+        self.table.setValue(self.volt, '28.5', raw=2850)
+        view = self.table.parameter('BUS_VOLT')
+        self.assertEqual(view.value(), 28.5)
+        self.assertEqual(view.raw(), 2850)
+        self.assertIn('time', view.sample())
+        with self.assertRaises(IllegalValueError):
+            view.setValue(41.0)
+        self.assertEqual(view.value(), 28.5)
+
+    def testBulkReads(self):
+        self.assertEqual(self.table.times().tolist(), [NO_TIME, NO_TIME])
+        self.assertEqual(self.table.parameter('BUS_VOLT').sample(), {})
+        self.table.setValue(self.volt, 12.0)
+        self.assertEqual(self.table.values(), [12.0, 'Off'])
+        self.assertEqual(self.table.values(['BUS_MODE']), ['Off'])
+        self.assertEqual(self.table.snapshot(), {'BUS_VOLT': 12.0, 'BUS_MODE': 'Off'})
+        times = self.table.times()
+        self.assertNotEqual(times[self.volt], NO_TIME)
+        self.assertEqual(times[self.mode], NO_TIME)
+
+    def testSetValuesIsAllOrNothing(self):
+        with self.assertRaises(IllegalValueError):
+            self.table.setValues(['BUS_MODE', 'BUS_VOLT'], ['On', 50.0])
+        self.assertEqual(self.table.values(), [None, 'Off'])
+        with self.assertRaises(UnknownParameterError):
+            self.table.setValues(['BUS_MODE', 'UNKNOWN'], ['On', 1])
+        with self.assertRaises(IllegalValueError):
+            self.table.setValues(['BUS_MODE'], ['On', 'Off'])
+        self.table.setValues(['BUS_MODE', 'BUS_VOLT'], ['On', 30.0])
+        self.assertEqual(self.table.values(), [30.0, 'On'])
+        times = self.table.times()
+        self.assertEqual(times[self.volt], times[self.mode])
+
+    def testFind(self):
+        self.table.add('ADCS_MODE', 'string')
+        self.assertEqual(self.table.find('BUS_'), ['BUS_VOLT', 'BUS_MODE'])
+        self.assertEqual(self.table.find('*_MODE', glob=True), ['BUS_MODE', 'ADCS_MODE'])
+        self.assertEqual(self.table.names(), ['BUS_VOLT', 'BUS_MODE', 'ADCS_MODE'])
+
+class ConcurrentWriterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.table = ParameterTable()
+        self.slot = self.table.add('COUNT', 'long')
+
+    def testSampleTimeIsTakenUnderTheLock(self):
+        writer = threading.Thread(target=self.table.setValue, args=(self.slot, 1))
+        with self.table._lock:
+            writer.start()
+            time.sleep(0.05)
+            released = nowNanos()
+        writer.join(5)
+        self.assertGreaterEqual(self.table.times()[self.slot], released)
+
+    def testHistoryIsInSampleTimeOrder(self):
+        history = self.table.parameter('COUNT').enableHistory(4000)
+        def write(offset):
+            for i in range(1000):
+                if i % 2:
+                    self.table.setValue(self.slot, offset + i)
+                else:
+                    self.table.setValues(['COUNT'], [offset + i])
+        writers = [threading.Thread(target=write, args=(n * 1000,)) for n in range(4)]
+        for writer in writers:
+            writer.start()
+        for writer in writers:
+            writer.join(30)
+        times = list(history.all().times)
+        self.assertEqual(len(times), 4000)
+        self.assertEqual(times, sorted(times))
+        self.assertEqual(times[-1], self.table.times()[self.slot])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,192 @@
+'''
+Tests of the nanosecond clock and SpecificTime conversions
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import os
+import time
+import unittest
+import space
+from space import Clock, MonotonicClock, ParameterTable, SpecificTime, TimeInterval, WaitScheduler, \
+    nowNanos, setClock, setWaitScheduler, waitFor, waitForStatus
+from space.arrays import np
+from space.times import _nextPollPeriod, clockNanos, toNanos
+from support import PlainParameter
+
+class FixedClock(Clock):
+
+    def __init__(self, nanos):
+        self._nanos = nanos
+
+    def nanos(self):
+        return self._nanos
+
+class ClockTest(unittest.TestCase):
+
+    def testSetClockReturnsThePrevious(self):
+        fixed = FixedClock(1700000000123456789)
+        previous = setClock(fixed)
+        try:
+            self.assertEqual(nowNanos(), 1700000000123456789)
+            self.assertEqual(SpecificTime.now().nanos(), 123456789)
+        finally:
+            self.assertIs(setClock(previous), fixed)
+
+    def testMonotonicClockFollowsTheSystemTime(self):
+        clock = MonotonicClock()
+        first = clock.nanos()
+        self.assertLessEqual(first, clock.nanos())
+        self.assertLess(abs(first - time.time_ns()), 10**9)
+
+    def testNanosRoundTrip(self):
+        nanos = 1700000000123456789
+        self.assertEqual(SpecificTime.fromNanos(nanos).toNanos(), nanos)
+        self.assertEqual(toNanos(SpecificTime.fromNanos(nanos)), nanos)
+        self.assertEqual(TimeInterval.fromNanos(1500).toNanos(), 1500)
+
+class ParseTest(unittest.TestCase):
+
+    def testFromStrIsCached(self):
+        text = '2024-03-01T12:30:45.123456789'
+        t = SpecificTime.fromStr(text)
+        self.assertIs(SpecificTime.fromStr(text), t)
+        self.assertEqual(t.nanos(), 123456789)
+        self.assertIs(TimeInterval.fromStr('1T02:03:04.5'), TimeInterval.fromStr('1T02:03:04.5'))
+
+    def testIntervalFields(self):
+        self.assertEqual(TimeInterval.fromStr('1T02:03:04.000000007').toNanos(),
+                         ((86400 + 7384) * 10**9) + 7)
+        self.assertEqual(TimeInterval.fromStr('-2T00:00:01').toNanos(), (-2 * 86400 + 1) * 10**9)
+        with self.assertRaises(ValueError):
+            TimeInterval.fromStr('1:')
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class ParseManyTest(unittest.TestCase):
+
+    def testTimesMatchFromStr(self):
+        texts = ['2024-03-01T12:30:45.123456789', '1970-01-01T00:00:01']
+        nanos = SpecificTime.parseMany(texts).view(np.int64).tolist()
+        self.assertEqual(nanos, [SpecificTime.fromStr(text).toNanos() for text in texts])
+
+    def testTimeZonesUseFromStr(self):
+        parsed = SpecificTime.parseMany(['2024-03-01T12:00:00+02:00', SpecificTime(2024, 3, 1, 10)])
+        self.assertEqual(parsed.tolist()[0], parsed.tolist()[1])
+        self.assertEqual(parsed.dtype, np.dtype('datetime64[ns]'))
+
+    def testIntervalsMatchFromStr(self):
+        texts = ['0T00:00:01.5', '-1T00:00:00', '0T00:00:01.5']
+        nanos = TimeInterval.parseMany(texts).view(np.int64).tolist()
+        self.assertEqual(nanos, [TimeInterval.fromStr(text).toNanos() for text in texts])
+        self.assertEqual(TimeInterval.parseMany([TimeInterval(seconds=2)]).view(np.int64).tolist(), [2 * 10**9])
+        self.assertEqual(len(TimeInterval.parseMany([])), 0)
+
+@unittest.skipUnless(hasattr(time, 'tzset'), 'time zones cannot be changed')
+class SampleTimeBasisTest(unittest.TestCase):
+    '''Sample times are compared with now() away from UTC'''
+
+    def setUp(self):
+        self.zone = os.environ.get('TZ', None)
+        os.environ['TZ'] = 'EST+05EDT,M3.2.0,M11.1.0'
+        time.tzset()
+
+    def tearDown(self):
+        if self.zone is None:
+            del os.environ['TZ']
+        else:
+            os.environ['TZ'] = self.zone
+        time.tzset()
+
+    def assertNow(self, t):
+        self.assertLess(abs((SpecificTime.now() - t).total_seconds()), 5)
+
+    def testClockNanosMatchNow(self):
+        nanos = nowNanos()
+        t = SpecificTime.fromClockNanos(nanos)
+        self.assertNow(t)
+        self.assertEqual(clockNanos(t), nanos)
+        self.assertEqual(clockNanos(nanos), nanos)
+
+    def testTableSampleTime(self):
+        table = ParameterTable()
+        slot = table.add('VOLT', 'double')
+        table.setValue(slot, 28.0)
+        self.assertNow(table.parameter('VOLT').sample()['time'])
+
+    def testHistoryRangeFromNow(self):
+        parameter = PlainParameter()
+        history = parameter.enableHistory(4)
+        history.append(1.0, nowNanos())
+        now = SpecificTime.now()
+        window = history.between(now - TimeInterval(seconds=5), now + TimeInterval(seconds=5))
+        self.assertEqual(list(window.values), [1.0])
+        history.append(2.0, SpecificTime.now())
+        self.assertLess(history.last(1).times[0] - history.last(2).times[0], 5 * 10**9)
+
+class FormatTest(unittest.TestCase):
+
+    def testDefaultFormats(self):
+        self.assertEqual(str(SpecificTime(2024, 3, 1, 2, 3, 4, 5)), '2024-03-01T02:03:04.000005')
+        self.assertEqual(str(TimeInterval(1, 3723, 5)), '1T01:02:03.000005')
+        self.assertEqual(str(TimeInterval(seconds=-0.5)), '-1T23:59:59.500000')
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class FormatManyTest(unittest.TestCase):
+
+    def testTimesMatchStr(self):
+        times = [SpecificTime(2024, 3, 1, 2, 3, 4, 5), SpecificTime(1970, 1, 1)]
+        self.assertEqual(SpecificTime.formatMany(times).tolist(), [str(t) for t in times])
+        nanos = np.array([1700000000123456789, 0], dtype='datetime64[ns]')
+        self.assertEqual(SpecificTime.formatMany(nanos).tolist(),
+                         ['2023-11-14T22:13:20.123456', '1970-01-01T00:00:00.000000'])
+        self.assertEqual(SpecificTime.formatMany(np.array(['NaT'], dtype='datetime64[ns]')).tolist(), ['NaT'])
+
+    def testIntervalsMatchStr(self):
+        intervals = [TimeInterval(1, 3723, 5), TimeInterval(seconds=-0.5), TimeInterval(-3)]
+        self.assertEqual(TimeInterval.formatMany(intervals).tolist(), [str(i) for i in intervals])
+        values = np.array([1500, 'NaT'], dtype='timedelta64[ms]')
+        self.assertEqual(TimeInterval.formatMany(values).tolist(), ['0T00:00:01.500000', 'NaT'])
+
+class WaitForTest(unittest.TestCase):
+
+    def testImmediatelyTrue(self):
+        status = waitForStatus(lambda: True, timeout=1)
+        self.assertTrue(status.satisfied)
+        self.assertEqual(status.polls, 1)
+
+    def testTimeoutNamesTheLine(self):
+        with self.assertRaises(space.TimeoutError) as raised:
+            waitFor(lambda: False, timeout=0.05, pollPeriod=0.01)
+        self.assertRegex(str(raised.exception), r'line \d+')
+
+    def testConditionTimeCountsAgainstTheTimeout(self):
+        def slow():
+            time.sleep(0.05)
+            return False
+        start = time.monotonic()
+        with self.assertRaises(space.TimeoutError):
+            waitFor(slow, timeout=0.2, pollPeriod=0.05)
+        self.assertLess(time.monotonic() - start, 0.45)
+
+    def testBackoffReducesPolls(self):
+        deadline = time.monotonic() + 0.3
+        status = waitForStatus(lambda: time.monotonic() >= deadline, timeout=5, pollPeriod=0.01, backoff=2.0)
+        self.assertTrue(status.satisfied)
+        self.assertLessEqual(status.polls, 8)
+
+    def testMaxPollPeriod(self):
+        self.assertEqual(_nextPollPeriod(0.1, 2.0, None), 0.2)
+        self.assertEqual(_nextPollPeriod(0.1, 2.0, 0.15), 0.15)
+        self.assertEqual(_nextPollPeriod(0.1, 1.0, 0.05), 0.05)
+
+    def testSchedulerPollsAreCounted(self):
+        previous = setWaitScheduler(WaitScheduler())
+        try:
+            deadline = time.monotonic() + 0.1
+            status = waitForStatus(lambda: time.monotonic() >= deadline, timeout=5, pollPeriod=0.02)
+        finally:
+            setWaitScheduler(previous)
+        self.assertTrue(status.satisfied)
+        self.assertGreater(status.polls, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+'''
+Tests of the update coalescer
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import threading
+import unittest
+from space import UnknownParameterError, UpdateCoalescer
+from support import PlainAsset, PlainParameter
+
+class GatedAsset(PlainAsset):
+    '''PlainAsset whose first poll waits until the gate is opened'''
+
+    def __init__(self, parameters):
+        super().__init__(parameters=parameters)
+        self.started = threading.Event()
+        self.gate = threading.Event()
+
+    def updateParameters(self, parameterList=[]):
+        if not self.started.is_set():
+            self.started.set()
+            self.gate.wait(5)
+        super().updateParameters(parameterList)
+
+class UpdateCoalescerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.asset = GatedAsset([PlainParameter('VOLT'), PlainParameter('TEMP')])
+        self.coalescer = UpdateCoalescer()
+        self.addCleanup(self.coalescer.shutdown)
+        self.addCleanup(self.asset.gate.set)
+        self.first = self.coalescer.request(self.asset, ['VOLT'])
+        self.assertTrue(self.asset.started.wait(5))
+
+    def testRequestsWhileRunningAreMerged(self):
+        second = self.coalescer.request(self.asset, ['TEMP', 'VOLT'])
+        third = self.coalescer.request(self.asset, ['VOLT'])
+        self.asset.gate.set()
+        for future in (self.first, second, third):
+            self.assertIsNone(future.result(5))
+        self.assertEqual(self.asset.polls, [['VOLT'], ['TEMP', 'VOLT']])
+
+    def testErrorsOnlyFailTheirRequester(self):
+        good = self.coalescer.request(self.asset, ['TEMP'])
+        bad = self.coalescer.request(self.asset, ['VOLT', 'CURR'])
+        self.asset.gate.set()
+        self.assertIsNone(self.first.result(5))
+        self.assertIsNone(good.result(5))
+        with self.assertRaises(UnknownParameterError) as raised:
+            bad.result(5)
+        self.assertIn('CURR', str(raised.exception))
+        self.assertEqual(self.asset.polls, [['VOLT'], ['TEMP']])
+
+    def testSingleRequesterIsNotPolledTwice(self):
+        bad = self.coalescer.request(self.asset, ['CURR'])
+        self.asset.gate.set()
+        with self.assertRaises(UnknownParameterError):
+            bad.result(5)
+        self.assertIsNone(self.first.result(5))
+        self.assertEqual(self.asset.polls, [['VOLT']])
+
+    def testUpdateRaisesTheErrorOfItsOwnRequest(self):
+        other = PlainAsset(parameters=[PlainParameter('LOAD')])
+        bad = self.coalescer.request(self.asset, ['CURR'])
+        self.asset.gate.set()
+        self.coalescer.update({self.asset: ['TEMP'], other: ['LOAD']}, 5)
+        with self.assertRaises(UnknownParameterError):
+            bad.result(5)
+        self.assertEqual(other.polls, [['LOAD']])
+
+if __name__ == '__main__':
+    unittest.main()
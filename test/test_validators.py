@@ -0,0 +1,105 @@
+'''
+Tests of the fused restriction validator
+'''
+__author__    = 'Space Domain Task Force (https://www.omg.org/solm/index.htm)'
+__copyright__ = 'Object Management Group under RF-Limited license (https://www.omg.org/cgi-bin/doc.cgi?ipr)'
+import unittest
+from space import compileRestrictions, IllegalRestrictionError
+from space.arrays import np
+from space.parameters import EnumerationR, LengthR, MaxExclusiveR, MaxInclusiveR, MaxLengthR, \
+    MaxSecondsInclusiveR, MinExclusiveR, MinInclusiveR, MinLengthR, PatternR, TotalDigitsR
+
+class FusedValidatorTest(unittest.TestCase):
+
+    def assertSameAsEach(self, restrictions, values):
+        fused = compileRestrictions(restrictions)
+        for value in values:
+            expected = all(r.validate(value) for r in restrictions)
+            self.assertEqual(fused.validate(value), expected, value)
+
+    def testBoundsAreMerged(self):
+        restrictions = [MinInclusiveR(0), MinExclusiveR(2), MaxInclusiveR(10), MaxExclusiveR(8)]
+        fused = compileRestrictions(restrictions)
+        self.assertEqual(set(fused.redundant), {MinInclusiveR(0), MaxInclusiveR(10)})
+        self.assertSameAsEach(restrictions, [0, 2, 3, 7.5, 8, 10])
+
+    def testEnumerationsAreIntersected(self):
+        restrictions = [EnumerationR(['On', 'Off', 'Standby']), EnumerationR(['On', 'Off'])]
+        self.assertSameAsEach(restrictions, ['On', 'Off', 'Standby', 'Unknown'])
+
+    def testLengthsAndPatterns(self):
+        restrictions = [MinLengthR(2), MaxLengthR(4), PatternR('[A-Z]+')]
+        self.assertSameAsEach(restrictions, ['A', 'AB', 'ABCD', 'ABCDE', 'ab'])
+        self.assertSameAsEach([LengthR(3)], ['AB', 'ABC', 'ABCD'])
+
+    def testFormattingRestrictionsAlwaysValidate(self):
+        fused = compileRestrictions([TotalDigitsR(2)])
+        self.assertTrue(fused.validate(12345))
+
+    def testContradictionsAreRejected(self):
+        with self.assertRaises(IllegalRestrictionError):
+            compileRestrictions([MinInclusiveR(10), MaxExclusiveR(10)])
+        with self.assertRaises(IllegalRestrictionError):
+            compileRestrictions([EnumerationR(['On']), EnumerationR(['Off'])])
+
+    def testUnexpectedTypeUsesEachRestriction(self):
+        restrictions = [MinInclusiveR(0)]
+        fused = compileRestrictions(restrictions)
+        with self.assertRaises(TypeError):
+            restrictions[0].validate('text')
+        with self.assertRaises(TypeError):
+            fused.validate('text')
+
+    def testViolationAndValidateMany(self):
+        fused = compileRestrictions([MinInclusiveR(0), MaxInclusiveR(10)])
+        self.assertEqual(fused.validateMany([-1, 5, 11]), [False, True, False])
+        self.assertEqual(fused.violation(11), MaxInclusiveR(10))
+        self.assertIsNone(fused.violation(5))
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class ValidateArrayTest(unittest.TestCase):
+
+    def assertSameAsValidate(self, restriction, values):
+        mask, indices = restriction.validateArray(values)
+        expected = [restriction.validate(value) for value in values]
+        self.assertEqual(mask.tolist(), expected)
+        self.assertEqual(indices.tolist(), [i for i, valid in enumerate(expected) if not valid])
+
+    def testNumericBounds(self):
+        values = [-1.5, 0, 2, 9.99, 10, 11]
+        for restriction in (MinInclusiveR(0), MinExclusiveR(0), MaxInclusiveR(10), MaxExclusiveR(10)):
+            self.assertSameAsValidate(restriction, values)
+
+    def testEnumeration(self):
+        self.assertSameAsValidate(EnumerationR(['On', 'Off']), ['On', 'Standby', 'Off'])
+
+    def testFallbackValidatesEachSample(self):
+        self.assertSameAsValidate(PatternR('[A-Z]+'), ['AB', 'ab', 'C'])
+
+    def testSecondsOnTimedeltaArray(self):
+        values = np.array([1, 5, 6], dtype='timedelta64[s]')
+        mask, indices = MaxSecondsInclusiveR(5).validateArray(values)
+        self.assertEqual(mask.tolist(), [True, True, False])
+        self.assertEqual(indices.tolist(), [2])
+
+    def testFusedCombinesActiveRestrictions(self):
+        fused = compileRestrictions([MinInclusiveR(0), MinInclusiveR(2), MaxExclusiveR(10)])
+        mask, indices = fused.validateArray([0, 2, 9, 10])
+        self.assertEqual(mask.tolist(), [False, True, True, False])
+        self.assertEqual(indices.tolist(), [0, 3])
+
+    def testDuplicatedRestrictionsStayActive(self):
+        # equal restrictions are interned, so both entries are the same object
+        self.assertIs(MinInclusiveR(5), MinInclusiveR(5))
+        fused = compileRestrictions([MinInclusiveR(5), MinInclusiveR(5), MaxInclusiveR(20)])
+        mask, indices = fused.validateArray([0, 10, 30])
+        self.assertEqual(mask.tolist(), [False, True, False])
+        self.assertEqual(list(fused.redundant), [MinInclusiveR(5)])
+
+    def testLengthRedundantAsOneBoundOnly(self):
+        fused = compileRestrictions([MaxLengthR(3), LengthR(3)])
+        mask, _ = fused.validateArray(['ab', 'abc', 'abcd'])
+        self.assertEqual(mask.tolist(), [False, True, False])
+
+if __name__ == '__main__':
+    unittest.main()